@@ -13,7 +13,8 @@
 #   "wakeonlan",
 #   "waitress",
 #   "llama-cpp-python",
-#   "huggingface-hub"
+#   "huggingface-hub",
+#   "orjson"
 # ]
 # ///
 """
@@ -39,6 +40,7 @@ USER source = The user explicitly performed an action
 
 # Standard library imports
 import os
+import pickle
 import re
 import json
 import base64
@@ -50,48 +52,57 @@ import shutil
 import csv
 import time
 import logging
+import logging.handlers
 import atexit
+import signal
 import sys
 import threading
 import queue
+import selectors
 import hashlib
+import itertools
+import types
+import zlib
+import importlib.util
+import multiprocessing
 import tempfile
 import socket
 import webbrowser
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Tuple, List, Any, TypedDict
+from typing import Dict, Optional, Tuple, List, Any, TypedDict, Callable, Mapping, Iterator
 from io import BytesIO
-from contextlib import contextmanager
-from dataclasses import dataclass
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 # Third-party imports
 from flask import Flask, render_template_string, request, jsonify
+import orjson
 from PIL import Image
 import pillow_heif
-from timezonefinder import TimezoneFinder
 
-# Apple geocoding imports
+# Apple geocoding imports (MapKit/CoreLocation are loaded by _load_mapkit)
 import objc
-from CoreLocation import CLLocationManager
-from Foundation import NSRunLoop, NSDate, NSThread
+from Foundation import NSThread
+from CoreFoundation import (CFRunLoopGetMain, CFRunLoopRunInMode, CFRunLoopStop,
+                            kCFRunLoopDefaultMode, kCFRunLoopRunFinished)
 from PyObjCTools import AppHelper
 
-# Pipeline integration imports
-import paramiko
-from wakeonlan import send_magic_packet
+# Heavy optional modules are imported where they are used so startup (and
+# every thumbnail worker process, which re-imports this module) stays fast:
+#   timezonefinder -> Gazetteer, paramiko/wakeonlan -> PhotoPipeline,
+#   llama_cpp/huggingface_hub -> FilenameParser.load_model
 
-# LLM parser imports
-try:
-    from llama_cpp import Llama
-    from huggingface_hub import hf_hub_download
-    _LLM_AVAILABLE = True
-except ImportError:
-    Llama = None
-    hf_hub_download = None
-    _LLM_AVAILABLE = False
+# LLM parser - only probe for the package here
+_LLM_AVAILABLE = (
+    importlib.util.find_spec("llama_cpp") is not None
+    and importlib.util.find_spec("huggingface_hub") is not None
+)
+if not _LLM_AVAILABLE:
     print("Warning: LLM parser not available - install llama-cpp-python")
 
 # Register HEIF format
@@ -135,10 +146,21 @@ WEB_PORT=5555
 
 # LLM Parser Settings (optional)
 LLM_PARSER_ENABLED=true
+# LLM_MODEL_REPO=hflb/Mistral-7B-Instruct-v0.3-Filename-Finetune
+# LLM_MODEL_FILE=mistral-7b-finetuned-q4_k_m.gguf
+# LLM_THREADS=0
 """
 
 # Load configuration from .env file
-_env_config = {}
+_env_config: Dict[str, str] = {}
+_REQUIRED_ENV_KEYS = frozenset({
+    'CAMERA_MAKE', 'CAMERA_MODEL', 'IMAGE_DESCRIPTION',
+    'DATE_KEYWORD', 'LOCATION_KEYWORD',
+    'UNKNOWN_YEAR', 'UNKNOWN_MONTH', 'UNKNOWN_DAY',
+    'THUMBNAIL_WORKERS', 'METADATA_WORKERS',
+    'METADATA_CACHE_SIZE', 'THUMBNAIL_CACHE_SIZE',
+    'EXIFTOOL_VERSION', 'WEB_PORT',
+})
 _env_path = Path(__file__).parent / '.env'
 
 if not _env_path.exists():
@@ -150,20 +172,25 @@ if not _env_path.exists():
     sys.exit(1)
 
 try:
-    with open(_env_path) as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' not in line:
-                    print(f"ERROR: Invalid line {line_num} in .env: {line}")
-                    sys.exit(1)
-                key, value = line.split('=', 1)
-                _env_config[key.strip()] = value.strip()
+    for line_num, line in enumerate(_env_path.read_text().splitlines(), 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            key, sep, value = line.partition('=')
+            if not sep:
+                print(f"ERROR: Invalid line {line_num} in .env: {line}")
+                sys.exit(1)
+            _env_config[key.strip()] = value.strip()
 except Exception as e:
     print(f"ERROR: Failed to read .env file: {e}")
     sys.exit(1)
 
 # Required configuration values - will error if missing
+_missing_env_keys = _REQUIRED_ENV_KEYS - _env_config.keys()
+if _missing_env_keys:
+    print(f"ERROR: Missing required configuration: {', '.join(sorted(_missing_env_keys))}")
+    print("Check your .env file has all required values from .env.example")
+    sys.exit(1)
+
 try:
     # Camera that digitized the photos
     CAMERA_MAKE = _env_config['CAMERA_MAKE']
@@ -195,14 +222,15 @@ try:
     # Cache sizes
     METADATA_CACHE_SIZE = int(_env_config['METADATA_CACHE_SIZE'])
     THUMBNAIL_CACHE_SIZE = int(_env_config['THUMBNAIL_CACHE_SIZE'])
+    THUMBNAIL_DISK_CACHE_MB = int(_env_config.get('THUMBNAIL_DISK_CACHE_MB', '2048'))
     
     # LLM Parser
     USE_LLM_PARSER = _env_config.get('LLM_PARSER_ENABLED', 'true').lower() == 'true'
+    # A smaller GGUF finetune trained on the same output schema can be swapped in
+    LLM_MODEL_REPO = _env_config.get('LLM_MODEL_REPO', 'hflb/Mistral-7B-Instruct-v0.3-Filename-Finetune')
+    LLM_MODEL_FILE = _env_config.get('LLM_MODEL_FILE', 'mistral-7b-finetuned-q4_k_m.gguf')
+    LLM_THREADS = int(_env_config.get('LLM_THREADS', '0')) or (os.cpu_count() or 8)
     
-except KeyError as e:
-    print(f"ERROR: Missing required configuration: {e}")
-    print("Check your .env file has all required values from .env.example")
-    sys.exit(1)
 except ValueError as e:
     print(f"ERROR: Invalid configuration value: {e}")
     sys.exit(1)
@@ -215,31 +243,29 @@ except ValueError as e:
 SCRIPT_DIR = Path(__file__).parent.resolve().absolute()
 BASE_DIR = SCRIPT_DIR.parent.resolve().absolute()  # Go up one level from code/
 DATA_DIR = (BASE_DIR / "data").resolve().absolute()
+THUMB_CACHE_DIR = DATA_DIR / "thumb_cache"
 TOOLS_DIR = (BASE_DIR / "tools").resolve().absolute()
 
 # Month mapping
 MONTH_MAP = {
-    m: f"{i:02d}" for i, m in enumerate(
-        "jan feb mar apr may jun jul aug sep oct nov dec".split(), 1
-    )
+    "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
+    "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12",
+    "january": "01", "february": "02", "march": "03", "april": "04",
+    "june": "06", "july": "07", "august": "08", "september": "09",
+    "october": "10", "november": "11", "december": "12"
 }
-MONTH_MAP.update({
-    "january": "01", "february": "02", "march": "03", "april": "04", 
-    "may": "05", "june": "06", "july": "07", "august": "08", 
-    "september": "09", "october": "10", "november": "11", "december": "12"
-})
 
 # US States
-US_STATES = {
+US_STATES: frozenset[str] = frozenset({
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", 
     "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", 
     "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK",
     "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", 
     "WI", "WY", "DC"
-}
+})
 
 # State capitals for GPS lookup
-STATE_CAPITALS = {
+STATE_CAPITALS: Dict[str, str] = {
     "AL": "Montgomery", "AK": "Juneau", "AZ": "Phoenix", "AR": "Little Rock",
     "CA": "Sacramento", "CO": "Denver", "CT": "Hartford", "DE": "Dover",
     "FL": "Tallahassee", "GA": "Atlanta", "HI": "Honolulu", "ID": "Boise",
@@ -278,8 +304,8 @@ STATE_ABBR_TO_NAME: Dict[str, str] = {
     if len(name) > 2
 }
 
-# Countries list for location routing
-COUNTRIES_LIST = [
+# Countries for location routing (frozenset for O(1) membership)
+COUNTRIES = frozenset([
     # A
     "afghanistan", "albania", "algeria", "andorra", "angola", "antigua and barbuda", 
     "argentina", "armenia", "australia", "austria", "azerbaijan",
@@ -349,7 +375,7 @@ COUNTRIES_LIST = [
     "yemen",
     # Z
     "zambia", "zimbabwe"
-]
+])
 
 # ============================================================================
 # PIPELINE CONFIGURATION
@@ -408,11 +434,22 @@ class ImportProcessError(PipelineError):
 # LOGGING CONFIGURATION
 # ============================================================================
 
-# Configure logging
+# Configure logging - worker threads only enqueue records; formatting and the
+# stderr write happen on the listener thread
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.DEBUG if '--debug' in sys.argv else logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -421,6 +458,10 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+def orjson_response(payload: Any):
+    """JSON response encoded straight to bytes by orjson (for location lists)"""
+    return app.response_class(orjson.dumps(payload), mimetype='application/json')
+
 # ============================================================================
 # GLOBAL STATE CLASS
 # ============================================================================
@@ -450,54 +491,12 @@ class AppState:
         self.pipeline_future: Optional[Future] = None
         self.pipeline_cancelled: bool = False
         self.pipeline_events: List[Dict[str, Any]] = []
-        self.db_queue: queue.Queue = queue.Queue()
         self.pipeline_config: Optional[dict] = None
         self.pipeline_ssh_connections: List[Any] = []
         self.pipeline_staging_dirs: List[Path] = []
         self.data_dir: Path = DATA_DIR
         self.filename_parser: Optional['FilenameParser'] = None
         self._initial_load_complete: bool = False
-        
-        # Start database worker thread
-        self._start_db_worker()
-    
-    def _start_db_worker(self):
-        """Start background thread for database operations"""
-        def worker():
-            while True:
-                try:
-                    item = self.db_queue.get(timeout=1)
-                    if item is None:  # Shutdown signal
-                        break
-                    
-                    # Unpack based on number of items (backward compatibility)
-                    if len(item) == 2:
-                        operation, future = item
-                    else:
-                        # Legacy format - ignore
-                        continue
-                        
-                    try:
-                        result = operation()  # Execute the lambda/function
-                        if future and not future.done():
-                            future.set_result(result)
-                    except Exception as e:
-                        if future and not future.done():
-                            future.set_exception(e)
-                        logger.error(f"DB operation failed: {e}")
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    logger.error(f"DB worker error: {e}")
-
-        self.db_worker_thread = threading.Thread(target=worker, daemon=True)
-        self.db_worker_thread.start()
-    
-    def shutdown_db_worker(self):
-        """Cleanly shutdown the database worker thread"""
-        if hasattr(self, 'db_queue') and hasattr(self, 'db_worker_thread'):
-            self.db_queue.put(None)  # Send shutdown signal
-            self.db_worker_thread.join(timeout=5.0)
     
     def get_search_term(self) -> str:
         """Get the current search term"""
@@ -542,88 +541,318 @@ def require_pipeline_config() -> Dict[str, Any]:
     return pipeline_config
 
 # Register cleanup on exit
-import atexit
-atexit.register(lambda: STATE.shutdown_db_worker())
-
-def cleanup_database_connections():
+def _shutdown():
+    """Release session resources in a fixed order on interpreter exit"""
+    # Cancel pending pipeline work first so it can't keep the interpreter alive
+    try:
+        STATE.pipeline_executor.shutdown(wait=False, cancel_futures=True)
+    except Exception as e:
+        logger.debug(f"Pipeline executor shutdown failed: {e}")
+    save_apple_cache()
+    save_geocode_cache()
     if STATE.database and hasattr(STATE.database, '_pool'):
         STATE.database._pool.close_idle_connections()
 
-atexit.register(cleanup_database_connections)
-# Ensure pipeline threads don-t keep the interpreter alive
-atexit.register(lambda: STATE.pipeline_executor.shutdown(wait=False, cancel_futures=True))
+atexit.register(_shutdown)
 
 
 # ============================================================================
 # GLOBAL VARIABLES
 # ============================================================================
 
-# Global rate limiting for Apple APIs
-_last_api_call = 0.0
+class StripedCache:
+    """Bounded dict split into lock stripes so workers don't share one mutex
+
+    Reads are lock-free (a dict lookup is atomic under the GIL); writes lock
+    only the key's stripe, which evicts its oldest entries (FIFO) when full.
+    """
+    
+    def __init__(self, max_size: int, stripes: int = 16):
+        self._mask = stripes - 1
+        self._per_stripe = max(1, max_size // stripes)
+        self._stripes = [(OrderedDict(), threading.Lock()) for _ in range(stripes)]
+    
+    def get(self, key):
+        return self._stripes[hash(key) & self._mask][0].get(key)
+    
+    def put(self, key, value):
+        data, lock = self._stripes[hash(key) & self._mask]
+        with lock:
+            data[key] = value
+            while len(data) > self._per_stripe:
+                data.popitem(last=False)
+
+class ClockCache:
+    """Bounded mapping with hot/warm/cold CLOCK segments (about 1:8:1 of cap)
+
+    A get() hit only sets the entry's accessed bit - no reordering; replacing
+    a value does not count as an access. New keys enter
+    hot; keys leaving hot or cold go to warm if they were touched since their
+    last pass and towards eviction otherwise, so a one-off scroll burst ages
+    out of cold without flushing the warm working set. Entries for which
+    pinned(value) is true are never evicted. Writers must serialise; reads
+    are lock-free.
+    """
+    
+    def __init__(self, max_size: int, pinned: Callable[[Any], bool] = lambda value: False):
+        self._hot_cap = max(1, max_size // 10)
+        self._warm_cap = max(1, max_size * 8 // 10)
+        self._cold_cap = max(1, max_size - self._hot_cap - self._warm_cap)
+        self._pinned = pinned
+        self._data: Dict[Any, list] = {}  # key -> [value, accessed]
+        self._hot: deque = deque()
+        self._warm: deque = deque()
+        self._cold: deque = deque()
+    
+    def get(self, key, default=None):
+        slot = self._data.get(key)
+        if slot is None:
+            return default
+        slot[1] = True
+        return slot[0]
+    
+    def __contains__(self, key) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __setitem__(self, key, value):
+        slot = self._data.get(key)
+        if slot is not None:
+            # Status updates (pending -> processing -> ready) aren't hits;
+            # only get() marks an access
+            slot[0] = value
+            return
+        self._data[key] = [value, False]
+        self._hot.append(key)
+        self._cycle()
+    
+    def _cycle(self):
+        data = self._data
+        while len(self._hot) > self._hot_cap:
+            key = self._hot.popleft()
+            slot = data[key]
+            if slot[1]:
+                slot[1] = False
+                self._warm.append(key)
+            else:
+                self._cold.append(key)
+        # Each segment gets at most one lap per call, so a fully pinned or
+        # fully accessed segment can't spin
+        for _ in range(len(self._warm)):
+            if len(self._warm) <= self._warm_cap:
+                break
+            key = self._warm.popleft()
+            slot = data[key]
+            if slot[1]:
+                slot[1] = False
+                self._warm.append(key)
+            else:
+                self._cold.append(key)
+        for _ in range(len(self._cold)):
+            if len(self._cold) <= self._cold_cap:
+                break
+            key = self._cold.popleft()
+            slot = data[key]
+            if slot[1]:
+                slot[1] = False
+                self._warm.append(key)
+            elif self._pinned(slot[0]):
+                self._cold.append(key)
+            else:
+                del data[key]
 
 # Metadata cache - keyed by filepath + modification time
-METADATA_CACHE = {}
+METADATA_CACHE = StripedCache(METADATA_CACHE_SIZE)
 
-# Thumbnail cache
-THUMBNAIL_CACHE = {}
+# Thumbnail cache - keyed by filepath + modification time + size
+THUMBNAIL_CACHE = StripedCache(THUMBNAIL_CACHE_SIZE)
 
 # Thread safety locks for caches
-METADATA_CACHE_LOCK = threading.RLock()
-THUMBNAIL_CACHE_LOCK = threading.RLock()
 LOCATION_CACHE_LOCK = threading.RLock()
 
+# Most-used locations, shared by every LocationManager; guarded by
+# LOCATION_CACHE_LOCK and refreshed once 'expiry' (time.monotonic) passes
+LOCATION_FREQUENT_CACHE: Dict[str, Any] = {'value': [], 'expiry': 0.0}
+LOCATION_FREQUENT_TTL = 60  # seconds
+
+class WorkStealingQueue:
+    """Hot FIFO plus one cold deque per worker, with a queue.Queue-style put/get
+
+    Priority 0 (the photo on screen) goes to the shared hot deque; prefetch
+    work is dealt round-robin onto per-worker deques. A worker takes hot work
+    first, then the oldest item on its own deque, and only when both are dry
+    steals the newest (least urgent) item from another worker's deque - owner
+    and thief work opposite ends, so there is no shared heap lock. A counting
+    semaphore tracks queued items so a waiting worker wakes as soon as any
+    deque gets work.
+    """
+    
+    def __init__(self):
+        self._hot: "deque[tuple]" = deque()
+        self._orphans: "deque[tuple]" = deque()  # cold work queued before any worker registered
+        self._locals: "List[deque[tuple]]" = []
+        self._next_local = itertools.count()
+        self._owned = threading.local()
+        self._register_lock = threading.Lock()
+        self._items = threading.Semaphore(0)
+    
+    def _own_deque(self) -> "deque[tuple]":
+        own = getattr(self._owned, 'deque', None)
+        if own is None:
+            with self._register_lock:
+                own = deque()
+                self._locals = self._locals + [own]  # copy-on-write for lock-free readers
+            self._owned.deque = own
+        return own
+    
+    def put(self, item: tuple):
+        if item[0] <= 0:
+            self._hot.append(item)
+        else:
+            locals_ = self._locals
+            if locals_:
+                locals_[next(self._next_local) % len(locals_)].append(item)
+            else:
+                self._orphans.append(item)
+        self._items.release()
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> tuple:
+        own = self._own_deque()
+        if not self._items.acquire(blocking=block, timeout=timeout):
+            raise queue.Empty
+        # A permit guarantees an item is queued somewhere; deque append/pop
+        # are atomic, so a concurrent taker can only make us look again
+        while True:
+            try:
+                return self._hot.popleft()
+            except IndexError:
+                pass
+            try:
+                return own.popleft()
+            except IndexError:
+                pass
+            try:
+                return self._orphans.popleft()
+            except IndexError:
+                pass
+            for victim in self._locals:
+                if victim is not own:
+                    try:
+                        return victim.pop()
+                    except IndexError:
+                        pass
+    
+    def qsize(self) -> int:
+        return len(self._hot) + len(self._orphans) + sum(len(d) for d in self._locals)
+
 # LLM parsing queue infrastructure
-LLM_PARSE_QUEUE = queue.PriorityQueue()
-LLM_PARSE_RESULTS = {}  # filepath -> {'status': 'pending'|'ready', 'result': data}
+LLM_PARSE_QUEUE = WorkStealingQueue()
 MAX_LLM_PARSE_RESULTS = 5000 # Prevent unbounded growth
+# filepath -> {'status': 'pending'|'processing'|'ready'|'error', 'result': data};
+# in-flight entries are never evicted
+LLM_PARSE_RESULTS = ClockCache(MAX_LLM_PARSE_RESULTS,
+                               pinned=lambda entry: entry['status'] in ('pending', 'processing'))
+LLM_PARSE_RESULTS_LOCK = threading.Lock()  # serialises writers; reads are lock-free
+LLM_PARSE_FUTURES: Dict[str, Future] = {}  # filepath -> Future resolved when its parse finishes
+LLM_PARSE_FUTURES_LOCK = threading.Lock()
+LLM_SUGGESTION_WAIT = 0.45  # Seconds /api/suggestions waits before answering 'pending'
 LLM_WORKER_THREAD = None # keep references to every LLM worker
 LLM_WORKER_THREADS = []
 LLM_WORKER_STOP = threading.Event()
+LLM_WORKER_SENTINEL = (-1, None, None)  # one per worker, queued by stop_llm_worker
 MODEL_WARMED     = threading.Event()  # set after first priority-0 parse
-WARM_CONDITION   = threading.Condition()  # Proper synchronization
+# Shared, read-only status entries - results are replaced, never mutated in place
+_PENDING = types.MappingProxyType({'status': 'pending', 'result': None})
+_PROCESSING = types.MappingProxyType({'status': 'processing', 'result': None})
+_PARSE_ERROR = types.MappingProxyType({'status': 'error', 'result': None})
+_READY_EMPTY = types.MappingProxyType({
+    'status': 'ready',
+    'result': types.MappingProxyType({'date': None, 'location': None})
+})
+DEFERRED_LOWPRI: "deque[Tuple[int, str, str]]" = deque()  # low-priority jobs parked until warm
+DEFERRED_LOWPRI_LOCK = threading.Lock()
 
-# Try to import MKLocalSearch
-try:
-    from MapKit import MKLocalSearch, MKLocalSearchRequest
-    _mk_local_search_available = True
-except ImportError:
-    _mk_local_search_available = False
-    MKLocalSearch = None
-    MKLocalSearchRequest = None
-
-# Initialize location services (required for MKLocalSearch)
+def _defer_until_warm(job: Tuple[int, str, str]) -> bool:
+    """Park a low-priority job while the model is cold; False if already warm"""
+    with DEFERRED_LOWPRI_LOCK:
+        if MODEL_WARMED.is_set():
+            return False
+        DEFERRED_LOWPRI.append(job)
+        return True
+
+def _mark_model_warmed():
+    """Open the warm-up gate and hand parked jobs back to the queue"""
+    with DEFERRED_LOWPRI_LOCK:
+        MODEL_WARMED.set()
+        while DEFERRED_LOWPRI:
+            LLM_PARSE_QUEUE.put(DEFERRED_LOWPRI.popleft())
+
+def _get_llm_result(filepath: str) -> Optional[dict]:
+    """LLM_PARSE_RESULTS entry for filepath, marking it recently used"""
+    return LLM_PARSE_RESULTS.get(filepath)
+
+def _set_llm_result(filepath: str, entry: dict, only_if_absent: bool = False) -> bool:
+    """Store entry for filepath, evicting cold results past the cap.
+
+    Returns False (and stores nothing) if only_if_absent and filepath is known.
+    """
+    with LLM_PARSE_RESULTS_LOCK:
+        if only_if_absent and filepath in LLM_PARSE_RESULTS:
+            return False
+        LLM_PARSE_RESULTS[filepath] = entry
+        return True
+
+# MKLocalSearch - imported on first use by _load_mapkit()
+MKLocalSearch = None
+MKLocalSearchRequest = None
+_mk_local_search_available = importlib.util.find_spec("MapKit") is not None
 _location_manager = None
-try:
-    _location_manager = CLLocationManager.alloc().init()
-    logger.info("Location services initialized for MKLocalSearch")
-except Exception as e:
-    logger.warning(f"Could not initialize location services: {e}")
+_MAPKIT_LOCK = threading.Lock()
+
+def _load_mapkit() -> bool:
+    """Import MapKit and start location services, once. Returns availability."""
+    global MKLocalSearch, MKLocalSearchRequest, _mk_local_search_available, _location_manager
+    with _MAPKIT_LOCK:
+        if MKLocalSearch is not None or not _mk_local_search_available:
+            return _mk_local_search_available
+        try:
+            from MapKit import MKLocalSearch as _MKLocalSearch, MKLocalSearchRequest as _MKLocalSearchRequest
+        except ImportError:
+            _mk_local_search_available = False
+            return False
+        MKLocalSearch, MKLocalSearchRequest = _MKLocalSearch, _MKLocalSearchRequest
+        
+        # Initialize location services (required for MKLocalSearch)
+        try:
+            from CoreLocation import CLLocationManager
+            _location_manager = CLLocationManager.alloc().init()
+            logger.info("Location services initialized for MKLocalSearch")
+        except Exception as e:
+            logger.warning(f"Could not initialize location services: {e}")
+        return True
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Trailing "_<digits>" (or a bare number) before an optional extension
+_SEQ_RE = re.compile(r'(?:^|_)(\d+)(?:\.[^.]+)?$')
+
 def extract_sequence_number(filename: str) -> Optional[int]:
     """Extracts the trailing number from a filename for sorting."""
-    # Remove common extensions
-    base = filename.replace('.heic', '').replace('.HEIC', '')
-    parts = base.split('_')
-    if parts:
-        try:
-            # The last part is assumed to be the sequence number
-            return int(parts[-1])
-        except (ValueError, IndexError):
-            # No valid number found
-            return None
-    return None
+    match = _SEQ_RE.search(filename)
+    return int(match.group(1)) if match else None
 
 def calculate_file_hash(filepath: Path) -> str:
     """Calculate SHA256 hash of file"""
-    hash_sha256 = hashlib.sha256()
+    # SHA256 is kept because photos.file_hash drives rename detection on
+    # existing databases. file_digest loops in C and releases the GIL.
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
-    return hash_sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+_DMS_RE = re.compile(r'(\d+)\s*deg\s*(\d+)\'\s*([\d.]+)"?\s*([NSEW])?')
 
 def parse_gps_coordinate(coord_str):
     """Parse GPS coordinate from various ExifTool formats"""
@@ -633,26 +862,24 @@ def parse_gps_coordinate(coord_str):
     try:
         return float(coord_str)
     except (ValueError, TypeError):
-        try:
-            coord_str = str(coord_str)
-            match = re.match(r'(\d+)\s*deg\s*(\d+)\'\s*([\d.]+)"?\s*([NSEW])?', coord_str)
-            if match:
-                deg, min, sec, direction = match.groups()
-                decimal = float(deg) + float(min)/60 + float(sec)/3600
-                if direction in ['S', 'W']:
-                    decimal = -decimal
-                return decimal
-        except:
-            pass
+        pass
     
-    return None
+    match = _DMS_RE.match(str(coord_str))
+    if not match:
+        return None
+    
+    deg, min, sec, direction = match.groups()
+    try:
+        decimal = float(deg) + float(min)/60 + float(sec)/3600
+    except ValueError:
+        return None
+    sign = -1 if direction in ('S', 'W') else 1
+    return sign * decimal
 
 def save_apple_cache():
     """Ensure any in-memory Apple geocoding results are persisted"""
-    pass
-
-# Register cleanup
-atexit.register(save_apple_cache)
+    if STATE.gazetteer is not None:
+        STATE.gazetteer.close()
 
 # ============================================================================
 # DATA MODELS - ENUMS
@@ -675,7 +902,7 @@ class Category(Enum):
 # DATA MODELS - DATACLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DateInfo:
     """Date with source tracking"""
     year: str = ""
@@ -690,24 +917,16 @@ class DateInfo:
         """All fields present and from user"""
         return bool(
             self.year and self.month and self.day and
-            all(s == DataSource.USER for s in
-                [self.year_source, self.month_source, self.day_source])
+            self.year_source is self.month_source is self.day_source is DataSource.USER
         )
     
     def needs_tag(self) -> bool:
-            """Needs MissingDate tag based on smart logic"""
-            if not self.year:
-                return True
-            if self.year == "1901":
-                return True
-            # If we have year and month from ANY source, no tag needed
-            # The source doesn't matter - what matters is having the data
-            if self.year and self.month:
-                return False
-            # Otherwise needs tag
-            return True
+        """Needs MissingDate tag based on smart logic"""
+        # Year and month from ANY source is enough - the source doesn't
+        # matter, what matters is having the data (1901 is the unknown year)
+        return not (self.year and self.month) or self.year == "1901"
 
-@dataclass
+@dataclass(slots=True)
 class LocationInfo:
     """Location with source tracking"""
     city: str = ""
@@ -738,16 +957,13 @@ class LocationInfo:
         )
     
     def needs_tag(self) -> bool:
-        # If we have GPS coordinates from ANY source, no tag needed
-        if self.gps_lat is not None:
-            return False
-        # If we have both city and state from any source, no tag needed
-        if self.city and self.state:
-            return False
-        # Otherwise needs tag
-        return True
+        # GPS coordinates, or both city and state, from ANY source mean no tag
+        return self.gps_lat is None and not (self.city and self.state)
+
+# Country values that mean "domestic" and are left out of display strings
+_DOMESTIC_COUNTRIES = frozenset({"United States", "USA", ""})
 
-@dataclass
+@dataclass(slots=True)
 class SmartLocation:
     """Enhanced location object with display information"""
     city: str
@@ -768,9 +984,35 @@ class SmartLocation:
     neighborhood: str = ""
     search_label: str = ""
     
+    # Display strings, rendered once - locations are never mutated after construction
+    _display_primary: str = field(default="", init=False, repr=False, compare=False)
+    _display_secondary: str = field(default="", init=False, repr=False, compare=False)
+    _display_full: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Canonical 2-letter codes so US_STATES/STATE_CAPITALS lookups match
+        if self.state and len(self.state.strip()) == 2:
+            self.state = self.state.strip().upper()
+        self._display_primary = self._render_primary()
+        self._display_secondary = self._render_secondary()
+        self._display_full = self._render_full()
+    
     @property
     def display_primary(self) -> str:
         """Primary display text for UI"""
+        return self._display_primary
+    
+    @property
+    def display_secondary(self) -> str:
+        """Secondary display - shows what will be saved"""
+        return self._display_secondary
+    
+    @property
+    def display_full(self) -> str:
+        """Full display text with all details"""
+        return self._display_full
+    
+    def _render_primary(self) -> str:
         if self.category == Category.STATE and self.search_label:
             return self.search_label
         if self.landmark_name:
@@ -783,7 +1025,7 @@ class SmartLocation:
                 parts.append(self.city)
             if self.state:
                 parts.append(self.state)
-            elif self.country and self.country not in ["United States", "USA", ""]:
+            elif self.country and self.country not in _DOMESTIC_COUNTRIES:
                 # For international locations without states, show country
                 parts.append(self.country)
             
@@ -794,9 +1036,7 @@ class SmartLocation:
             else:
                 return "Unknown Location"
 
-    @property
-    def display_secondary(self) -> str:
-        """Secondary display - shows what will be saved"""
+    def _render_secondary(self) -> str:
         location_parts = []
 
         if self.category == Category.STATE and self.search_label:
@@ -823,12 +1063,12 @@ class SmartLocation:
             if self.state:
                 location_parts.append(self.state)
             # Always show country for international locations
-            if self.country and self.country not in ["United States", "USA", ""]:
+            if self.country and self.country not in _DOMESTIC_COUNTRIES:
                 location_parts.append(self.country)
         elif self.state:
             # State without city (US assumed if no country)
             location_parts.append(self.state)
-            if self.country and self.country not in ["United States", "USA", ""]:
+            if self.country and self.country not in _DOMESTIC_COUNTRIES:
                 location_parts.append(self.country)
         elif self.country:
             # Country only
@@ -836,21 +1076,7 @@ class SmartLocation:
         
         return ", ".join(location_parts) if location_parts else "Unknown Location"
     
-    @property
-    def display_full(self) -> str:
-        """Full display text with all details"""
-        parts = []
-        
-        # Add primary identifier (landmark/street)
-        if self.landmark_name:
-            parts.append(self.landmark_name)
-            if self.city or self.state or self.country:
-                parts.append("-")
-        elif self.street:
-            parts.append(self.street)
-            if self.city or self.state or self.country:
-                parts.append(",")
-        
+    def _render_full(self) -> str:
         # Add location hierarchy
         location_parts = []
         if self.neighborhood and self.neighborhood != self.street:
@@ -859,20 +1085,19 @@ class SmartLocation:
             location_parts.append(self.city)
         if self.state:
             location_parts.append(self.state)
-        if self.country and self.country not in ["United States", "USA", ""]:
+        if self.country and self.country not in _DOMESTIC_COUNTRIES:
             location_parts.append(self.country)
+        location = ", ".join(location_parts)
         
-        # Join location parts
-        if location_parts:
-            parts.append(", ".join(location_parts))
-        
-        # Clean up formatting
-        result = " ".join(parts)
-        result = result.replace(" - ,", " - ")
-        result = result.replace(" , ", ", ")
-        result = result.replace("  ", " ")
+        # Prefix the primary identifier (landmark/street)
+        if self.landmark_name:
+            result = f"{self.landmark_name} - {location}" if location else self.landmark_name
+        elif self.street:
+            result = f"{self.street}, {location}" if location else self.street
+        else:
+            result = location
         
-        return result.strip() if result.strip() else "Unknown Location"
+        return result.strip() or "Unknown Location"
     
     def to_dict(self) -> dict:
         return {
@@ -888,7 +1113,7 @@ class SmartLocation:
             'display_full': self.display_full,
             'category': self.category.name if self.category else None,
             'use_count': self.use_count,
-            'last_used': self.last_used.isoformat() if self.last_used else None,
+            'last_used': self.last_used,  # orjson writes datetimes as ISO 8601
             'country': self.country,
             'country_code': self.country_code,
             'postal_code': self.postal_code,
@@ -919,6 +1144,47 @@ class LocationSuggestion(TypedDict):
 # FILENAME PARSER CLASS (LLM-BASED)  
 # ============================================================================
 
+# Near-duplicate filenames (IMG_Paris_0001 / IMG_Paris_0002, "name (2)") share
+# one parse: trailing 3-4 digit sequence numbers that aren't years and copy
+# counters are dropped, separators and case are normalised
+_NEAR_DUP_SEQ_RE = re.compile(r'(?:[\s_-]+(?!(?:19|20)\d\d$)\d{3,4}|\s*\(\d+\))$')
+_NEAR_DUP_SPLIT_RE = re.compile(r'[\s_.-]+')
+
+# GBNF grammar for the parser's JSON output - the model can only emit the
+# prompt's schema, so every completion decodes and stops as soon as it closes
+_PARSE_GRAMMAR = r'''
+root ::= "{" ws "\"location_confidence\":" ws confidence "," ws "\"primary_search\":" ws nstring "," ws "\"alternate_search\":" ws nstring "," ws "\"location_type\":" ws loctype "," ws "\"location_context\":" ws string "," ws "\"extracted\":" ws extracted "," ws "\"search_strategy\":" ws strategy ws "}"
+extracted ::= "{" ws "\"subject\":" ws nstring "," ws "\"where_taken\":" ws nstring "," ws "\"landmark_name\":" ws nstring "," ws "\"city\":" ws nstring "," ws "\"state\":" ws nstring "," ws "\"country\":" ws nstring "," ws "\"date_parts\":" ws dateparts ws "}"
+dateparts ::= "{" ws "\"year\":" ws ndigits "," ws "\"month\":" ws ndigits "," ws "\"day\":" ws ndigits ws "}"
+confidence ::= "\"high\"" | "\"medium\"" | "\"low\"" | "\"none\""
+loctype ::= "\"venue\"" | "\"landmark\"" | "\"city\"" | "\"address\"" | "\"unknown\""
+strategy ::= "\"venue_first\"" | "\"city_first\"" | "\"landmark_only\"" | "\"need_more_info\""
+ndigits ::= "\"" [0-9]{1,4} "\"" | "null"
+nstring ::= string | "null"
+string ::= "\"" ([^"\\\x7F\x00-\x1F] | "\\" ["\\/bfnrt])* "\""
+ws ::= [ \t\n]{0,16}
+'''
+
+# Default camera/phone names (IMG_1234.jpg, DSC05678.JPG, PXL_20230704_133015.jpg)
+# carry no place and at most a YYYYMMDD stamp, so they skip the model
+_CAMERA_FILENAME_RE = re.compile(
+    r'^(?:IMG|DSC|DSCN|DSCF|PXL|MVIMG|VID|P)[-_]?'
+    r'(?:((?:19|20)\d{2})(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])(?=\D|$))?'
+    r'[\d_T-]*(?:~\d+)?\.(?:jpe?g|heic|png|mp4|mov)$',
+    re.IGNORECASE
+)
+
+# Single-digit month/day -> zero-padded form
+_ZPAD = {str(i): f"{i:02d}" for i in range(10)}
+
+# Completion cap and the context room reserved for the filename itself
+_PARSE_MAX_TOKENS = 256
+_PARSE_FILENAME_TOKENS = 128
+
+def _near_duplicate_key(filename: str) -> str:
+    stem = _NEAR_DUP_SEQ_RE.sub("", Path(filename).stem.lower())
+    return " ".join(part for part in _NEAR_DUP_SPLIT_RE.split(stem) if part)
+
 class FilenameParser:
     """LLM-based filename parser for extracting metadata from photo filenames.
     
@@ -930,9 +1196,26 @@ class FilenameParser:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(exist_ok=True)
         self.llm: Optional[Any] = None
-        self._parse_cache = {}  # In-memory cache: filename -> parsed result
-        self._max_cache_size = 1000  # Maximum cache entries
+        self._parse_cache: "OrderedDict[str, dict]" = OrderedDict()  # LRU: filename -> parsed result
+        self._max_cache_size = 1000  # Maximum in-memory entries
+        self._near_dup_cache: "OrderedDict[str, dict]" = OrderedDict()  # FIFO: normalised name -> result
+        self._max_near_dup_size = 5000
+        self._cache_lock = threading.Lock()
+        # Results survive restarts so re-opening a folder doesn't re-run the
+        # model; values are zlib-compressed JSON
+        self._cache_db = sqlite3.connect(
+            str(self.cache_dir / "parse_cache.db"), check_same_thread=False, isolation_level=None
+        )
+        self._cache_db.execute("PRAGMA journal_mode=WAL")
+        self._cache_db.execute("PRAGMA synchronous=NORMAL")
+        self._cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (filename TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._unsaved: List[Tuple[str, bytes]] = []  # Parses not yet written to disk
         self._llm_lock = threading.Lock()  # Thread safety for LLM calls
+        self._prefix_tokens: List[int] = []  # Static prompt prefix, already in the KV cache
+        self._grammar: Optional[Any] = None  # LlamaGrammar for the output schema
+        self._model_path_future: Optional[Future] = None  # Set by prefetch_model
         
         # Complex prompt focused on WHERE photos were taken
         self.prompt_template = """
@@ -1019,10 +1302,48 @@ Filename: Family_Reunion_Grandmas_House_July_4th_2023.jpg
 
 Filename: {filename}
 """
-
+        # Everything before the filename is identical on every call; it is
+        # evaluated once and kept in the KV cache so each parse only prefills
+        # the filename suffix. Both halves are pre-encoded so a parse only
+        # encodes the filename itself
+        prefix, suffix = self.prompt_template.split("{filename}")
+        self._prompt_prefix: bytes = prefix.rstrip(" ").encode("utf-8")
+        self._prompt_suffix: bytes = suffix.encode("utf-8")
+
+    def _download_model(self) -> str:
+        """Fetch the GGUF into the cache (a quick etag check once it's present)"""
+        from huggingface_hub import hf_hub_download
+        
+        print("Downloading LLM model (first time only).")
+        return hf_hub_download(
+            repo_id=LLM_MODEL_REPO,
+            filename=LLM_MODEL_FILE,
+            cache_dir=self.cache_dir,
+            etag_timeout=10
+        )
+    
+    def prefetch_model(self):
+        """Start the model download in the background; load_model waits for it"""
+        if self._model_path_future is not None:
+            return
+        future: Future = Future()
+        self._model_path_future = future
+        
+        def _download():
+            try:
+                future.set_result(self._download_model())
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=_download, name="ModelPrefetch", daemon=True).start()
+    
+    def is_loaded(self) -> bool:
+        """True once the model is resident and its prompt prefix evaluated"""
+        return self.llm is not None
+    
     def load_model(self):
         """Load the Mistral-7B Instruct v0.3 model (singleton pattern)."""
-        if not _LLM_AVAILABLE or hf_hub_download is None or Llama is None:
+        if not _LLM_AVAILABLE:
             raise RuntimeError("LLM parser is not available")
 
         if self.llm is not None:
@@ -1033,21 +1354,45 @@ Filename: {filename}
             if self.llm is not None:
                 return self.llm
             try:
-                print("Downloading LLM model (first time only).")
-                model_path = hf_hub_download(
-                    repo_id="hflb/Mistral-7B-Instruct-v0.3-Filename-Finetune",
-                    filename="mistral-7b-finetuned-q4_k_m.gguf",
-                    cache_dir=self.cache_dir
-                )
+                from llama_cpp import Llama, LlamaGrammar, GGML_TYPE_Q8_0
+                from llama_cpp.llama_speculative import LlamaPromptLookupDecoding
+                
+                if self._model_path_future is not None:
+                    model_path = self._model_path_future.result()
+                else:
+                    model_path = self._download_model()
+
+                # Size the context to what a parse uses - the static prefix,
+                # a long filename and the capped completion - rather than a
+                # fixed 2048, so the KV cache holds no unused slots
+                vocab = Llama(model_path=str(model_path), vocab_only=True, verbose=False)
+                prompt_tokens = len(vocab.tokenize(self._prompt_prefix)) + _PARSE_FILENAME_TOKENS
+                del vocab
+                n_ctx = -(-prompt_tokens // 256) * 256 + _PARSE_MAX_TOKENS
 
                 print("Loading LLM model into memory.")
                 self.llm = Llama(
                     model_path=str(model_path),
-                    n_ctx=2048,
+                    n_ctx=n_ctx,
+                    n_batch=512,      # Prefill the whole prompt in one pass
                     n_gpu_layers=-1,  # Use GPU if available
+                    use_mlock=True,   # Keep weights resident between parses
+                    # 8-bit KV cache halves cache memory traffic per decoded
+                    # token; a quantized V cache requires flash attention
+                    flash_attn=True,
+                    type_k=GGML_TYPE_Q8_0,
+                    type_v=GGML_TYPE_Q8_0,
                     verbose=False,
-                    n_threads=8
+                    n_threads=LLM_THREADS,
+                    n_threads_batch=LLM_THREADS,
+                    # Draft tokens by n-gram lookup in the prompt and output so
+                    # far - the few-shot examples already contain every JSON
+                    # key, so most structural tokens verify in one pass
+                    draft_model=LlamaPromptLookupDecoding(max_ngram_size=3, num_pred_tokens=8)
                 )
+                self._grammar = LlamaGrammar.from_string(_PARSE_GRAMMAR, verbose=False)
+                self._prefix_tokens = self.llm.tokenize(self._prompt_prefix)
+                self.llm.eval(self._prefix_tokens)
                 print("LLM model loaded successfully")
             except Exception as e:
                 logger.error(f"Failed to load LLM model: {e}")
@@ -1063,49 +1408,45 @@ Filename: {filename}
         Returns:
             Dict with extracted metadata (see prompt for structure)
         """
+        # Camera default names never need the model
+        camera_result = self._camera_result(filename)
+        if camera_result is not None:
+            return camera_result
+        
         # Check cache first
-        if filename in self._parse_cache:
-            return self._parse_cache[filename]
+        cached = self._cache_get(filename)
+        if cached is not None:
+            return cached
         
         # Ensure model is loaded
         if self.llm is None:
             self.load_model()
         assert self.llm is not None
-        json_str = "<unavailable>"
         
+        # Generate response (thread-safe)
+        with self._llm_lock:
+            result = self._parse_locked(filename)
+        self._flush_cache()
+        return result
+    
+    def _parse_locked(self, filename: str, suffix_tokens: Optional[List[int]] = None) -> dict:
+        """Run the model for filename and cache the result.
+
+        Caller must hold self._llm_lock.
+        """
+        json_str = "<unavailable>"
         try:
-            # Format prompt
-            prompt = self.prompt_template.replace("{filename}", filename)
-            
-            # Generate response (thread-safe)
-            with self._llm_lock:
-                response = self.llm(
-                    prompt,
-                    max_tokens=400,
-                    temperature=0.1,
-                    stop=["Filename:"],
-                    echo=False
-                )
-            
-            # Extract JSON from response
-            json_str = response['choices'][0]['text'].strip()
+            json_str = self._complete(filename, suffix_tokens).strip()
             
             # Parse JSON
-            result = json.loads(json_str)
+            result = orjson.loads(json_str)
             
             # Validate structure
             if 'date' not in result or not isinstance(result['date'], dict):
                 result['date'] = {'year': None, 'month': None, 'day': None}
             
             # Cache result
-            self._parse_cache[filename] = result
-            
-            # Limit cache size to prevent memory issues
-            if len(self._parse_cache) > self._max_cache_size:
-                # Remove oldest entries (first 100)
-                for key in list(self._parse_cache.keys())[:100]:
-                    del self._parse_cache[key]
-            
+            self._cache_put(filename, result, persist=True)
             return result
             
         except json.JSONDecodeError as e:
@@ -1116,6 +1457,132 @@ Filename: {filename}
             logger.error(f"LLM parsing failed for {filename}: {e}")
             return self._empty_result()
     
+    def _camera_result(self, filename: str) -> Optional[dict]:
+        """Empty-location result for a camera default filename, else None"""
+        match = _CAMERA_FILENAME_RE.match(filename)
+        if match is None:
+            return None
+        result = self._empty_result()
+        year, month, day = match.groups()
+        result['extracted']['date_parts'] = {'year': year, 'month': month, 'day': day}
+        return result
+    
+    def _cache_get(self, filename: str) -> Optional[dict]:
+        """Look up a parse result in memory, on disk, then by near-duplicate name"""
+        with self._cache_lock:
+            result = self._parse_cache.get(filename)
+            if result is not None:
+                self._parse_cache.move_to_end(filename)
+                return result
+            row = self._cache_db.execute(
+                "SELECT data FROM cache WHERE filename = ?", (filename,)
+            ).fetchone()
+            if row is None:
+                near_key = _near_duplicate_key(filename)
+                result = self._near_dup_cache.get(near_key) if near_key else None
+                if result is None:
+                    return None
+                logger.debug(f"Reusing parse of a near-duplicate filename for {filename}")
+        if row is not None:
+            result = orjson.loads(zlib.decompress(row[0]))
+        self._cache_put(filename, result)
+        return result
+    
+    def _uncached(self, filenames: List[str]) -> List[str]:
+        """Filenames with no cached parse, checking the disk cache in one query"""
+        with self._cache_lock:
+            missing = [f for f in filenames if f not in self._parse_cache]
+            if not missing:
+                return []
+            rows = self._cache_db.execute(
+                "SELECT filename, data FROM cache "
+                "WHERE filename IN (SELECT value FROM json_each(?))",
+                (orjson.dumps(missing).decode(),)
+            ).fetchall()
+        for filename, data in rows:
+            self._cache_put(filename, orjson.loads(zlib.decompress(data)))
+        found = {filename for filename, _ in rows}
+        
+        uncached = []
+        for filename in missing:
+            if filename in found:
+                continue
+            near_key = _near_duplicate_key(filename)
+            with self._cache_lock:
+                result = self._near_dup_cache.get(near_key) if near_key else None
+            if result is not None:
+                self._cache_put(filename, result)
+            else:
+                uncached.append(filename)
+        return uncached
+    
+    def _cache_put(self, filename: str, result: dict, persist: bool = False):
+        """Insert into the LRU, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._parse_cache[filename] = result
+            self._parse_cache.move_to_end(filename)
+            if len(self._parse_cache) > self._max_cache_size:
+                self._parse_cache.popitem(last=False)
+            near_key = _near_duplicate_key(filename)
+            if near_key:
+                self._near_dup_cache[near_key] = result
+                if len(self._near_dup_cache) > self._max_near_dup_size:
+                    self._near_dup_cache.popitem(last=False)
+            if persist:
+                self._unsaved.append((filename, zlib.compress(orjson.dumps(result))))
+    
+    def _flush_cache(self):
+        """Write pending parse results to the on-disk cache in one transaction"""
+        with self._cache_lock:
+            unsaved, self._unsaved = self._unsaved, []
+            if not unsaved:
+                return
+            self._cache_db.execute("BEGIN")
+            try:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO cache (filename, data) VALUES (?, ?)", unsaved
+                )
+                self._cache_db.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._cache_db.execute("ROLLBACK")
+                logger.warning(f"Failed to persist {len(unsaved)} parse results: {e}")
+    
+    def _suffix_tokens(self, filename: str) -> List[int]:
+        """Tokenize the per-file part of the prompt (safe without the model lock)"""
+        assert self.llm is not None
+        return self.llm.tokenize(filename.encode("utf-8") + self._prompt_suffix, add_bos=False)
+    
+    def _complete(self, filename: str, suffix_tokens: Optional[List[int]] = None,
+                  max_tokens: int = _PARSE_MAX_TOKENS) -> str:
+        """Generate the model's answer for filename on top of the cached prefix.
+
+        Caller must hold self._llm_lock.
+        """
+        llm = self.llm
+        assert llm is not None
+        prefix_len = len(self._prefix_tokens)
+        
+        # Rewind to the end of the prefix; eval() drops the KV entries past
+        # n_tokens, so the prefix itself is never recomputed
+        if llm.n_tokens < prefix_len or list(llm.input_ids[:prefix_len]) != self._prefix_tokens:
+            llm.reset()
+            llm.eval(self._prefix_tokens)
+        llm.n_tokens = prefix_len
+        if suffix_tokens is None:
+            suffix_tokens = self._suffix_tokens(filename)
+        if len(suffix_tokens) > _PARSE_FILENAME_TOKENS:
+            raise ValueError(f"Filename too long to parse ({len(suffix_tokens)} tokens)")
+        
+        # The grammar only admits the schema's JSON object, then end-of-stream
+        eos = llm.token_eos()
+        output = b""
+        tokens = llm.generate(suffix_tokens, temp=0.1, reset=False, grammar=self._grammar)
+        for count, token in enumerate(tokens):
+            if token == eos or count >= max_tokens:
+                break
+            output += llm.detokenize([token])
+        return output.decode("utf-8", errors="ignore")
+    
     def _empty_result(self) -> dict:
         """Return empty result structure for complex format."""
         return {
@@ -1173,10 +1640,10 @@ Filename: {filename}
             return None
         
         # Ensure 2-digit format for month/day
-        if month and len(month) == 1:
-            month = f'0{month}'
-        if day and len(day) == 1:
-            day = f'0{day}'
+        if month:
+            month = _ZPAD.get(month, month)
+        if day:
+            day = _ZPAD.get(day, day)
         
         return {
             'year': year,
@@ -1256,26 +1723,237 @@ Filename: {filename}
             progress_callback: Optional callback(current, total) for progress updates
         """
         total = len(filenames)
+        pending = self._uncached([f for f in dict.fromkeys(filenames) if not _CAMERA_FILENAME_RE.match(f)])
+        done = total - len(pending)
+        if progress_callback and done:
+            progress_callback(done, total)
+        if not pending:
+            return
         
-        for i, filename in enumerate(filenames):
-            if filename not in self._parse_cache:
-                self.parse_filename(filename)
-            
-            if progress_callback:
-                progress_callback(i + 1, total)
+        if self.llm is None:
+            self.load_model()
+        
+        # Tokenize upcoming filenames on a helper thread while the model
+        # decodes the current one; the small queue keeps it two items ahead.
+        # The queue ends with None, or with the exception that stopped the
+        # producer; stop tells the producer the consumer has gone away.
+        prepared: "queue.Queue[Optional[Tuple[str, List[int]] | BaseException]]" = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    prepared.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def _prefetch():
+            try:
+                for filename in pending:
+                    if not _put((filename, self._suffix_tokens(filename))):
+                        return
+            except BaseException as e:
+                _put(e)
+                return
+            _put(None)
+        
+        threading.Thread(target=_prefetch, name="ParsePrefetch", daemon=True).start()
+        
+        # Hold the model for a chunk at a time so the shared prefix stays hot
+        # across consecutive filenames without starving interactive parses
+        chunk_size = 16
+        try:
+            item = prepared.get()
+            while item is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                with self._llm_lock:
+                    for _ in range(chunk_size):
+                        filename, suffix_tokens = item
+                        if self._cache_get(filename) is None:
+                            self._parse_locked(filename, suffix_tokens)
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total)
+                        item = prepared.get()
+                        if item is None or isinstance(item, BaseException):
+                            break
+                self._flush_cache()
+        finally:
+            stop.set()
 
 # ============================================================================
 # LLM WORKER THREAD
 # ============================================================================
 
+def _parse_future(filepath: str) -> Future:
+    """Future that resolves with the LLM_PARSE_RESULTS entry for filepath"""
+    with LLM_PARSE_FUTURES_LOCK:
+        return LLM_PARSE_FUTURES.setdefault(filepath, Future())
+
+def request_parse(filepath: str, priority: int) -> Optional[dict]:
+    """Queue a parse of filepath unless one is known; returns the result if ready.
+
+    Ready results come straight from LLM_PARSE_RESULTS with no queue hop.
+    Prefetch (priority > 0) is queued only for unseen paths; priority 0 is
+    always queued so it overtakes a pending prefetch of the same photo.
+    """
+    entry = _get_llm_result(filepath)
+    if entry is not None and entry['status'] == 'ready':
+        return entry['result']
+    if _set_llm_result(filepath, _PENDING, only_if_absent=True) or priority <= 0:
+        LLM_PARSE_QUEUE.put((priority, filepath, 'all'))
+    return None
+
+def _resolve_parse_future(filepath: str, entry: dict):
+    """Wake anyone waiting on filepath's parse"""
+    with LLM_PARSE_FUTURES_LOCK:
+        future = LLM_PARSE_FUTURES.pop(filepath, None)
+    if future is not None and not future.done():
+        future.set_result(entry)
+
+# Suggestion rows are written in small batches: one executemany per 16 rows
+# or 100 ms instead of a transaction per parsed photo
+_SUGGESTION_VALUE_COLUMNS = (
+    'suggested_date_year', 'suggested_date_month', 'suggested_date_day',
+    'suggested_date_complete', 'suggested_location_primary', 'suggested_location_alternate',
+    'suggested_location_city', 'suggested_location_state', 'suggested_location_confidence',
+    'suggested_location_type', 'suggested_location_reasoning', 'suggested_location_landmark',
+)
+_SUGGESTION_COLUMNS = _SUGGESTION_VALUE_COLUMNS + ('suggestion_parsed_at', 'suggestion_filename')
+# Suggestions live in photo_suggestions, off the hot photos rows
+_SUGGESTION_UPSERT_SQL = (
+    f"INSERT INTO photo_suggestions (filepath, {', '.join(_SUGGESTION_COLUMNS)}) "
+    f"VALUES (:filepath, {', '.join(f':{c}' for c in _SUGGESTION_COLUMNS)}) "
+    f"ON CONFLICT(filepath) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in _SUGGESTION_COLUMNS)}"
+)
+# Cache probe: the filename match is part of the WHERE, so a stale or missing
+# suggestion returns no row at all
+_SUGGESTION_SELECT_SQL = f"""
+    SELECT {', '.join(_SUGGESTION_VALUE_COLUMNS)},
+           (suggested_location_confidence > 70) AS loc_complete
+    FROM photo_suggestions WHERE filepath = ? AND suggestion_filename = ?
+"""
+
+def _suggestion_from_row(row: Tuple) -> dict:
+    """Rebuild a {'date', 'location'} suggestion from a _SUGGESTION_SELECT_SQL row"""
+    # Unpacked positionally (column order of _SUGGESTION_SELECT_SQL) - named
+    # sqlite3.Row lookups scan the column list on every access
+    (year, month, day, date_complete, primary, alternate, city, state,
+     confidence, location_type, reasoning, landmark, loc_complete) = row
+    return {
+        'date': {
+            'year': year,
+            'month': month,
+            'day': day,
+            'is_complete': bool(date_complete)
+        } if year else None,
+        'location': {
+            'primary_search': primary,
+            'alternate_search': alternate,
+            'city': city,
+            'state': state,
+            'confidence': confidence,
+            'location_type': location_type,
+            'reasoning': reasoning,
+            'landmark_name': landmark,
+            'is_complete': bool(loc_complete)
+        } if primary else None
+    }
+
+# Suggestion rows go to a single writer thread that owns its own connection,
+# so workers never contend for SQLite's write lock
+LLM_WRITE_QUEUE: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+LLM_WRITE_BATCH = 32
+LLM_WRITE_INTERVAL = 0.1  # Seconds
+LLM_WRITER_THREAD: Optional[threading.Thread] = None
+
+# Each LLM worker keeps one connection for its lifetime, outside the pool so
+# the pool's periodic close-all never pulls it out from under a parse
+_LLM_TLS = threading.local()
+
+def _llm_connection() -> Optional[sqlite3.Connection]:
+    conn = getattr(_LLM_TLS, 'conn', None)
+    if conn is None and STATE.database:
+        conn = open_sqlite_connection(STATE.database.db_path, read_only=True)
+        conn.row_factory = None  # only serves the positional suggestion probe
+        _LLM_TLS.conn = conn
+    return conn
+
+def _close_llm_connection():
+    conn = getattr(_LLM_TLS, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _LLM_TLS.conn = None
+
+def _queue_suggestion_write(row: Dict[str, Any]):
+    """Hand a suggestion row to the writer thread"""
+    LLM_WRITE_QUEUE.put(row)
+
+def llm_writer_thread():
+    """Write queued suggestion rows in batches, one IMMEDIATE transaction each.
+
+    A batch closes after LLM_WRITE_BATCH rows or LLM_WRITE_INTERVAL seconds
+    from its first row, whichever comes first. A None row stops the thread
+    once everything queued ahead of it is written.
+    """
+    conn: Optional[sqlite3.Connection] = None
+    stopping = False
+    while not stopping:
+        row = LLM_WRITE_QUEUE.get()
+        if row is None:
+            break
+        batch = [row]
+        deadline = time.monotonic() + LLM_WRITE_INTERVAL
+        while len(batch) < LLM_WRITE_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                row = LLM_WRITE_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if row is None:
+                stopping = True
+                break
+            batch.append(row)
+        
+        if conn is None:
+            if not STATE.database:
+                logger.error(f"Dropped {len(batch)} LLM suggestions: no database open")
+                continue
+            conn = open_sqlite_connection(STATE.database.db_path)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_SUGGESTION_UPSERT_SQL, batch)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Failed to save {len(batch)} LLM suggestions: {e}")
+    
+    if conn is not None:
+        conn.close()
+
+def _finish_parse(filepath: str, entry: Mapping[str, Any], priority: int):
+    """Publish a finished parse and, for the first priority-0 job, release the warm-up gate"""
+    _set_llm_result(filepath, entry)
+    _resolve_parse_future(filepath, entry)
+    if priority == 0 and not MODEL_WARMED.is_set():
+        _mark_model_warmed()
+
 def llm_worker_thread():
     """Background thread to process LLM parse requests"""
     logger.info("LLM worker thread started")
     
-    while not LLM_WORKER_STOP.is_set():
+    while True:
         try:
-            # Wait for work with timeout to check stop signal
-            priority, filepath, parse_type = LLM_PARSE_QUEUE.get(timeout=0.1)
+            # Block until work arrives; stop_llm_worker wakes us with a sentinel
+            item = LLM_PARSE_QUEUE.get()
+            if item[1] is None:
+                break
+            priority, filepath, parse_type = item
             
             # Skip if already actively processing this filepath
             if LLM_PARSE_RESULTS.get(filepath, {}).get('status') == 'processing':
@@ -1283,58 +1961,30 @@ def llm_worker_thread():
 
             # Hold off on low-priority work until the first high-priority
             #      job (priority 0) has finished warming the model.
-            if priority > 0 and not MODEL_WARMED.is_set():
-                # Wait properly instead of churning
-                with WARM_CONDITION:
-                    LLM_PARSE_QUEUE.put((priority, filepath, parse_type))  # re-queue once
-                    WARM_CONDITION.wait(timeout=1.0)  # Wait up to 1s
+            if priority > 0 and _defer_until_warm((priority, filepath, parse_type)):
                 continue
                 
             # Mark as pending
-            LLM_PARSE_RESULTS[filepath] = {'status': 'processing', 'result': None}
+            _set_llm_result(filepath, _PROCESSING)
+            
+            filename = os.path.basename(filepath)
             
             # Check database cache first
-            if STATE.database:
-                with STATE.database.get_db() as conn:
-                    row = conn.execute('''
-                        SELECT suggestion_filename, suggested_date_year, suggested_date_month,
-                               suggested_date_day, suggested_date_complete, suggested_location_primary,
-                               suggested_location_alternate, suggested_location_city, suggested_location_state,
-                               suggested_location_confidence, suggested_location_type, suggested_location_reasoning,
-                               suggested_location_landmark
-                        FROM photos WHERE filepath = ?
-                    ''', (filepath,)).fetchone()
-                    
-                    # If cached and filename matches, use it
-                    if row and row['suggestion_filename'] == Path(filepath).name:
-                        cached_result = {
-                            'date': {
-                                'year': row['suggested_date_year'],
-                                'month': row['suggested_date_month'],
-                                'day': row['suggested_date_day'],
-                                'is_complete': bool(row['suggested_date_complete'])
-                            } if row['suggested_date_year'] else None,
-                            'location': {
-                                'primary_search': row['suggested_location_primary'],
-                                'alternate_search': row['suggested_location_alternate'],
-                                'city': row['suggested_location_city'],
-                                'state': row['suggested_location_state'],
-                                'confidence': row['suggested_location_confidence'],
-                                'location_type': row['suggested_location_type'],
-                                'reasoning': row['suggested_location_reasoning'],
-                                'landmark_name': row['suggested_location_landmark'],
-                                'is_complete': row['suggested_location_confidence'] > 70 if row['suggested_location_confidence'] else False
-                            } if row['suggested_location_primary'] else None
-                        }
-                        
-                        LLM_PARSE_RESULTS[filepath] = {'status': 'ready', 'result': cached_result}
-                        logger.debug(f"Used cached LLM suggestion for {filepath}")
-                        continue
+            conn = _llm_connection()
+            if conn is not None:
+                row = conn.execute(_SUGGESTION_SELECT_SQL, (filepath, filename)).fetchone()
+                
+                # If cached for the current filename, use it
+                if row:
+                    entry = {'status': 'ready', 'result': _suggestion_from_row(row)}
+                    _set_llm_result(filepath, entry)
+                    _resolve_parse_future(filepath, entry)
+                    logger.debug(f"Used cached LLM suggestion for {filepath}")
+                    continue
             
             # Parse with LLM
             try:
                 if STATE.filename_parser and _LLM_AVAILABLE:
-                    filename = Path(filepath).name
                     llm_output = STATE.filename_parser.parse_filename(filename)
                     
                     # Convert to suggestion format
@@ -1346,86 +1996,72 @@ def llm_worker_thread():
                         'location': location_suggestion
                     }
                     
-                    # Save to database
-                    if STATE.database:
-                        with STATE.database.get_db() as conn:
-                            data = {
-                                'suggested_date_year': date_suggestion['year'] if date_suggestion else None,
-                                'suggested_date_month': date_suggestion['month'] if date_suggestion else None,
-                                'suggested_date_day': date_suggestion['day'] if date_suggestion else None,
-                                'suggested_date_complete': date_suggestion['is_complete'] if date_suggestion else 0,
-                                'suggested_location_primary': location_suggestion['primary_search'] if location_suggestion else None,
-                                'suggested_location_alternate': location_suggestion.get('alternate_search') if location_suggestion else None,
-                                'suggested_location_city': location_suggestion['city'] if location_suggestion else None,
-                                'suggested_location_state': location_suggestion['state'] if location_suggestion else None,
-                                'suggested_location_confidence': location_suggestion.get('confidence', 0) if location_suggestion else None,
-                                'suggested_location_type': location_suggestion.get('location_type') if location_suggestion else None,
-                                'suggested_location_reasoning': location_suggestion.get('reasoning') if location_suggestion else None,
-                                'suggested_location_landmark': location_suggestion.get('landmark_name') if location_suggestion else None,
-                                'suggestion_parsed_at': datetime.now().isoformat(),
-                                'suggestion_filename': filename
-                            }
-                            
-                            set_clause = ', '.join([f'{k} = :{k}' for k in data.keys()])
-                            data['filepath'] = filepath
-                            
-                            conn.execute(
-                                f'UPDATE photos SET {set_clause} WHERE filepath = :filepath',
-                                data
-                            )
+                    # Save to database (batched by llm_writer_thread)
+                    _queue_suggestion_write({
+                        'suggested_date_year': date_suggestion['year'] if date_suggestion else None,
+                        'suggested_date_month': date_suggestion['month'] if date_suggestion else None,
+                        'suggested_date_day': date_suggestion['day'] if date_suggestion else None,
+                        'suggested_date_complete': date_suggestion['is_complete'] if date_suggestion else 0,
+                        'suggested_location_primary': location_suggestion['primary_search'] if location_suggestion else None,
+                        'suggested_location_alternate': location_suggestion.get('alternate_search') if location_suggestion else None,
+                        'suggested_location_city': location_suggestion['city'] if location_suggestion else None,
+                        'suggested_location_state': location_suggestion['state'] if location_suggestion else None,
+                        'suggested_location_confidence': location_suggestion.get('confidence', 0) if location_suggestion else None,
+                        'suggested_location_type': location_suggestion.get('location_type') if location_suggestion else None,
+                        'suggested_location_reasoning': location_suggestion.get('reasoning') if location_suggestion else None,
+                        'suggested_location_landmark': location_suggestion.get('landmark_name') if location_suggestion else None,
+                        'suggestion_parsed_at': datetime.now().isoformat(),
+                        'suggestion_filename': filename,
+                        'filepath': filepath
+                    })
                     
-                    LLM_PARSE_RESULTS[filepath] = {'status': 'ready', 'result': result}
-
-                    # First high-priority parse finished → release gate
-                    if priority == 0 and not MODEL_WARMED.is_set():
-                        MODEL_WARMED.set()
-                        with WARM_CONDITION:
-                            WARM_CONDITION.notify_all()  # Wake up waiting threads
-                    # --- trim the cache if it grows beyond the cap ---
-                    if len(LLM_PARSE_RESULTS) > MAX_LLM_PARSE_RESULTS:
-                        excess = len(LLM_PARSE_RESULTS) - MAX_LLM_PARSE_RESULTS
-                        for old_key in list(LLM_PARSE_RESULTS)[:excess]:
-                            status = LLM_PARSE_RESULTS[old_key]['status']
-                            if status in ('ready', 'error'):      # keep pendings
-                                del LLM_PARSE_RESULTS[old_key]
-                    # ------------------------------------------------
+                    _finish_parse(filepath, {'status': 'ready', 'result': result}, priority)
                     logger.debug(f"LLM parsed {filepath}")
                 else:
                     # No LLM available
-                    LLM_PARSE_RESULTS[filepath] = {
-                        'status': 'ready',
-                        'result': {'date': None, 'location': None}
-                    }
-
-                    if priority == 0 and not MODEL_WARMED.is_set():
-                        MODEL_WARMED.set()
-                    # --- trim the cache if it grows beyond the cap ---
-                    if len(LLM_PARSE_RESULTS) > MAX_LLM_PARSE_RESULTS:
-                        excess = len(LLM_PARSE_RESULTS) - MAX_LLM_PARSE_RESULTS
-                        for old_key in list(LLM_PARSE_RESULTS)[:excess]:
-                            status = LLM_PARSE_RESULTS[old_key]['status']
-                            if status in ('ready', 'error'):
-                                del LLM_PARSE_RESULTS[old_key]
-                    # ------------------------------------------------
+                    _finish_parse(filepath, _READY_EMPTY, priority)
                     
             except Exception as e:
                 logger.error(f"LLM parse failed for {filepath}: {e}")
-                LLM_PARSE_RESULTS[filepath] = {'status': 'error', 'result': None}
+                entry = _PARSE_ERROR
+                _set_llm_result(filepath, entry)
+                _resolve_parse_future(filepath, entry)
                 
-        except queue.Empty:
-            continue
         except Exception as e:
             logger.error(f"LLM worker error: {e}")
     
+    _close_llm_connection()
     logger.info("LLM worker thread stopped")
 
+def _llm_follower_count() -> int:
+    """Extra LLM workers to start once the model is warm.
+
+    The llama.cpp parser runs one decode at a time under its own lock and
+    already spreads it over LLM_THREADS cores, so more workers would only
+    queue on that lock; one follower is enough to overlap cache probes and
+    result bookkeeping with inference. Without a model every job is an
+    instant no-op and the warming worker drains the queue alone.
+    """
+    if not (_LLM_AVAILABLE and STATE.filename_parser):
+        return 0
+    return 1
+
 def start_llm_worker():
     """Start the LLM worker thread if not already running"""
-    global LLM_WORKER_THREAD
+    global LLM_WORKER_THREAD, LLM_WRITER_THREAD
     
     if LLM_WORKER_THREAD is None or not LLM_WORKER_THREAD.is_alive():
         LLM_WORKER_STOP.clear()
-        MODEL_WARMED.clear()  # CRITICAL: Reset the gate for fresh start
+        if LLM_WRITER_THREAD is None or not LLM_WRITER_THREAD.is_alive():
+            LLM_WRITER_THREAD = threading.Thread(target=llm_writer_thread, name="LLMWriter", daemon=True)
+            LLM_WRITER_THREAD.start()
+        # A restart within the same process finds the model still resident -
+        # no warm-up parse needed, so open the gate and spawn followers now
+        already_warm = bool(STATE.filename_parser and STATE.filename_parser.is_loaded())
+        if already_warm:
+            _mark_model_warmed()
+        else:
+            MODEL_WARMED.clear()  # CRITICAL: Reset the gate for fresh start
         
         # Step 1 - start *one* warming worker
         t0 = threading.Thread(target=llm_worker_thread, daemon=True)
@@ -1435,9 +2071,12 @@ def start_llm_worker():
 
         # Step 2 - Spawn second worker but with a delay
         def _spawn_followers():
-            MODEL_WARMED.wait()                       # block until first parse done
-            time.sleep(2.0)  # Wait 2s after warm-up before adding second worker
-            follower_count = 1  # Just 1 additional worker for 2 total
+            if not already_warm:
+                MODEL_WARMED.wait()                       # block until first parse done
+                time.sleep(2.0)  # Wait 2s after warm-up before adding second worker
+            follower_count = _llm_follower_count()
+            if LLM_WORKER_STOP.is_set() or not follower_count:
+                return
             for _ in range(follower_count):
                 t = threading.Thread(target=llm_worker_thread, daemon=True)
                 t.start()
@@ -1449,14 +2088,23 @@ def start_llm_worker():
         logger.info("Started initial LLM worker thread")
 
 def stop_llm_worker():
-    """Stop the LLM worker thread"""
-    global LLM_WORKER_THREAD
+    """Stop the LLM worker threads, then drain the suggestion writer"""
+    global LLM_WORKER_THREAD, LLM_WRITER_THREAD
     
     if LLM_WORKER_THREAD and LLM_WORKER_THREAD.is_alive():
         LLM_WORKER_STOP.set()
-        LLM_WORKER_THREAD.join(timeout=5.0)
+        workers = [t for t in LLM_WORKER_THREADS if t.is_alive()]
+        for _ in workers:
+            LLM_PARSE_QUEUE.put(LLM_WORKER_SENTINEL)
+        for t in workers:
+            t.join(timeout=5.0)
+        LLM_WORKER_THREADS.clear()
         LLM_WORKER_THREAD = None
-        logger.info("Stopped LLM worker thread")
+        if LLM_WRITER_THREAD and LLM_WRITER_THREAD.is_alive():
+            LLM_WRITE_QUEUE.put(None)
+            LLM_WRITER_THREAD.join(timeout=5.0)
+        LLM_WRITER_THREAD = None
+        logger.info("Stopped LLM worker threads")
 
 # Register cleanup for LLM worker
 atexit.register(stop_llm_worker)
@@ -1465,6 +2113,121 @@ atexit.register(stop_llm_worker)
 # PHOTODATABASE CLASS
 # ============================================================================
 
+# Columns save_photo_state rewrites; the UPDATE is built once so every save
+# reuses the same compiled statement from sqlite3's statement cache.
+# Date/location fields are written as a group only when that info is given
+# (:has_date / :has_location); the rest keep the stored value on a NULL param.
+_PHOTO_STATE_DATE_COLUMNS = ('current_date_year', 'current_date_month', 'current_date_day')
+_PHOTO_STATE_LOCATION_COLUMNS = (
+    'current_city', 'current_state', 'current_gps_lat', 'current_gps_lon',
+    'current_country', 'current_country_code', 'current_street',
+    'current_postal_code', 'current_neighborhood',
+)
+_PHOTO_STATE_KEEP_COLUMNS = (
+    'current_date_source', 'current_location_source', 'last_saved_at',
+    'needs_date', 'needs_location',
+)
+_PHOTO_STATE_SET_COLUMNS = ('location_id', 'user_action', 'user_last_action_time')
+PHOTO_STATE_CACHE_SIZE = 4096
+# Compiled statements kept per connection; the default 128 is smaller than
+# the set of get_filtered_photos variants plus the other hot queries
+SQLITE_STATEMENT_CACHE_SIZE = 512
+# New photos in one scan above which bulk_load defers secondary index upkeep
+BULK_LOAD_THRESHOLD = 2000
+
+# WHERE clause for each get_filtered_photos filter. The partial indexes built
+# in _init_db use these same strings so the planner can match them term by term.
+_FILTER_QUERIES = {
+    'needs_review': "(user_action != 'saved' OR user_action IS NULL) AND deleted_at IS NULL",
+    'needs_both': "user_action = 'saved' AND needs_date = 1 AND needs_location = 1 AND deleted_at IS NULL",
+    'needs_date': "user_action = 'saved' AND needs_date = 1 AND needs_location = 0 AND deleted_at IS NULL",
+    'needs_location': "user_action = 'saved' AND needs_date = 0 AND needs_location = 1 AND deleted_at IS NULL",
+    'complete': "user_action = 'saved' AND needs_date = 0 AND needs_location = 0 AND deleted_at IS NULL",
+    'all': "deleted_at IS NULL"
+}
+_FILTER_INDEX_CONDITIONS = {
+    'review': _FILTER_QUERIES['needs_review'],
+    'both': _FILTER_QUERIES['needs_both'],
+    'date': _FILTER_QUERIES['needs_date'],
+    'location': _FILTER_QUERIES['needs_location'],
+    'complete': _FILTER_QUERIES['complete'],
+}
+
+# ORDER BY clause for each sort field, formatted with the sort direction
+_SORT_ORDERS = {
+    'filename': "ORDER BY filename {d}",
+    'sequence': "ORDER BY sequence_number {d} NULLS LAST, filename {d}",
+    'photo_date': (
+        "ORDER BY "
+        "CASE WHEN current_date_year IS NULL THEN 1 ELSE 0 END, "
+        "CAST(current_date_year AS INTEGER) {d}, "
+        "CAST(current_date_month AS INTEGER) {d}, "
+        "CAST(current_date_day AS INTEGER) {d}, "
+        "filename {d}"
+    ),
+    'date_created': "ORDER BY file_last_modified {d} NULLS LAST",
+    'date_modified': "ORDER BY updated_at {d} NULLS LAST",
+}
+# Search condition ANDed onto the filter; every ? takes the same %term% pattern
+_PHOTO_SEARCH_CONDITION = """(
+            IFNULL(filename, '') LIKE ? OR
+            IFNULL(CAST(current_date_year AS TEXT), '') LIKE ? OR
+            IFNULL(CAST(current_date_month AS TEXT), '') LIKE ? OR
+            IFNULL(CAST(current_date_day AS TEXT), '') LIKE ? OR
+            IFNULL(current_city, '') LIKE ? OR
+            IFNULL(current_state, '') LIKE ? OR
+            IFNULL(current_country, '') LIKE ? OR
+            IFNULL(current_street, '') LIKE ? OR
+            IFNULL(current_neighborhood, '') LIKE ? OR
+            IFNULL(suggested_location_landmark, '') LIKE ? OR
+            IFNULL(CAST(suggested_date_year AS TEXT), '') LIKE ? OR
+            IFNULL(suggested_date_month, '') LIKE ? OR
+            IFNULL(suggested_location_primary, '') LIKE ? OR
+            IFNULL(suggested_location_city, '') LIKE ? OR
+            IFNULL(suggested_location_state, '') LIKE ? OR
+            IFNULL(suggested_location_landmark, '') LIKE ? OR
+            (IFNULL(CAST(current_date_year AS TEXT), '') || '-' || 
+             IFNULL(CAST(current_date_month AS TEXT), '') || '-' || 
+             IFNULL(CAST(current_date_day AS TEXT), '')) LIKE ?
+        )"""
+_PHOTO_SEARCH_PARAM_COUNT = _PHOTO_SEARCH_CONDITION.count('?')
+
+def _filtered_photos_from(filter_type: str, searching: bool) -> str:
+    """FROM/WHERE for a filter; searching also matches the LLM suggestions"""
+    if searching:
+        return (f"FROM photos LEFT JOIN photo_suggestions USING (filepath) "
+                f"WHERE ({_FILTER_QUERIES[filter_type]}) AND {_PHOTO_SEARCH_CONDITION}")
+    return f"FROM photos WHERE ({_FILTER_QUERIES[filter_type]})"
+
+def _filtered_photos_sql(filter_type: str, sort_field: str, direction: str, searching: bool) -> str:
+    """SELECT for get_filtered_photos' filter, sort and search combination"""
+    order_by_clause = _SORT_ORDERS[sort_field].format(d=direction)
+    return f"SELECT filepath {_filtered_photos_from(filter_type, searching)} {order_by_clause}"
+
+# Every combination is built once at import, so each call reuses identical
+# SQL text and hits sqlite3's per-connection statement cache
+_FILTERED_PHOTOS_SQL = {
+    key: _filtered_photos_sql(*key)
+    for key in itertools.product(_FILTER_QUERIES, _SORT_ORDERS, ('ASC', 'DESC'), (False, True))
+}
+_FILTERED_PHOTOS_COUNT_SQL = {
+    key: f"SELECT COUNT(*) {_filtered_photos_from(*key)}"
+    for key in itertools.product(_FILTER_QUERIES, (False, True))
+}
+# Rows pulled per fetchmany while streaming filtered filepaths
+FILTERED_PHOTOS_FETCH_SIZE = 1000
+
+_PHOTO_STATE_UPDATE_SQL = (
+    "UPDATE photos SET "
+    + ', '.join(
+        [f"{c} = CASE WHEN :has_date THEN :{c} ELSE {c} END" for c in _PHOTO_STATE_DATE_COLUMNS]
+        + [f"{c} = CASE WHEN :has_location THEN :{c} ELSE {c} END" for c in _PHOTO_STATE_LOCATION_COLUMNS]
+        + [f"{c} = COALESCE(:{c}, {c})" for c in _PHOTO_STATE_KEEP_COLUMNS]
+        + [f"{c} = :{c}" for c in _PHOTO_STATE_SET_COLUMNS]
+    )
+    + ", updated_at = unix_ms() WHERE filepath = :filepath"
+)
+
 class PhotoDatabase:
     """SQLite database for photo metadata"""
     
@@ -1472,16 +2235,25 @@ class PhotoDatabase:
         self.db_path = db_path
         self._pool = ConnectionPool(db_path)
         self._last_pool_cleanup = time.time()
+        # Reads run concurrently under WAL; writers take this lock so they
+        # queue in Python instead of spinning on SQLITE_BUSY
+        self.write_lock = self._pool.write_lock
+        self.has_fts = False  # set by _init_db once locations_fts exists
+        # filepath -> (updated_at, DateInfo, LocationInfo), see get_photo_state
+        self._state_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._state_cache_lock = threading.Lock()
         self._init_db()
     
     def _init_db(self):
         """Initialize database schema with concurrency support"""
-        with self.get_db() as conn:
+        with self.write_lock:
+            # journal_mode can't change inside the write transaction below
+            conn = self._pool.get_write_connection()
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=10000")
             conn.execute("PRAGMA busy_timeout=10000")
-            
+        
+        with self.get_db_write() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS photos (
                     filepath TEXT PRIMARY KEY,
@@ -1501,8 +2273,6 @@ class PhotoDatabase:
                     original_city TEXT,
                     original_state TEXT,
                     original_location_source TEXT, -- 'gps', 'iptc', 'filename', 'none'
-                    original_camera_make TEXT,
-                    original_camera_model TEXT,
                     
                     -- Current state in file
                     current_date_year TEXT,
@@ -1523,7 +2293,7 @@ class PhotoDatabase:
                     current_neighborhood TEXT,
                     
                     user_action TEXT DEFAULT 'none', -- 'saved', 'skipped', 'none'
-                    user_last_action_time TIMESTAMP,
+                    user_last_action_time INTEGER, -- Unix milliseconds
                     
                     -- What needs attention
                     needs_date BOOLEAN DEFAULT 0,
@@ -1535,27 +2305,29 @@ class PhotoDatabase:
                     has_good_gps BOOLEAN DEFAULT 0,  -- Has GPS from camera/phone
                     has_good_location BOOLEAN DEFAULT 0, -- Has city/state from GPS or user
                     
-                    -- Legacy fields for compatibility during transition
+                    -- Saved location this photo was tagged with
                     location_id INTEGER REFERENCES locations(id),
-                    last_modified TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                     
                     -- Import pipeline tracking
                     import_batch_id TEXT,
-                    import_status TEXT,
                     imported_at TIMESTAMP,
-                    updated_at TIMESTAMP,
+                    updated_at INTEGER, -- Unix milliseconds
                     
                     -- Additional metadata fields
-                    date_from_complete_suggestion BOOLEAN DEFAULT 0,
-                    location_gps_source TEXT,
-                    location_landmark_name TEXT,
                     has_camera_metadata BOOLEAN DEFAULT 0,
                     original_make TEXT,
                     original_model TEXT,
-                    last_saved_at TIMESTAMP,
+                    last_saved_at INTEGER, -- Unix milliseconds
                     
-                    -- LLM suggestion cache
+                    -- Soft delete tracking
+                    deleted_at TIMESTAMP
+                )
+            ''')
+            
+            # LLM suggestion cache, kept apart so photos scans skip these bytes
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS photo_suggestions (
+                    filepath TEXT PRIMARY KEY REFERENCES photos(filepath),
                     suggested_date_year TEXT,
                     suggested_date_month TEXT,
                     suggested_date_day TEXT,
@@ -1569,11 +2341,8 @@ class PhotoDatabase:
                     suggested_location_reasoning TEXT,
                     suggested_location_landmark TEXT,
                     suggestion_parsed_at TIMESTAMP,
-                    suggestion_filename TEXT,
-                    
-                    -- Soft delete tracking
-                    deleted_at TIMESTAMP
-                )
+                    suggestion_filename TEXT
+                ) WITHOUT ROWID
             ''')
             
             conn.execute('''
@@ -1609,24 +2378,14 @@ class PhotoDatabase:
                 )
             ''')
             
-            # Add thumbnail cache table
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS thumbnails (
-                    id INTEGER PRIMARY KEY,
-                    filepath TEXT NOT NULL,
-                    file_mtime REAL NOT NULL,
-                    size TEXT NOT NULL,
-                    base64_data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(filepath, file_mtime, size)
-                )
-            ''')
-            
-            # Create index for fast lookups
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_thumbnails_lookup 
-                ON thumbnails(filepath, file_mtime, size)
-            ''')
+            # ====== Thumbnails live in the on-disk WebP cache (THUMB_CACHE_DIR) ======
+            # Older databases kept base64 JPEG thumbnails in a table here; they
+            # bloat every page cache scan, so drop them and let the disk cache refill
+            legacy_thumbnails = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'thumbnails'"
+            ).fetchone()
+            if legacy_thumbnails:
+                conn.execute('DROP TABLE thumbnails')
             
             # ====== Import Pipeline Tables ======
             conn.execute('''
@@ -1667,161 +2426,358 @@ class PhotoDatabase:
             # Add sequence_number column if it doesn't exist
             try:
                 conn.execute('ALTER TABLE photos ADD COLUMN sequence_number INTEGER')
-                # Populate sequence_number for existing photos
-                conn.execute('''
-                    UPDATE photos 
-                    SET sequence_number = (
-                        CASE 
-                            WHEN SUBSTR(filename, -7, 1) = '_' AND 
-                                 SUBSTR(filename, -6, 3) GLOB '[0-9][0-9][0-9]' AND
-                                 SUBSTR(filename, -3) = '.heic' OR SUBSTR(filename, -5) = '.HEIC'
-                            THEN CAST(SUBSTR(filename, -6, 3) AS INTEGER)
-                            ELSE NULL
-                        END
-                    )
-                    WHERE sequence_number IS NULL
-                ''')
+                # Populate sequence_number for existing photos with the same
+                # parser the scanner uses, streaming rows in batches
+                cursor = conn.execute('SELECT filepath, filename FROM photos WHERE sequence_number IS NULL')
+                while True:
+                    rows = cursor.fetchmany(5000)
+                    if not rows:
+                        break
+                    updates = []
+                    for filepath, filename in rows:
+                        sequence_number = extract_sequence_number(filename)
+                        if sequence_number is not None:
+                            updates.append((sequence_number, filepath))
+                    conn.executemany('UPDATE photos SET sequence_number = ? WHERE filepath = ?', updates)
             except Exception:
                 # Column already exists, skip
                 pass
             
-            # ====== Create indexes for performance ======
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_queue_batch ON pipeline_queue(batch_id)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_queue_status ON pipeline_queue(status)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_import_batch ON photos(import_batch_id)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_imported_at ON photos(imported_at)')
+            # Drop columns nothing reads or writes any more (duplicates of
+            # original_make/original_model and old transition fields) so rows
+            # stay narrow; DROP COLUMN needs SQLite 3.35+
+            photo_columns = {row[1] for row in conn.execute('PRAGMA table_info(photos)')}
+            for column in ('original_camera_make', 'original_camera_model', 'last_modified',
+                           'created_at', 'import_status', 'date_from_complete_suggestion',
+                           'location_gps_source', 'location_landmark_name'):
+                if column in photo_columns:
+                    try:
+                        conn.execute(f'ALTER TABLE photos DROP COLUMN {column}')
+                    except sqlite3.OperationalError as e:
+                        logger.debug(f"Keeping unused photos.{column}: {e}")
+                        break
             
-            # Indexes for filtering frequently queried columns
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_user_action ON photos(user_action)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_needs_flags ON photos(needs_date, needs_location)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_deleted_at ON photos(deleted_at)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_filename ON photos(filename)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_sequence ON photos(sequence_number)')
+            # Suggestions used to be photos columns; move them to photo_suggestions
+            if 'suggestion_filename' in photo_columns:
+                conn.execute(f'''
+                    INSERT OR IGNORE INTO photo_suggestions (filepath, {', '.join(_SUGGESTION_COLUMNS)})
+                    SELECT filepath, {', '.join(_SUGGESTION_COLUMNS)} FROM photos
+                    WHERE suggestion_filename IS NOT NULL
+                ''')
+                conn.execute('DROP INDEX IF EXISTS idx_photos_fp_fname')
+                for column in _SUGGESTION_COLUMNS:
+                    try:
+                        conn.execute(f'ALTER TABLE photos DROP COLUMN {column}')
+                    except sqlite3.OperationalError as e:
+                        logger.debug(f"Keeping legacy photos.{column}: {e}")
+                        break
             
-            # Ensure updated_at is set for any existing rows
-            conn.execute("UPDATE photos SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL")
+            # Location key columns used to allow NULL, which UNIQUE treats as
+            # distinct; blank them so get_or_create_location's upsert matches
+            for column in ('country', 'landmark_name', 'street'):
+                conn.execute(f"UPDATE OR IGNORE locations SET {column} = '' WHERE {column} IS NULL")
+            
+            # ====== Create indexes for performance ======
+            conn.execute('DROP INDEX IF EXISTS idx_photos_needs_flags')
+            self._create_indexes(conn)
             
-            # ====== Create trigger for automatic updated_at ======
-            # Drop existing trigger first to avoid conflicts
+            # ====== updated_at is set by each INSERT/UPDATE statement ======
+            # Older databases carry triggers that re-UPDATE the row after every
+            # write, doubling the work. Drop them before the backfill and the
+            # conversion below, which would otherwise fire them
             conn.execute('DROP TRIGGER IF EXISTS update_photos_timestamp')
+            conn.execute('DROP TRIGGER IF EXISTS insert_photos_timestamp')
             
-            conn.execute('''
-                CREATE TRIGGER update_photos_timestamp 
-                AFTER UPDATE ON photos
-                FOR EACH ROW
-                WHEN NEW.updated_at = OLD.updated_at OR OLD.updated_at IS NULL
-                BEGIN
-                    UPDATE photos SET updated_at = CURRENT_TIMESTAMP WHERE filepath = NEW.filepath;
-                END
-            ''')
+            # Ensure updated_at is set for any existing rows
+            conn.execute("UPDATE photos SET updated_at = unix_ms() WHERE updated_at IS NULL")
+            
+            # Action timestamps used to be TEXT: local isoformat() from Python
+            # ('T' separator) or UTC CURRENT_TIMESTAMP. Convert them once to
+            # Unix milliseconds
+            for column in ('updated_at', 'user_last_action_time', 'last_saved_at'):
+                conn.execute(f'''
+                    UPDATE photos SET {column} = CAST(ROUND(
+                        (julianday({column}, CASE WHEN instr({column}, 'T') THEN 'utc' ELSE '+0 seconds' END)
+                         - 2440587.5) * 86400000) AS INTEGER)
+                    WHERE typeof({column}) = 'text'
+                ''')
             
-            # Trigger for inserts
-            conn.execute('DROP TRIGGER IF EXISTS insert_photos_timestamp')
-            conn.execute('''
-                CREATE TRIGGER insert_photos_timestamp
-                AFTER INSERT ON photos
-                FOR EACH ROW
-                BEGIN
-                    UPDATE photos SET updated_at = CURRENT_TIMESTAMP WHERE filepath = NEW.filepath;
-                END
+            # ====== Full-text index for location search ======
+            # External-content FTS5 table kept in sync by triggers; usage-count
+            # updates don't touch the indexed columns, so they skip the index
+            try:
+                fts_exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'locations_fts'"
+                ).fetchone()
+                conn.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS locations_fts USING fts5(
+                        city, state, landmark_name, street, country,
+                        content='locations', content_rowid='id'
+                    )
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS locations_fts_insert AFTER INSERT ON locations BEGIN
+                        INSERT INTO locations_fts(rowid, city, state, landmark_name, street, country)
+                        VALUES (NEW.id, NEW.city, NEW.state, NEW.landmark_name, NEW.street, NEW.country);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS locations_fts_delete AFTER DELETE ON locations BEGIN
+                        INSERT INTO locations_fts(locations_fts, rowid, city, state, landmark_name, street, country)
+                        VALUES ('delete', OLD.id, OLD.city, OLD.state, OLD.landmark_name, OLD.street, OLD.country);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS locations_fts_update
+                    AFTER UPDATE OF city, state, landmark_name, street, country ON locations BEGIN
+                        INSERT INTO locations_fts(locations_fts, rowid, city, state, landmark_name, street, country)
+                        VALUES ('delete', OLD.id, OLD.city, OLD.state, OLD.landmark_name, OLD.street, OLD.country);
+                        INSERT INTO locations_fts(rowid, city, state, landmark_name, street, country)
+                        VALUES (NEW.id, NEW.city, NEW.state, NEW.landmark_name, NEW.street, NEW.country);
+                    END
+                ''')
+                if not fts_exists:
+                    # Index locations saved before the FTS table existed
+                    conn.execute("INSERT INTO locations_fts(locations_fts) VALUES ('rebuild')")
+                self.has_fts = True
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 - search_locations falls back to LIKE
+                logger.warning(f"Location full-text search unavailable: {e}")
+                self.has_fts = False
+        
+        if legacy_thumbnails:
+            # Give the freed thumbnail pages back to the filesystem (one-off)
+            with self.write_lock:
+                try:
+                    self._pool.get_write_connection().execute('VACUUM')
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not vacuum database after dropping thumbnails: {e}")
+    
+    def _create_indexes(self, conn: sqlite3.Connection):
+        """Create every secondary index (IF NOT EXISTS); safe to re-run"""
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_queue_batch ON pipeline_queue(batch_id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_queue_status ON pipeline_queue(status)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_import_batch ON photos(import_batch_id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_imported_at ON photos(imported_at)')
+        
+        # Indexes for filtering frequently queried columns
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_user_action ON photos(user_action)')
+        # Per-filter partial indexes matching get_filtered_photos' WHERE
+        # clauses exactly, covering the filepath projection in both the
+        # filename and sequence sort orders
+        filter_indexes_exist = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_photos_filter_review_name'"
+        ).fetchone()
+        for name, condition in _FILTER_INDEX_CONDITIONS.items():
+            conn.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_photos_filter_{name}_name
+                ON photos(filename, filepath) WHERE {condition}
             ''')
+            conn.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_photos_filter_{name}_seq
+                ON photos(sequence_number, filename, filepath) WHERE {condition}
+            ''')
+        if not filter_indexes_exist:
+            # Give the planner statistics so it picks the new indexes (also
+            # after bulk_load rebuilds them)
+            conn.execute('ANALYZE photos')
+        
+        # Covers get_stats' GROUP BY and the saved/needs_* filters for live photos
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_photos_stats_cover
+            ON photos(user_action, needs_date, needs_location) WHERE deleted_at IS NULL
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_deleted_at ON photos(deleted_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_filename ON photos(filename)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_photos_sequence ON photos(sequence_number)')
     
     @contextmanager
-    def get_db(self):
-        """Database connection context manager using connection pool"""
-        # Periodically close all connections to allow WAL cleanup
+    def bulk_load(self):
+        """Drop the secondary photos indexes around a large import, rebuild after.
+
+        Building each index once over the loaded rows is much cheaper than
+        updating every index on every insert. The filepath UNIQUE constraint
+        is kept since the scan upserts on it.
+        """
+        with self.get_db_write() as conn:
+            names = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'photos' "
+                "AND name LIKE 'idx_photos_%'"
+            )]
+            for name in names:
+                conn.execute(f'DROP INDEX IF EXISTS {name}')
+        try:
+            yield
+        finally:
+            with self.get_db_write() as conn:
+                self._create_indexes(conn)
+    
+    def _maybe_checkpoint(self):
+        # Periodically fold the WAL back into the database. PASSIVE never
+        # calls the busy handler, so the request that triggers it doesn't wait
+        # on active readers; the WAL is truncated at shutdown instead.
+        # Connections stay open, keeping their page caches and statements.
         if time.time() - self._last_pool_cleanup > 60:  # Every 60 seconds
-            self._pool.close_idle_connections()
             self._last_pool_cleanup = time.time()
-        
-        conn = self._pool.get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except:
-            conn.rollback()
-            raise
-        # Note: Connection stays in pool, but we'll periodically clean them
+            # Skip this round rather than make a request wait behind a writer
+            if self.write_lock.acquire(blocking=False):
+                try:
+                    conn = self._pool.get_write_connection()
+                    if not conn.in_transaction:
+                        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                except sqlite3.Error as e:
+                    logger.debug(f"WAL checkpoint skipped: {e}")
+                finally:
+                    self.write_lock.release()
+    
+    @contextmanager
+    def get_db_read(self):
+        """Read-only connection for queries; never blocks on a writer under WAL"""
+        self._maybe_checkpoint()
+        yield self._pool.get_read_connection()
+    
+    @contextmanager
+    def get_db_write(self):
+        """Writer connection holding write_lock, in a BEGIN IMMEDIATE transaction.
+
+        Taking the write lock up front avoids SQLITE_BUSY when a deferred
+        transaction tries to upgrade mid-way. Nested use joins the outer
+        transaction.
+        """
+        with self.write_lock:
+            conn = self._pool.get_write_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except:
+                conn.rollback()
+                raise
     
     def save_photo_state(self, filepath: str, date_info: Optional[DateInfo], 
                         location_info: Optional[LocationInfo], user_action: str = 'saved',
                         location_id: Optional[int] = None):
         """Save photo state after user action"""
-        with self.get_db() as conn:
-            # Get current state
-            current = conn.execute(
-                'SELECT * FROM photos WHERE filepath = ?', 
-                (filepath,)
-            ).fetchone()
-            
-            if not current:
-                print(f"Warning: Photo {filepath} not in database")
-                return
-            
-            # Determine new sources - preserve original source types
-            if date_info:
-                # Use the most authoritative source from the DateInfo
-                if date_info.year_source == DataSource.USER:
-                    new_date_source = 'user'
-                else:
-                    new_date_source = 'system'
+        self.save_photo_states_bulk([(filepath, date_info, location_info, user_action, location_id)])
+    
+    def save_photo_states_bulk(self, items: List[Tuple[str, Optional[DateInfo], Optional[LocationInfo], str, Optional[int]]]):
+        """Save many photo states in one write transaction.
+
+        Each item is (filepath, date_info, location_info, user_action, location_id).
+        All updates go out through a single executemany of the fixed
+        _PHOTO_STATE_UPDATE_SQL, which keeps stored values in SQL where no new
+        info is given, so the current rows are never read.
+        """
+        if not items:
+            return
+        
+        filepaths = list(dict.fromkeys(item[0] for item in items))
+        now = time.time_ns() // 1_000_000
+        updates = [
+            self._photo_state_update(filepath, date_info, location_info, user_action, location_id, now)
+            for filepath, date_info, location_info, user_action, location_id in items
+        ]
+        with self.get_db_write() as conn:
+            # Update the records
+            cursor = conn.executemany(_PHOTO_STATE_UPDATE_SQL, updates)
+            if cursor.rowcount < len(updates):
+                # Only look up which rows were missing when some update matched nothing
+                found = set()
+                for start in range(0, len(filepaths), 500):
+                    chunk = filepaths[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    found.update(row[0] for row in conn.execute(
+                        f'SELECT filepath FROM photos WHERE filepath IN ({placeholders})', chunk
+                    ))
+                for filepath in filepaths:
+                    if filepath not in found:
+                        print(f"Warning: Photo {filepath} not in database")
+        self._forget_photo_states(filepaths)
+    
+    @staticmethod
+    def _photo_state_update(filepath: str, date_info: Optional[DateInfo],
+                            location_info: Optional[LocationInfo], user_action: str,
+                            location_id: Optional[int], now: int) -> Dict[str, Any]:
+        """Parameters for _PHOTO_STATE_UPDATE_SQL; None keeps the stored value"""
+        # Determine new sources - preserve original source types
+        new_date_source = None
+        if date_info:
+            # Use the most authoritative source from the DateInfo
+            if date_info.year_source == DataSource.USER:
+                new_date_source = 'user'
             else:
-                new_date_source = current['current_date_source']
-                
-            if location_info:
-                # Check if this is from GPS (user) or system
-                if location_info.gps_source == DataSource.USER:
-                    new_location_source = 'user'
-                elif location_info.state_source == DataSource.USER:
-                    new_location_source = 'user'
-                else:
-                    new_location_source = 'system'
+                new_date_source = 'system'
+            
+        new_location_source = None
+        if location_info:
+            # Check if this is from GPS (user) or system
+            if location_info.gps_source == DataSource.USER:
+                new_location_source = 'user'
+            elif location_info.state_source == DataSource.USER:
+                new_location_source = 'user'
             else:
-                new_location_source = current['current_location_source']
-            
-            # Update current state
-            data = {
-                'current_date_year': date_info.year if date_info else current['current_date_year'],
-                'current_date_month': date_info.month if date_info else current['current_date_month'],
-                'current_date_day': date_info.day if date_info else current['current_date_day'],
-                'current_date_source': new_date_source,
-                'current_city': location_info.city if location_info else current['current_city'],
-                'current_state': location_info.state if location_info else current['current_state'],
-                'current_gps_lat': location_info.gps_lat if location_info else current['current_gps_lat'],
-                'current_gps_lon': location_info.gps_lon if location_info else current['current_gps_lon'],
-                'current_location_source': new_location_source,
-                'location_id': location_id,
-                
-                # Location fields
-                'current_country': location_info.country if location_info else (current['current_country'] if 'current_country' in current else ''),
-                'current_country_code': location_info.country_code if location_info else (current['current_country_code'] if 'current_country_code' in current else ''),
-                'current_street': location_info.street if location_info else (current['current_street'] if 'current_street' in current else ''),
-                'current_postal_code': location_info.postal_code if location_info else (current['current_postal_code'] if 'current_postal_code' in current else ''),
-                'current_neighborhood': location_info.neighborhood if location_info else (current['current_neighborhood'] if 'current_neighborhood' in current else ''),
-                
-                # Update user action tracking
-                'user_action': user_action,
-                'user_last_action_time': datetime.now().isoformat(),
-                'last_saved_at': datetime.now().isoformat() if user_action == 'saved' else current['last_saved_at'],
-                
-                # Recalculate needs - must match tag logic exactly
-                'needs_date': 0 if (date_info and not date_info.needs_tag()) else (1 if date_info else current['needs_date']),
-                'needs_location': 0 if (location_info and not location_info.needs_tag()) else (1 if location_info else current['needs_location'])
-            }
-            
-            # Update the record
-            set_clause = ', '.join([f'{k} = :{k}' for k in data.keys()])
-            data['filepath'] = filepath
-            
-            conn.execute(
-                f'UPDATE photos SET {set_clause} WHERE filepath = :filepath',
-                data
-            )
+                new_location_source = 'system'
+        
+        # Update current state
+        return {
+            'has_date': 1 if date_info else 0,
+            'current_date_year': date_info.year if date_info else None,
+            'current_date_month': date_info.month if date_info else None,
+            'current_date_day': date_info.day if date_info else None,
+            'current_date_source': new_date_source,
+            'has_location': 1 if location_info else 0,
+            'current_city': location_info.city if location_info else None,
+            'current_state': location_info.state if location_info else None,
+            'current_gps_lat': location_info.gps_lat if location_info else None,
+            'current_gps_lon': location_info.gps_lon if location_info else None,
+            'current_location_source': new_location_source,
+            'location_id': location_id,
+            
+            # Location fields
+            'current_country': location_info.country if location_info else None,
+            'current_country_code': location_info.country_code if location_info else None,
+            'current_street': location_info.street if location_info else None,
+            'current_postal_code': location_info.postal_code if location_info else None,
+            'current_neighborhood': location_info.neighborhood if location_info else None,
+            
+            # Update user action tracking
+            'user_action': user_action,
+            'user_last_action_time': now,
+            'last_saved_at': now if user_action == 'saved' else None,
+            
+            # Recalculate needs - must match tag logic exactly
+            'needs_date': (1 if date_info.needs_tag() else 0) if date_info else None,
+            'needs_location': (1 if location_info.needs_tag() else 0) if location_info else None,
+            
+            'filepath': filepath
+        }
     
     def get_photo_state(self, filepath: str) -> Tuple[Optional[DateInfo], Optional[LocationInfo]]:
-        """Get photo state from database"""
-        with self.get_db() as conn:
-            row = conn.execute('SELECT * FROM photos WHERE filepath = ?', (filepath,)).fetchone()
+        """Get photo state from database.
+
+        Cached per filepath with its updated_at: a cheap probe of updated_at decides
+        whether the cached DateInfo/LocationInfo pair is still current, so
+        the full row is only read and rebuilt after the photo changes.
+        """
+        with self.get_db_read() as conn:
+            stamp = conn.execute('SELECT updated_at FROM photos WHERE filepath = ?', (filepath,)).fetchone()
+            if not stamp:
+                return None, None
+            updated_at = stamp[0]
+            with self._state_cache_lock:
+                cached = self._state_cache.get(filepath)
+                if cached is not None and cached[0] == updated_at:
+                    self._state_cache.move_to_end(filepath)
+                    return cached[1], cached[2]
+            
+            row = conn.execute(
+                'SELECT current_date_year, current_date_month, current_date_day, current_date_source, '
+                'current_city, current_state, current_gps_lat, current_gps_lon, current_location_source '
+                'FROM photos WHERE filepath = ?', (filepath,)
+            ).fetchone()
             if not row:
                 return None, None
             
@@ -1856,143 +2812,163 @@ class PhotoDatabase:
                     gps_source=source if row['current_gps_lat'] else None
                 )
             
+            if updated_at is not None:
+                with self._state_cache_lock:
+                    self._state_cache[filepath] = (updated_at, date_info, location_info)
+                    self._state_cache.move_to_end(filepath)
+                    while len(self._state_cache) > PHOTO_STATE_CACHE_SIZE:
+                        self._state_cache.popitem(last=False)
+            
             # Return photo state
             return date_info, location_info
     
-    def get_filtered_photos(self, filter_type: str, search_term: Optional[str] = None) -> List[str]:
+    def _forget_photo_states(self, filepaths: List[str]):
+        """Drop cached states for filepaths after a save.
+
+        The cache is validated against updated_at (Unix ms), which can't tell
+        apart two writes in the same millisecond, so saves invalidate explicitly.
+        """
+        with self._state_cache_lock:
+            for filepath in filepaths:
+                self._state_cache.pop(filepath, None)
+    
+    def get_filtered_photos(self, filter_type: str, search_term: Optional[str] = None,
+                            limit: Optional[int] = None, offset: int = 0) -> List[str]:
         """Get photos based on filter and optional search term, sorted by the database."""
-        with self.get_db() as conn:
-            # Build ORDER BY clause based on sort field and direction
-            direction = STATE.sort_direction
-            
-            if STATE.sort_field == "filename":
-                order_by_clause = f"ORDER BY filename {direction}"
-            elif STATE.sort_field == "sequence":
-                order_by_clause = f"ORDER BY sequence_number {direction} NULLS LAST, filename {direction}"
-            elif STATE.sort_field == "photo_date":
-                order_by_clause = (
-                    f"ORDER BY "
-                    f"CASE WHEN current_date_year IS NULL THEN 1 ELSE 0 END, "
-                    f"CAST(current_date_year AS INTEGER) {direction}, "
-                    f"CAST(current_date_month AS INTEGER) {direction}, "
-                    f"CAST(current_date_day AS INTEGER) {direction}, "
-                    f"filename {direction}"
-                )
-            elif STATE.sort_field == "date_created":
-                order_by_clause = f"ORDER BY file_last_modified {direction} NULLS LAST"
-            elif STATE.sort_field == "date_modified":
-                order_by_clause = f"ORDER BY updated_at {direction} NULLS LAST"
-            else:
-                # Fallback to filename
-                order_by_clause = f"ORDER BY filename {direction}"
-            
-            # Base queries for each filter
-            filter_queries = {
-                'needs_review': "(user_action != 'saved' OR user_action IS NULL) AND deleted_at IS NULL",
-                'needs_both': "user_action = 'saved' AND needs_date = 1 AND needs_location = 1 AND deleted_at IS NULL",
-                'needs_date': "user_action = 'saved' AND needs_date = 1 AND needs_location = 0 AND deleted_at IS NULL",
-                'needs_location': "user_action = 'saved' AND needs_date = 0 AND needs_location = 1 AND deleted_at IS NULL",
-                'complete': "user_action = 'saved' AND needs_date = 0 AND needs_location = 0 AND deleted_at IS NULL",
-                'all': "deleted_at IS NULL"
-            }
-            
-            where_parts = []
-            
-            # Add filter condition
-            filter_condition = filter_queries.get(filter_type, filter_queries['all'])
-            where_parts.append(f"({filter_condition})")
-            
-            # Use STATE.search_term if not explicitly provided
-            if search_term is None:
-                search_term = STATE.search_term
-            
-            # Add search condition if provided
-            search_pattern = f"%{search_term}%" if search_term else ""
-            if search_term:
-                search_conditions = """(
-                    IFNULL(filename, '') LIKE ? OR
-                    IFNULL(CAST(current_date_year AS TEXT), '') LIKE ? OR
-                    IFNULL(CAST(current_date_month AS TEXT), '') LIKE ? OR
-                    IFNULL(CAST(current_date_day AS TEXT), '') LIKE ? OR
-                    IFNULL(current_city, '') LIKE ? OR
-                    IFNULL(current_state, '') LIKE ? OR
-                    IFNULL(current_country, '') LIKE ? OR
-                    IFNULL(current_street, '') LIKE ? OR
-                    IFNULL(current_neighborhood, '') LIKE ? OR
-                    IFNULL(suggested_location_landmark, '') LIKE ? OR
-                    IFNULL(CAST(suggested_date_year AS TEXT), '') LIKE ? OR
-                    IFNULL(suggested_date_month, '') LIKE ? OR
-                    IFNULL(suggested_location_primary, '') LIKE ? OR
-                    IFNULL(suggested_location_city, '') LIKE ? OR
-                    IFNULL(suggested_location_state, '') LIKE ? OR
-                    IFNULL(suggested_location_landmark, '') LIKE ? OR
-                    (IFNULL(CAST(current_date_year AS TEXT), '') || '-' || 
-                     IFNULL(CAST(current_date_month AS TEXT), '') || '-' || 
-                     IFNULL(CAST(current_date_day AS TEXT), '')) LIKE ?
-                )"""
-                where_parts.append(search_conditions)
-            
-            # Combine all WHERE conditions
-            where_clause = "WHERE " + " AND ".join(where_parts)
-            
-            # Construct the final query
-            full_query = f"SELECT filepath FROM photos {where_clause} {order_by_clause}"
-            
-            # Execute with parameters if search term provided
-            if search_term:
-                # 17 parameters for the search conditions
-                search_params = [search_pattern] * 17
-                return [row[0] for row in conn.execute(full_query, search_params).fetchall()]
-            else:
-                return [row[0] for row in conn.execute(full_query).fetchall()]
+        return list(self.iter_filtered_photos(filter_type, search_term, limit, offset))
+    
+    def iter_filtered_photos(self, filter_type: str, search_term: Optional[str] = None,
+                             limit: Optional[int] = None, offset: int = 0) -> Iterator[str]:
+        """Stream filtered filepaths in sort order, optionally one LIMIT/OFFSET page.
+
+        Rows are fetched in FILTERED_PHOTOS_FETCH_SIZE batches, and with a
+        limit SQLite stops stepping once the page is filled.
+        """
+        # Use STATE.search_term if not explicitly provided
+        if search_term is None:
+            search_term = STATE.search_term
+        
+        filter_type = filter_type if filter_type in _FILTER_QUERIES else 'all'
+        sort_field = STATE.sort_field if STATE.sort_field in _SORT_ORDERS else 'filename'
+        direction = 'DESC' if STATE.sort_direction == 'DESC' else 'ASC'
+        full_query = _FILTERED_PHOTOS_SQL[(filter_type, sort_field, direction, bool(search_term))]
+        
+        # Execute with parameters if search term provided
+        params = [f"%{search_term}%"] * _PHOTO_SEARCH_PARAM_COUNT if search_term else []
+        if limit is not None:
+            full_query += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        
+        with self.get_db_read() as conn:
+            cursor = conn.execute(full_query, params)
+            while True:
+                rows = cursor.fetchmany(FILTERED_PHOTOS_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row[0]
+    
+    def count_filtered_photos(self, filter_type: str, search_term: Optional[str] = None) -> int:
+        """Number of photos get_filtered_photos would return, without fetching them"""
+        if search_term is None:
+            search_term = STATE.search_term
+        
+        filter_type = filter_type if filter_type in _FILTER_QUERIES else 'all'
+        query = _FILTERED_PHOTOS_COUNT_SQL[(filter_type, bool(search_term))]
+        params = [f"%{search_term}%"] * _PHOTO_SEARCH_PARAM_COUNT if search_term else []
+        with self.get_db_read() as conn:
+            return conn.execute(query, params).fetchone()[0]
     
     def get_stats(self) -> Dict[str, int]:
-        """Get statistics – single aggregate query to avoid DB lock bursts"""
-        with self.get_db() as conn:
-            row = conn.execute('''
-                SELECT
-                    COUNT(CASE WHEN deleted_at IS NULL THEN 1 END)                   AS total,
-                    SUM(CASE WHEN user_action != 'saved' AND deleted_at IS NULL THEN 1 ELSE 0 END) AS needs_review,
-                    SUM(CASE WHEN user_action = 'saved'
-                              AND needs_date = 1 AND needs_location = 1 
-                              AND deleted_at IS NULL THEN 1 END)                     AS needs_both,
-                    SUM(CASE WHEN user_action = 'saved'
-                              AND needs_date = 1 AND needs_location = 0 
-                              AND deleted_at IS NULL THEN 1 END)                     AS needs_date,
-                    SUM(CASE WHEN user_action = 'saved'
-                              AND needs_date = 0 AND needs_location = 1 
-                              AND deleted_at IS NULL THEN 1 END)                     AS needs_location,
-                    SUM(CASE WHEN user_action = 'saved'
-                              AND needs_date = 0 AND needs_location = 0 
-                              AND deleted_at IS NULL THEN 1 END)                     AS complete,
-                    SUM(CASE WHEN user_action = 'skipped' 
-                              AND deleted_at IS NULL THEN 1 ELSE 0 END)              AS skipped
-                FROM photos
-            ''').fetchone()
-            return dict(row)
+        """Get statistics from one GROUP BY over idx_photos_stats_cover.
 
+        Live photos fall into at most a handful of (user_action, needs_date,
+        needs_location) groups, which are bucketed here instead of summing
+        seven CASE expressions over every row.
+        """
+        with self.get_db_read() as conn:
+            rows = conn.execute('''
+                SELECT user_action, needs_date, needs_location, COUNT(*)
+                FROM photos
+                WHERE deleted_at IS NULL
+                GROUP BY user_action, needs_date, needs_location
+            ''').fetchall()
+        
+        stats = dict.fromkeys(('total', 'needs_review', 'needs_both', 'needs_date',
+                               'needs_location', 'complete', 'skipped'), 0)
+        for user_action, needs_date, needs_location, count in rows:
+            stats['total'] += count
+            if user_action == 'saved':
+                if needs_date == 1 and needs_location == 1:
+                    stats['needs_both'] += count
+                elif needs_date == 1 and needs_location == 0:
+                    stats['needs_date'] += count
+                elif needs_date == 0 and needs_location == 1:
+                    stats['needs_location'] += count
+                elif needs_date == 0 and needs_location == 0:
+                    stats['complete'] += count
+            elif user_action is not None:
+                # NULL user_action counts towards total only, as it always has
+                stats['needs_review'] += count
+                if user_action == 'skipped':
+                    stats['skipped'] += count
+        return stats
+
+
+def _unix_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+def open_sqlite_connection(db_path: Path, read_only: bool = False,
+                           check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open a connection with the app's row factory and PRAGMAs"""
+    if read_only:
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=check_same_thread,
+                               cached_statements=SQLITE_STATEMENT_CACHE_SIZE)
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=check_same_thread,
+                               cached_statements=SQLITE_STATEMENT_CACHE_SIZE)
+        # Only takes effect on a brand-new file, and only before WAL is enabled
+        conn.execute("PRAGMA page_size=4096")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.row_factory = sqlite3.Row
+    # Timestamp for updated_at and the action times, in Unix milliseconds
+    conn.create_function("unix_ms", 0, _unix_ms)
+    conn.execute("PRAGMA busy_timeout=10000")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB (negative = KiB)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
 
 class ConnectionPool:
-    """Thread-local connection pool for SQLite with proper cleanup"""
+    """Thread-local read-only SQLite connections plus one shared writer
+
+    Each thread gets its own read-only connection (get_read_connection) -
+    under WAL readers see a consistent snapshot and never wait on a writer.
+    Every write goes through the single writer connection, serialised by
+    write_lock, so there is only ever one writer.
+    """
     def __init__(self, db_path: Path, pool_size: int = 8):
         self.db_path = db_path
         self.pool_size = pool_size
         self._local = threading.local()
         self._all_connections = []  # Track all connections for cleanup
         self._lock = threading.Lock()
+        # Bumped by close_idle_connections so other threads drop closed handles
+        self._generation = 0
+        self.write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
     
-    def get_connection(self):
-        """Get a connection for the current thread"""
-        if not hasattr(self._local, 'connection') or self._local.connection is None:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA busy_timeout=10000")
-            self._local.connection = conn
+    def _thread_connection(self, attr: str, read_only: bool) -> sqlite3.Connection:
+        conn, generation = getattr(self._local, attr, (None, -1))
+        if conn is None or generation != self._generation:
+            conn = open_sqlite_connection(self.db_path, read_only=read_only)
             
             # Track this connection (with hard cap)
             with self._lock:
+                setattr(self._local, attr, (conn, self._generation))
                 self._all_connections.append(conn)
                 # --- NEW: enforce max pool size ---
                 if len(self._all_connections) > self.pool_size:
@@ -2002,22 +2978,36 @@ class ConnectionPool:
                     except:
                         pass
                 # -----------------------------------
-                
-        return self._local.connection
+        return conn
+    
+    def get_read_connection(self):
+        """Get a read-only connection for the current thread"""
+        return self._thread_connection('reader', read_only=True)
+    
+    def get_write_connection(self):
+        """The shared writer connection; caller must hold write_lock"""
+        if self._writer is None:
+            self._writer = open_sqlite_connection(self.db_path, check_same_thread=False)
+            # Refresh planner statistics that have drifted, with each ANALYZE
+            # capped at ~400 rows so startup stays fast on large libraries
+            try:
+                self._writer.execute("PRAGMA optimize=0x10002")
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize skipped: {e}")
+        return self._writer
     
     def release_connection(self):
-        """Close and remove the connection held by the current thread"""
-        if hasattr(self._local, 'connection') and self._local.connection:
+        """Close and remove the connections held by the current thread"""
+        conn, _ = getattr(self._local, 'reader', (None, -1))
+        if conn is not None:
             try:
-                self._local.connection.close()
+                conn.close()
             except Exception:
                 pass
-            self._local.connection = None
+            self._local.reader = (None, -1)
     
     def close_idle_connections(self):
-        """Close connections that haven't been used recently"""
-        # For SQLite, we might want to close ALL connections periodically
-        # to allow WAL cleanup
+        """Close every pooled connection (shutdown; WAL upkeep is a checkpoint)"""
         with self._lock:
             for conn in self._all_connections:
                 try:
@@ -2025,10 +3015,26 @@ class ConnectionPool:
                 except:
                     pass
             self._all_connections.clear()
+            self._generation += 1
         
-        # Clear thread-local references
-        if hasattr(self._local, 'connection'):
-            self._local.connection = None
+        with self.write_lock:
+            # A thread nested inside its own write transaction keeps the writer
+            if self._writer is not None and not self._writer.in_transaction:
+                try:
+                    # Re-analyze tables this session's writes may have skewed
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.debug(f"PRAGMA optimize skipped: {e}")
+                try:
+                    # Readers are closed above, so this can fold and reset the WAL
+                    self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error as e:
+                    logger.debug(f"WAL checkpoint skipped: {e}")
+                try:
+                    self._writer.close()
+                except Exception:
+                    pass
+                self._writer = None
     
     def __del__(self):
         """Ensure connections are closed on shutdown"""
@@ -2039,13 +3045,25 @@ class ConnectionPool:
 # LOCATION MANAGER CLASS
 # ============================================================================
 
+_FTS_WORD_RE = re.compile(r"\w+")
+
+# Location queries select these columns in this order, so rows map onto
+# _LocationRow positionally instead of by per-column name lookups
+_LOCATION_COLUMNS = (
+    'id', 'city', 'state', 'landmark_name', 'street', 'gps_lat', 'gps_lon',
+    'country', 'country_code', 'postal_code', 'neighborhood', 'category',
+    'use_count', 'last_used',
+)
+_LOCATION_COLUMN_LIST = ', '.join(_LOCATION_COLUMNS)
+_LOCATION_JOIN_COLUMN_LIST = ', '.join(f'l.{c}' for c in _LOCATION_COLUMNS)
+_LocationRow = namedtuple('_LocationRow', _LOCATION_COLUMNS)
+
 class LocationManager:
     """Manages location search, caching, and usage tracking"""
     
     def __init__(self, db: 'PhotoDatabase'):
         self.db = db
-        self._frequent_cache = []
-        self._last_cache_update = 0
+        self.invalidate()
     
     def get_or_create_location(self, location: SmartLocation) -> int:
         # normalise nullable text fields once
@@ -2055,146 +3073,258 @@ class LocationManager:
         lat = location.gps_lat
         lon = location.gps_lon
 
-        with self.db.get_db() as conn:
-            result = conn.execute('''
-                SELECT id FROM locations 
-                WHERE city = ? AND state = ? 
-                AND IFNULL(country, '') = ?
-                AND IFNULL(landmark_name, '') = ?
-                AND IFNULL(street, '') = ?
-            ''', (location.city, location.state, country, landmark, street)).fetchone()
-            
-            if result:
-                # Update usage count will be handled separately
-                return result[0]
-            
-            cursor = conn.execute('''
+        # One statement against the UNIQUE key; the no-op DO UPDATE makes
+        # RETURNING yield the existing id. Usage is counted separately by
+        # increment_usage, only once the metadata write has succeeded.
+        with self.db.get_db_write() as conn:
+            row = conn.execute('''
                 INSERT INTO locations (
                     city, state, landmark_name, street, gps_lat, gps_lon,
                     country, country_code, postal_code, neighborhood, category
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(city, state, country, landmark_name, street)
+                DO UPDATE SET use_count = use_count
+                RETURNING id
             ''', (location.city, location.state, landmark, street, lat, lon,
-                location.country, location.country_code, location.postal_code,
-                location.neighborhood, location.category.name if location.category else 'POI'))
-            
-            row_id = cursor.lastrowid
-            assert row_id is not None
-            return row_id
+                country, location.country_code, location.postal_code,
+                location.neighborhood, location.category.name if location.category else 'POI')).fetchone()
+        self.invalidate()
+        return row[0]
     
     def increment_usage(self, location_id: int):
-        with self.db.get_db() as conn:
+        with self.db.get_db_write() as conn:
             conn.execute('''
                 UPDATE locations 
                 SET use_count = use_count + 1,
                     last_used = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (location_id,))
+        self.invalidate()
+    
+    def invalidate(self):
+        """Make the next get_frequent_locations re-read the shared cache"""
+        with LOCATION_CACHE_LOCK:
+            LOCATION_FREQUENT_CACHE['expiry'] = 0.0
     
     def get_frequent_locations(self, limit: int = 10) -> List[SmartLocation]:
-        self._update_cache()
-        return self._frequent_cache[:limit]
+        return self._update_cache()[:limit]
     
     def search_locations(self, query: str) -> List[SmartLocation]:
         if not query or len(query) < 2:
             return []
         
-        results = []
-        query_lower = query.lower()
-        
-        with self.db.get_db() as conn:
-            # Search across multiple fields since display_full is now computed
-            db_results = conn.execute('''
-                SELECT * FROM locations
-                WHERE city LIKE ? 
-                   OR state LIKE ? 
-                   OR landmark_name LIKE ? 
-                   OR street LIKE ?
-                   OR country LIKE ?
-                ORDER BY use_count DESC
-                LIMIT 10
-            ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%')).fetchall()
-            
-            for row in db_results:
-                results.append(self._row_to_location(row))
-        
-        return results
-    
-    def _update_cache(self):
+        with self.db.get_db_read() as conn:
+            if self.db.has_fts:
+                # Every word must prefix-match a word in some column; quoting
+                # keeps user input from being read as FTS5 query syntax
+                words = _FTS_WORD_RE.findall(query)
+                if not words:
+                    return []
+                db_results = conn.execute(f'''
+                    SELECT {_LOCATION_JOIN_COLUMN_LIST} FROM locations_fts f
+                    JOIN locations l ON l.id = f.rowid
+                    WHERE locations_fts MATCH ?
+                    ORDER BY l.use_count DESC
+                    LIMIT 10
+                ''', (' '.join(f'"{word}"*' for word in words),)).fetchall()
+            else:
+                # Search across multiple fields since display_full is now computed
+                db_results = conn.execute(f'''
+                    SELECT {_LOCATION_COLUMN_LIST} FROM locations
+                    WHERE city LIKE ? 
+                       OR state LIKE ? 
+                       OR landmark_name LIKE ? 
+                       OR street LIKE ?
+                       OR country LIKE ?
+                    ORDER BY use_count DESC
+                    LIMIT 10
+                ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%')).fetchall()
+        
+        return [self._row_to_location(row) for row in db_results]
+    
+    def _update_cache(self) -> List[SmartLocation]:
         # Only update if stale
         with LOCATION_CACHE_LOCK:
-            now = time.time()
-            if now - self._last_cache_update < 60:  # Cache for 60 seconds
-                return
+            now = time.monotonic()
+            if now < LOCATION_FREQUENT_CACHE['expiry']:
+                return LOCATION_FREQUENT_CACHE['value']
             
-            with self.db.get_db() as conn:
-                frequent = conn.execute('''
-                    SELECT * FROM locations
+            with self.db.get_db_read() as conn:
+                frequent = conn.execute(f'''
+                    SELECT {_LOCATION_COLUMN_LIST} FROM locations
                     ORDER BY use_count DESC, last_used DESC
                     LIMIT 20
                 ''').fetchall()
             
-            self._frequent_cache = [self._row_to_location(row) for row in frequent]
-            self._last_cache_update = now
+            LOCATION_FREQUENT_CACHE['value'] = [self._row_to_location(row) for row in frequent]
+            LOCATION_FREQUENT_CACHE['expiry'] = now + LOCATION_FREQUENT_TTL
+            return LOCATION_FREQUENT_CACHE['value']
     
     def _row_to_location(self, row) -> SmartLocation:
+        """Build a SmartLocation from a row selected as _LOCATION_COLUMN_LIST"""
+        loc = _LocationRow._make(row)
         return SmartLocation(
-            id=row['id'],
-            city=row['city'],
-            state=row['state'],
-            landmark_name=row['landmark_name'] if 'landmark_name' in row.keys() else '',
-            street=row['street'] if 'street' in row.keys() else '',
-            gps_lat=row['gps_lat'] if 'gps_lat' in row.keys() else None,
-            gps_lon=row['gps_lon'] if 'gps_lon' in row.keys() else None,
-            country=row['country'] if 'country' in row.keys() else '',
-            country_code=row['country_code'] if 'country_code' in row.keys() else '',
-            postal_code=row['postal_code'] if 'postal_code' in row.keys() else '',
-            neighborhood=row['neighborhood'] if 'neighborhood' in row.keys() else '',
-            category=Category[row['category']] if 'category' in row.keys() and row['category'] else None,
-            use_count=row['use_count'] if 'use_count' in row.keys() else 0,
-            last_used=datetime.fromisoformat(row['last_used']) if 'last_used' in row.keys() and row['last_used'] else None
+            id=loc.id,
+            city=loc.city,
+            state=loc.state,
+            landmark_name=loc.landmark_name,
+            street=loc.street,
+            gps_lat=loc.gps_lat,
+            gps_lon=loc.gps_lon,
+            country=loc.country,
+            country_code=loc.country_code,
+            postal_code=loc.postal_code,
+            neighborhood=loc.neighborhood,
+            category=Category[loc.category] if loc.category else None,
+            use_count=loc.use_count,
+            last_used=datetime.fromisoformat(loc.last_used) if loc.last_used else None
         )
 
 # ============================================================================
 # GAZETTEER CLASS
 # ============================================================================
 
+def _gazetteer_key(city: str, state: str) -> str:
+    """Lower-cased "state\x1fcity" key; one str per entry instead of a tuple
+    of two, and \x1f never occurs in a place name"""
+    key = f"{state}\x1f{city}"
+    # Already-lowercase input (most programmatic lookups) skips the copy
+    return key if key.islower() else key.lower()
+
+# Parsed gazetteer CSV (keys, proper names, timezones), rebuilt whenever the
+# CSV's mtime/size or GAZETTEER_CACHE_VERSION (bump on key format changes) differ
+GAZETTEER_CACHE_PATH = DATA_DIR / "gazetteer_cache.pkl"
+GAZETTEER_CACHE_VERSION = 1
+# Distinct coordinates from which the first parse spreads timezone lookups
+# over worker processes
+GAZETTEER_PARALLEL_MIN = 5000
+
+# Per-process TimezoneFinder for _resolve_timezones' workers
+_TZ_FINDER = None
+
+def _tz_worker_init():
+    """Load the timezone polygons once per worker process"""
+    global _TZ_FINDER
+    from timezonefinder import TimezoneFinder
+    _TZ_FINDER = TimezoneFinder(in_memory=True)
+
+def _tz_worker_batch(points: List[Tuple[float, float]]) -> List[Optional[str]]:
+    """timezone_at for a chunk of (lat, lon) points - runs in a worker process"""
+    return [_TZ_FINDER.timezone_at(lat=lat, lng=lon) for lat, lon in points]
+
 class Gazetteer:
     """City/State to GPS lookup with Apple geocoding integration"""
     
+    __slots__ = ('_data', '_proper_names', '_apple_cache_file', '_apple_cache_writer',
+                 '_apple_cache_lock', '_tf', '_tf_lock')
+    
     def __init__(self, csv_path: Path):
-        self._data = {}
-        self._proper_names = {}
-        self._apple_cache = {}
-        
-        # Load Apple cache first
-        self._load_apple_cache()
+        self._data: Dict[str, Tuple[float, float, Optional[str]]] = {}
+        self._proper_names: Dict[str, Tuple[str, str]] = {}
+        # Append handle for the Apple cache CSV, opened on the first new entry
+        self._apple_cache_file = None
+        self._apple_cache_writer = None
+        self._apple_cache_lock = threading.Lock()
+        # TimezoneFinder loads its polygon data once and is shared by the CSV
+        # parse and add_to_cache; built on first use (a cached CSV needs none)
+        self._tf = None
+        self._tf_lock = threading.Lock()
         
         # Load CSV data
         if not csv_path.exists():
             print(f"Gazetteer CSV not found: {csv_path}")
-            return
+        else:
+            try:
+                # Adopt the parsed dicts outright rather than re-inserting
+                # (and rehashing through every resize) 40k entries
+                self._data, self._proper_names = self._load_csv_cached(csv_path)
+                print(f"Loaded {len(self._data)} cities from CSV")
+                
+            except Exception as e:
+                print(f"Error loading gazetteer: {e}")
+        
+        # Apple cache last so geocoded entries win over the CSV's
+        self._load_apple_cache()
+    
+    def _load_csv_cached(self, csv_path: Path) -> Tuple[Dict, Dict]:
+        """CSV entries from the pickle side-cache, re-parsing when the CSV changed"""
+        st = csv_path.stat()
+        stamp = (GAZETTEER_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        try:
+            with open(GAZETTEER_CACHE_PATH, 'rb') as f:
+                cached_stamp, data, proper_names = pickle.load(f)
+            if cached_stamp == stamp:
+                return data, proper_names
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring gazetteer cache: {e}")
         
+        data, proper_names = self._parse_csv(csv_path)
         try:
-            tf = TimezoneFinder(in_memory=True)
-            
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    city = row['city_ascii']
-                    city_lower = city.lower()
-                    state = row['state_id']
-                    state_lower = state.lower()
-                    lat = float(row['lat'])
-                    lon = float(row['lng'])
-                    
-                    if tz := tf.timezone_at(lat=lat, lng=lon):
-                        self._data[(city_lower, state_lower)] = (lat, lon, tz)
-                        self._proper_names[(city_lower, state_lower)] = (city, state)
-            
-            print(f"Loaded {len(self._data)} cities from CSV")
-            
-        except Exception as e:
-            print(f"Error loading gazetteer: {e}")
+            tmp_path = GAZETTEER_CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((stamp, data, proper_names), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, GAZETTEER_CACHE_PATH)
+        except OSError as e:
+            logger.debug(f"Could not write gazetteer cache: {e}")
+        return data, proper_names
+    
+    def _parse_csv(self, csv_path: Path) -> Tuple[Dict, Dict]:
+        """Parse the gazetteer CSV and resolve every city's timezone"""
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return {}, {}
+            i_city, i_state, i_lat, i_lon = (header.index(name) for name in ('city_ascii', 'state_id', 'lat', 'lng'))
+            rows = [(row[i_city], row[i_state], float(row[i_lat]), float(row[i_lon]))
+                    for row in reader if row]
+        
+        # Look timezones up one 1-degree cell at a time so consecutive
+        # timezone_at calls reuse the polygons timezonefinder just touched;
+        # repeated coordinates are only looked up once
+        points = sorted({(lat, lon) for _, _, lat, lon in rows},
+                        key=lambda point: (point[1] // 1, point[0] // 1))
+        zones = dict(zip(points, self._resolve_timezones(points)))
+        
+        # Fill the dicts in file order so later rows still win
+        data: Dict[str, Tuple[float, float, Optional[str]]] = {}
+        proper_names: Dict[str, Tuple[str, str]] = {}
+        for city, state, lat, lon in rows:
+            if tz := zones[(lat, lon)]:
+                key = _gazetteer_key(city, state)
+                data[key] = (lat, lon, tz)
+                proper_names[key] = (city, state)
+        return data, proper_names
+    
+    def _resolve_timezones(self, points: List[Tuple[float, float]]) -> List[Optional[str]]:
+        """timezone_at for each (lat, lon), across worker processes for big inputs"""
+        workers = min(os.cpu_count() or 1, 8)
+        if len(points) >= GAZETTEER_PARALLEL_MIN and workers > 1:
+            # Contiguous chunks keep each worker's points geographically close
+            size = -(-len(points) // workers)
+            chunks = [points[i:i + size] for i in range(0, len(points), size)]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=len(chunks),
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_tz_worker_init
+                ) as pool:
+                    return [tz for batch in pool.map(_tz_worker_batch, chunks) for tz in batch]
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Parallel timezone lookup failed, continuing in-process: {e}")
+        
+        tf = self._timezone_finder()
+        return [tf.timezone_at(lat=lat, lng=lon) for lat, lon in points]
+    
+    def _timezone_finder(self):
+        """The shared TimezoneFinder, created on first use"""
+        with self._tf_lock:
+            if self._tf is None:
+                from timezonefinder import TimezoneFinder
+                self._tf = TimezoneFinder(in_memory=True)
+            return self._tf
     
     def _load_apple_cache(self):
         """Load Apple geocoding cache from disk"""
@@ -2203,180 +3333,270 @@ class Gazetteer:
             return
         
         try:
-            with open(cache_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    key = (row['city'].lower(), row['state'].lower())
-                    self._apple_cache[key] = (
-                        float(row['lat']),
-                        float(row['lon']),
-                        row.get('tz')
-                    )
-                    self._data[key] = self._apple_cache[key]
-                    self._proper_names[key] = (row['city'], row['state'])
-            
-            print(f"Loaded {len(self._apple_cache)} entries from Apple cache")
+            with open(cache_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    return
+                # Resolve column positions once instead of a dict per row
+                i_city, i_state, i_lat, i_lon = (header.index(name) for name in ('city', 'state', 'lat', 'lon'))
+                i_tz = header.index('tz') if 'tz' in header else None
+                rows = [row for row in reader if row]
+            
+            # Build the columns in bulk and merge them with one update() each
+            names = [(row[i_city], row[i_state]) for row in rows]
+            keys = [_gazetteer_key(city, state) for city, state in names]
+            zones = [row[i_tz] or None for row in rows] if i_tz is not None else [None] * len(rows)
+            self._data.update(zip(keys, zip(map(float, (row[i_lat] for row in rows)),
+                                            map(float, (row[i_lon] for row in rows)),
+                                            zones)))
+            self._proper_names.update(zip(keys, names))
+            
+            print(f"Loaded {len(rows)} entries from Apple cache")
         except Exception as e:
             logger.warning(f"Error loading Apple cache: {e}")
     
     def lookup(self, city: str, state: str) -> Optional[Tuple[float, float, str]]:
         """Lookup GPS coordinates"""
-        if not city or not state:
+        if not city or not state or city.isspace() or state.isspace():
             return None
-        return self._data.get((city.lower(), state.lower()))
+        return self._data.get(_gazetteer_key(city, state))
     
     def get_proper_name(self, city: str, state: str) -> Optional[Tuple[str, str]]:
         """Get proper capitalization for city and state"""
-        if not city or not state:
+        if not city or not state or city.isspace() or state.isspace():
             return None
-        return self._proper_names.get((city.lower(), state.lower()))
+        return self._proper_names.get(_gazetteer_key(city, state))
     
     def add_to_cache(self, city: str, state: str, lat: float, lon: float, tz: Optional[str] = None):
         """Add a new entry to the cache"""
-        key = (city.lower(), state.lower())
+        key = _gazetteer_key(city, state)
         if tz is None:
-            tf = TimezoneFinder(in_memory=True)
-            tz = tf.timezone_at(lat=lat, lng=lon)
+            tz = self._timezone_finder().timezone_at(lat=lat, lng=lon)
         
         # Add to memory caches
         self._data[key] = (lat, lon, tz)
-        self._apple_cache[key] = (lat, lon, tz)
         self._proper_names[key] = (city, state)
         
         # Persist to Apple cache CSV
         self._append_to_apple_cache(city, state, lat, lon, tz)
     
     def _append_to_apple_cache(self, city: str, state: str, lat: float, lon: float, tz: Optional[str]):
-        """Append a new entry to the Apple cache CSV"""
-        cache_path = DATA_DIR / "apple_geocode_cache.csv"
-        
-        # Create with headers if doesn't exist
-        if not cache_path.exists():
-            with open(cache_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['city', 'state', 'lat', 'lon', 'tz'])
-        
-        # Append new entry
-        with open(cache_path, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([city, state, lat, lon, tz or ''])
+        """Append a new entry to the Apple cache CSV through one long-lived handle"""
+        with self._apple_cache_lock:
+            if self._apple_cache_writer is None:
+                cache_path = DATA_DIR / "apple_geocode_cache.csv"
+                # Create with headers if doesn't exist
+                is_new = not cache_path.exists()
+                self._apple_cache_file = open(cache_path, 'a', newline='', buffering=1 << 16)
+                self._apple_cache_writer = csv.writer(self._apple_cache_file)
+                if is_new:
+                    self._apple_cache_writer.writerow(['city', 'state', 'lat', 'lon', 'tz'])
+            
+            # Append new entry; one write per entry instead of open/write/close
+            self._apple_cache_writer.writerow([city, state, lat, lon, tz or ''])
+            self._apple_cache_file.flush()
+    
+    def close(self):
+        """Close the Apple cache CSV handle"""
+        with self._apple_cache_lock:
+            if self._apple_cache_file is not None:
+                try:
+                    self._apple_cache_file.close()
+                except OSError as e:
+                    logger.warning(f"Error closing Apple cache: {e}")
+                self._apple_cache_file = None
+                self._apple_cache_writer = None
 
 # ============================================================================
 # APPLE GEOCODING FUNCTIONS
 # ============================================================================
 
-def _cooldown():
-    """Enforce 1 request per second rate limit for Apple APIs"""
-    global _last_api_call
-    wait = 1.0 - (time.time() - _last_api_call)
-    if wait > 0:
+# Apple geocoding concurrency limit - requests run concurrently on the main
+# run loop, the semaphore caps how many are in flight at once
+_GEOCODE_SLOTS = threading.BoundedSemaphore(10)
+_GEOCODE_TIMEOUT = 5.0
+
+# Token bucket for Apple's rate limit - searches may start in a burst of up
+# to _GEOCODE_BURST, but the sustained start rate stays at _GEOCODE_RATE/s
+_GEOCODE_RATE = 1.0
+_GEOCODE_BURST = 4
+_geocode_bucket = {'tokens': float(_GEOCODE_BURST), 'stamp': time.monotonic()}
+_geocode_bucket_lock = threading.Lock()
+
+def _take_geocode_token():
+    """Block until the rate limiter lets another search start"""
+    while True:
+        with _geocode_bucket_lock:
+            now = time.monotonic()
+            tokens = min(_GEOCODE_BURST,
+                         _geocode_bucket['tokens'] + (now - _geocode_bucket['stamp']) * _GEOCODE_RATE)
+            _geocode_bucket['stamp'] = now
+            if tokens >= 1.0:
+                _geocode_bucket['tokens'] = tokens - 1.0
+                return
+            _geocode_bucket['tokens'] = tokens
+            wait = (1.0 - tokens) / _GEOCODE_RATE
         time.sleep(wait)
-    _last_api_call = time.time()
 
-def _run_on_main_thread(func, *args, **kwargs):
-    """Execute *func* on the macOS main thread and return its result."""
-    if NSThread.isMainThread():
-        return func(*args, **kwargs)
+# Query -> result LRU for _geocode_location, persisted between runs so
+# re-processed libraries don't repeat rate-limited searches. Only successful
+# lookups are kept; errors and timeouts are retried next time.
+GEOCODE_CACHE_PATH = DATA_DIR / "mklocalsearch_cache.json"
+GEOCODE_CACHE_SIZE = 4096
+_GEOCODE_WS_RE = re.compile(r'\s+')
+_geocode_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_geocode_cache_lock = threading.Lock()
+_geocode_cache_state = {'loaded': False, 'dirty': False}
+
+def _geocode_cache_key(query: str) -> str:
+    """Normalise a query so spacing and case variants share an entry"""
+    return _GEOCODE_WS_RE.sub(' ', query.strip()).casefold()
+
+def _load_geocode_cache():
+    """Read the persisted geocode cache once (caller holds the lock)"""
+    _geocode_cache_state['loaded'] = True
+    try:
+        entries = orjson.loads(GEOCODE_CACHE_PATH.read_bytes())
+    except FileNotFoundError:
+        return
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable geocode cache: {e}")
+        return
+    for key, result in entries[-GEOCODE_CACHE_SIZE:]:
+        _geocode_cache[key] = result
+
+def save_geocode_cache():
+    """Write the geocode cache back to disk if it changed"""
+    with _geocode_cache_lock:
+        if not _geocode_cache_state['dirty']:
+            return
+        payload = orjson.dumps(list(_geocode_cache.items()))
+        _geocode_cache_state['dirty'] = False
+    tmp_path = GEOCODE_CACHE_PATH.with_suffix('.tmp')
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, GEOCODE_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not save geocode cache: {e}")
+
+def _map_item_to_result(item, query: str) -> Dict[str, Any]:
+    """Extract all available location data from an MKMapItem"""
+    pm = item.placemark()
+    
+    # Get landmark name if available
+    landmark = ""
+    if hasattr(item, 'name') and item.name():
+        landmark = item.name()
+    elif not pm.locality() and not pm.administrativeArea():
+        # If no city/state, this might be a POI search, use query as landmark
+        landmark = query
+    
+    return {
+        'lat': pm.coordinate().latitude,
+        'lon': pm.coordinate().longitude,
+        'city': pm.locality() or "",
+        'state': pm.administrativeArea() or "",
+        'country': pm.country() or "",
+        'country_code': pm.ISOcountryCode() or "",
+        'street_number': pm.subThoroughfare() or "",
+        'street_name': pm.thoroughfare() or "",
+        'street': f"{pm.subThoroughfare() or ''} {pm.thoroughfare() or ''}".strip(),
+        'postal_code': pm.postalCode() or "",
+        'neighborhood': pm.subLocality() or "",
+        'county': pm.subAdministrativeArea() or "",
+        'ocean': pm.ocean() if hasattr(pm, 'ocean') else "",
+        'water': pm.inlandWater() if hasattr(pm, 'inlandWater') else "",
+        'landmark_name': landmark,
+        'query': query
+    }
+
+def _geocode_location(query: str) -> Optional[Dict[str, Any]]:
+    """
+    Unified geocoding function using MKLocalSearch for both addresses and POIs.
+    Returns: Dictionary with all available location data
+    
+    The search is started on the main run loop and its completion handler
+    signals a per-request Event, so callers on different threads geocode
+    concurrently instead of queueing behind one another.
+    """
+    key = _geocode_cache_key(query)
+    with _geocode_cache_lock:
+        if not _geocode_cache_state['loaded']:
+            _load_geocode_cache()
+        cached = _geocode_cache.get(key)
+        if cached is not None:
+            _geocode_cache.move_to_end(key)
+            return dict(cached)
+    
+    if not _load_mapkit():
+        logger.warning(f"MKLocalSearch not available for query: {query}")
+        return None
     
-    result_holder = {}
-    exception_holder = {}
     done = threading.Event()
-
-    def _wrapper():
+    slot: Dict[str, Any] = {'result': None, 'search': None, 'pumping': False}
+    
+    def handler(response, error):
         try:
-            result_holder["value"] = func(*args, **kwargs)
+            if error:
+                logger.warning(f"MKLocalSearch error for '{query}': {error}")
+            elif response and response.mapItems().count() > 0:
+                slot['result'] = _map_item_to_result(response.mapItems()[0], query)
         except Exception as e:
-            logger.error(f"Exception in {func.__name__} on main thread: {e}")
-            exception_holder["error"] = e
+            logger.error(f"MKLocalSearch exception for '{query}': {e}")
         finally:
             done.set()
-
-    AppHelper.callAfter(_wrapper)
-    
-    if not done.wait(timeout=10.0):
-        logger.error(f"Timeout waiting for {func.__name__} to complete on main thread")
-        raise TimeoutError(f"Main thread execution of {func.__name__} timed out")
-    
-    if "error" in exception_holder:
-        raise exception_holder["error"]
+            if slot['pumping']:
+                CFRunLoopStop(CFRunLoopGetMain())
     
-    return result_holder.get("value")
-
-def _geocode_location(query: str) -> Optional[Dict[str, Any]]:
-    """
-    Unified geocoding function using MKLocalSearch for both addresses and POIs.
-    Returns: Dictionary with all available location data
-    """
-    def _impl() -> Optional[Dict[str, Any]]:
-        if not _mk_local_search_available:
-            logger.warning(f"MKLocalSearch not available for query: {query}")
-            return None
-            
-        _cooldown()
+    def _start():
         try:
-            # Create search request
             assert MKLocalSearchRequest is not None
             assert MKLocalSearch is not None
             req = MKLocalSearchRequest.alloc().init()
             req.setNaturalLanguageQuery_(query)
-            
-            # Create and start search
-            search = MKLocalSearch.alloc().initWithRequest_(req)
-            finished, result = False, None
-            
-            def handler(response, error):
-                nonlocal finished, result
-                if error:
-                    logger.warning(f"MKLocalSearch error for '{query}': {error}")
-                elif response and response.mapItems().count() > 0:
-                    item = response.mapItems()[0]
-                    pm = item.placemark()
-                    
-                    # Get landmark name if available
-                    landmark = ""
-                    if hasattr(item, 'name') and item.name():
-                        landmark = item.name()
-                    elif not pm.locality() and not pm.administrativeArea():
-                        # If no city/state, this might be a POI search, use query as landmark
-                        landmark = query
-                    
-                    # Extract ALL available data from MKPlacemark
-                    result = {
-                        'lat': pm.coordinate().latitude,
-                        'lon': pm.coordinate().longitude,
-                        'city': pm.locality() or "",
-                        'state': pm.administrativeArea() or "",
-                        'country': pm.country() or "",
-                        'country_code': pm.ISOcountryCode() or "",
-                        'street_number': pm.subThoroughfare() or "",
-                        'street_name': pm.thoroughfare() or "",
-                        'street': f"{pm.subThoroughfare() or ''} {pm.thoroughfare() or ''}".strip(),
-                        'postal_code': pm.postalCode() or "",
-                        'neighborhood': pm.subLocality() or "",
-                        'county': pm.subAdministrativeArea() or "",
-                        'ocean': pm.ocean() if hasattr(pm, 'ocean') else "",
-                        'water': pm.inlandWater() if hasattr(pm, 'inlandWater') else "",
-                        'landmark_name': landmark,
-                        'query': query
-                    }
-                finished = True
-            
-            search.startWithCompletionHandler_(handler)
-            
-            # Wait for completion
-            start = time.time()
-            while not finished and time.time() - start < 5.0:
-                NSRunLoop.currentRunLoop().runUntilDate_(
-                    NSDate.dateWithTimeIntervalSinceNow_(0.05)
-                )
-            
-            return result
-            
+            # Keep a reference so the search isn't deallocated mid-flight
+            slot['search'] = MKLocalSearch.alloc().initWithRequest_(req)
+            slot['search'].startWithCompletionHandler_(handler)
         except Exception as e:
             logger.error(f"MKLocalSearch exception for '{query}': {e}")
-            return None
+            done.set()
     
-    return _run_on_main_thread(_impl)
+    with _GEOCODE_SLOTS:
+        _take_geocode_token()
+        if NSThread.isMainThread():
+            # No event loop to hand off to (e.g. --test): run it ourselves.
+            # The run loop sleeps until a source fires and the handler stops
+            # it, rather than waking every few ms to poll the Event.
+            slot['pumping'] = True
+            _start()
+            deadline = time.monotonic() + _GEOCODE_TIMEOUT
+            while not done.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or CFRunLoopRunInMode(
+                    kCFRunLoopDefaultMode, remaining, False
+                ) == kCFRunLoopRunFinished:
+                    break
+            slot['pumping'] = False
+        else:
+            AppHelper.callAfter(_start)
+            done.wait(_GEOCODE_TIMEOUT)
+    
+    if not done.is_set():
+        logger.warning(f"MKLocalSearch timed out for '{query}'")
+        search = slot['search']
+        if search is not None:
+            AppHelper.callAfter(search.cancel)
+    
+    result = slot['result']
+    if result is not None:
+        with _geocode_cache_lock:
+            _geocode_cache[key] = dict(result)
+            _geocode_cache.move_to_end(key)
+            while len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+                _geocode_cache.popitem(last=False)
+            _geocode_cache_state['dirty'] = True
+    return result
 
 # ============================================================================
 # PHOTOPIPELINE CLASS
@@ -2477,25 +3697,28 @@ class PhotoPipeline:
             key_path.chmod(0o600)
     
     @contextmanager
-    def get_db(self):
-        """Get database connection via injected database instance"""
-        with self.database.get_db() as conn:
+    def get_db_read(self):
+        """Read-only connection via injected database instance; writes go
+        through _execute_write / _db_write"""
+        with self.database.get_db_read() as conn:
             yield conn
 
-    def _queue_db_write(self, sql: str, params: tuple) -> Future:
-        """Queue a database write operation"""
-        future = Future()
-
+    def _db_write(self, operation):
+        """Run a write operation while holding the database write lock"""
+        with self.database.write_lock:
+            return operation()
+    
+    def _execute_write(self, sql: str, params: tuple) -> int:
+        """Execute a single write statement, return the rowcount"""
         def operation():
-            with self.database.get_db() as conn:
+            with self.database.get_db_write() as conn:
                 return conn.execute(sql, params).rowcount
         
-        STATE.db_queue.put((operation, future))
-        return future
+        return self._db_write(operation)
     
     def get_pending_batches(self) -> List[str]:
         """Get list of pending batch IDs"""
-        with self.get_db() as conn:
+        with self.get_db_read() as conn:
             rows = conn.execute('''
                 SELECT DISTINCT ps.batch_id 
                 FROM pipeline_status ps
@@ -2517,7 +3740,7 @@ class PhotoPipeline:
         if STATE.pipeline_cancelled:
             raise PipelineError("Pipeline cancelled by user")
             
-        with self.get_db() as conn:
+        with self.get_db_read() as conn:
             # Validate batch exists
             batch_exists = conn.execute(
                 'SELECT 1 FROM pipeline_status WHERE batch_id = ?',
@@ -2599,17 +3822,17 @@ class PhotoPipeline:
                 filepath, filename, file_hash, 
                 file_last_modified, original_scan_time,
                 needs_date, needs_location, ready_for_review,
-                user_action
-            ) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, 1, 1, 1, 'none')
+                user_action, updated_at
+            ) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, 1, 1, 1, 'none', unix_ms())
             ON CONFLICT(filepath) DO UPDATE SET
                 file_hash = excluded.file_hash,
-                file_last_modified = excluded.file_last_modified
+                file_last_modified = excluded.file_last_modified,
+                updated_at = unix_ms()
         '''
         params = (normalized_path, path.name, file_hash, file_mtime)
         
-        future = self._queue_db_write(sql, params)
         try:
-            rowcount = future.result(timeout=30)
+            rowcount = self._execute_write(sql, params)
             if rowcount > 0:
                 self._emit_event({
                     'type': 'status',
@@ -2626,10 +3849,16 @@ class PhotoPipeline:
         """Mark a photo as having an error"""
         # Update queue status
         sql1 = 'UPDATE pipeline_queue SET status = \'error\' WHERE id = ?'
-        future1 = self._queue_db_write(sql1, (queue_id,))
+        try:
+            self._execute_write(sql1, (queue_id,))
+        except Exception as e:
+            self._emit_event({
+                'type': 'error',
+                'message': f'Failed to record error: {e}'
+            })
         
         # Get filepath for error tracking - this is a read, can be direct
-        with self.get_db() as conn:
+        with self.get_db_read() as conn:
             result = conn.execute(
                 'SELECT filepath, batch_id FROM pipeline_queue WHERE id = ?',
                 (queue_id,)
@@ -2643,12 +3872,8 @@ class PhotoPipeline:
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
             '''
             params2 = (result['filepath'], result['batch_id'], error_type, error_msg)
-            future2 = self._queue_db_write(sql2, params2)
-            
-            # Wait for both writes
             try:
-                future1.result(timeout=30)
-                future2.result(timeout=30)
+                self._execute_write(sql2, params2)
             except Exception as e:
                 self._emit_event({
                     'type': 'error',
@@ -2692,6 +3917,8 @@ class PhotoPipeline:
         })
         
         try:
+            from wakeonlan import send_magic_packet
+            
             # Send multiple packets to ensure delivery
             for _ in range(3):
                 if STATE.pipeline_cancelled:
@@ -2749,6 +3976,8 @@ class PhotoPipeline:
         
         key_path = os.path.expanduser(self.config['mac_b']['ssh_key_path'])
         
+        import paramiko
+        
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         
@@ -2762,6 +3991,14 @@ class PhotoPipeline:
                 banner_timeout=5,
                 auth_timeout=5
             )
+            # Widen the flow-control window and rekey less often so SFTP
+            # uploads over the LAN aren't throttled by paramiko's defaults.
+            # Channels opened after this (e.g. open_sftp) pick these up.
+            transport = ssh.get_transport()
+            if transport is not None:
+                transport.default_window_size = 4 * 1024 * 1024
+                transport.packetizer.REKEY_BYTES = pow(2, 40)
+                transport.packetizer.REKEY_PACKETS = pow(2, 40)
             connected = True
             self._ssh_connections.append(ssh)
             STATE.pipeline_ssh_connections.append(ssh)  # Track in STATE for cleanup
@@ -3086,7 +4323,9 @@ class PhotoPipeline:
                             last_progress = percent
                     
                     try:
-                        sftp.put(str(local_path), remote_path, callback=progress_callback)
+                        # confirm=False skips the post-upload stat round-trip; a
+                        # short remote file is caught by the resume check above
+                        sftp.put(str(local_path), remote_path, callback=progress_callback, confirm=False)
                         
                         transferred.append({
                             'queue_id': file_info['queue_id'],
@@ -3311,12 +4550,13 @@ class PhotoPipeline:
             
             # Queue updates
             def update_photo(path=normalized_path, batch=batch_id, orig=original_path):
-                with database.get_db() as conn:
+                with database.get_db_write() as conn:
                     # Try normalized path first
                     result = conn.execute('''
                         UPDATE photos SET 
                             import_batch_id = ?,
-                            imported_at = CURRENT_TIMESTAMP
+                            imported_at = CURRENT_TIMESTAMP,
+                            updated_at = unix_ms()
                         WHERE filepath = ?
                     ''', (batch, path))
                     
@@ -3325,7 +4565,8 @@ class PhotoPipeline:
                         result = conn.execute('''
                             UPDATE photos SET 
                                 import_batch_id = ?,
-                                imported_at = CURRENT_TIMESTAMP
+                                imported_at = CURRENT_TIMESTAMP,
+                                updated_at = unix_ms()
                             WHERE filepath = ?
                         ''', (batch, orig))
                     
@@ -3338,14 +4579,12 @@ class PhotoPipeline:
                     
                     return result.rowcount > 0
             
-            future = Future()
-            STATE.db_queue.put((update_photo, future))
-            operations.append((file_info, future))
+            operations.append((file_info, update_photo))
         
-        # Wait for all operations
-        for file_info, future in operations:
+        # Run all updates
+        for file_info, update_photo in operations:
             try:
-                if future.result(timeout=30):
+                if self._db_write(update_photo):
                     successful_imports += 1
                     self._emit_event({
                         'type': 'status',
@@ -3365,7 +4604,7 @@ class PhotoPipeline:
         
         # Update batch status
         def update_batch_status():
-            with database.get_db() as conn:
+            with database.get_db_write() as conn:
                 if successful_imports == len(imported_files):
                     status = 'complete'
                     error_msg = None
@@ -3384,9 +4623,7 @@ class PhotoPipeline:
                     WHERE batch_id = ?
                 ''', (status, error_msg, batch_id))
         
-        future = Future()
-        STATE.db_queue.put((update_batch_status, future))
-        future.result(timeout=30)
+        self._db_write(update_batch_status)
         
         self._emit_event({
             'type': 'status',
@@ -3662,7 +4899,7 @@ class PhotoPipeline:
             
             # Update batch status
             def update_status():
-                with database.get_db() as conn:
+                with database.get_db_write() as conn:
                     conn.execute('''
                         UPDATE pipeline_status 
                         SET status = 'processing',
@@ -3673,9 +4910,7 @@ class PhotoPipeline:
                         WHERE batch_id = ?
                     ''', (batch_id,))
             
-            future = Future()
-            STATE.db_queue.put((update_status, future))
-            future.result(timeout=30)
+            self._db_write(update_status)
             
             # Process steps
             self._emit_event({
@@ -3769,7 +5004,7 @@ class PhotoPipeline:
             
             # Update batch status
             def update_failed():
-                with database.get_db() as conn:
+                with database.get_db_write() as conn:
                     conn.execute('''
                         UPDATE pipeline_status 
                         SET status = 'failed',
@@ -3778,11 +5013,9 @@ class PhotoPipeline:
                         WHERE batch_id = ?
                     ''', (str(e), batch_id))
             
-            future = Future()
-            STATE.db_queue.put((update_failed, future))
             try:
-                future.result(timeout=30)
-            except:
+                self._db_write(update_failed)
+            except Exception:
                 pass
             
             # Cleanup staging if exists
@@ -3937,6 +5170,135 @@ def setup_exiftool() -> bool:
     
     return False
 
+# Longest a single ExifTool command may take before its daemon is killed
+EXIFTOOL_COMMAND_TIMEOUT = 120.0
+
+class ExifToolDaemon:
+    """Persistent ExifTool process driven through -stay_open
+
+    Avoids paying Perl startup (100-300ms) on every read/write. Commands are
+    streamed over stdin as an argfile; each one is terminated by -executeN and
+    ExifTool answers with {readyN} on stdout (and on stderr via -echo4).
+    Both pipes are drained together, so a command that writes a lot of
+    warnings can't fill stderr and stall ExifTool before its stdout sentinel.
+    """
+    
+    def __init__(self, exiftool_path: Path):
+        self.proc = subprocess.Popen(
+            [str(exiftool_path), "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        self._seq = 0
+    
+    def is_alive(self) -> bool:
+        return self.proc.poll() is None
+    
+    def _read_both_until(self, sentinel: bytes, timeout: float) -> Tuple[bytes, bytes]:
+        """Read stdout and stderr until each ends with sentinel.
+
+        Kills the process and raises TimeoutError past the deadline.
+        """
+        bufs = {self.proc.stdout.fileno(): bytearray(), self.proc.stderr.fileno(): bytearray()}
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as sel:
+            for fd in bufs:
+                sel.register(fd, selectors.EVENT_READ)
+            pending = len(bufs)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.kill()
+                    raise TimeoutError(f"ExifTool command timed out after {timeout:.0f}s")
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        raise RuntimeError("ExifTool daemon exited unexpectedly")
+                    buf = bufs[key.fd]
+                    buf.extend(chunk)
+                    if buf.endswith(sentinel):
+                        sel.unregister(key.fd)
+                        pending -= 1
+        out, err = (bytes(buf[:-len(sentinel)]) for buf in bufs.values())
+        return out, err
+    
+    def execute(self, args: List[str]) -> Tuple[str, str]:
+        """Run one command, return (stdout, stderr)"""
+        self._seq += 1
+        ready = f"{{ready{self._seq}}}"
+        # One argument per line - newlines inside values would split them
+        lines = [str(a).replace("\n", " ") for a in args]
+        lines += ["-echo4", ready, f"-execute{self._seq}"]
+        self.proc.stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.proc.stdin.flush()
+        
+        out, err = self._read_both_until(f"{ready}\n".encode(), EXIFTOOL_COMMAND_TIMEOUT)
+        return out.decode("utf-8", "replace"), err.decode("utf-8", "replace")
+    
+    def kill(self):
+        """Stop a hung daemon without waiting on it"""
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=5)
+        except Exception:
+            pass
+    
+    def close(self):
+        try:
+            if self.is_alive():
+                self.proc.stdin.write(b"-stay_open\nFalse\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+
+# Idle daemons - checked out per call so concurrency matches the calling threads
+_EXIFTOOL_IDLE: "queue.SimpleQueue[ExifToolDaemon]" = queue.SimpleQueue()
+_EXIFTOOL_ALL: List[ExifToolDaemon] = []
+_EXIFTOOL_ALL_LOCK = threading.Lock()
+
+def run_exiftool(args: List[str]) -> str:
+    """Run ExifTool (without the executable in args) on a pooled daemon
+
+    Raises subprocess.CalledProcessError when ExifTool reports an error, so
+    call sites keep the same handling they had with subprocess.run(check=True).
+    """
+    try:
+        daemon = _EXIFTOOL_IDLE.get_nowait()
+    except queue.Empty:
+        daemon = ExifToolDaemon(STATE.exiftool_path)
+        with _EXIFTOOL_ALL_LOCK:
+            _EXIFTOOL_ALL.append(daemon)
+    
+    try:
+        stdout, stderr = daemon.execute(args)
+    except Exception:
+        # Broken pipe / dead or hung (killed) process - drop it, the next call
+        # spawns a fresh one
+        daemon.close()
+        with _EXIFTOOL_ALL_LOCK:
+            if daemon in _EXIFTOOL_ALL:
+                _EXIFTOOL_ALL.remove(daemon)
+        raise
+    
+    _EXIFTOOL_IDLE.put(daemon)
+    
+    if any(line.startswith("Error") for line in stderr.splitlines()):
+        raise subprocess.CalledProcessError(1, ["exiftool", *args], stdout, stderr)
+    return stdout
+
+def stop_exiftool_daemons():
+    """Ask every ExifTool daemon to exit"""
+    with _EXIFTOOL_ALL_LOCK:
+        daemons = list(_EXIFTOOL_ALL)
+        _EXIFTOOL_ALL.clear()
+    for daemon in daemons:
+        daemon.close()
+
+atexit.register(stop_exiftool_daemons)
+
 # ============================================================================
 # METADATA READING
 # ============================================================================
@@ -3950,15 +5312,14 @@ def read_metadata_from_file(filepath: Path) -> Tuple[Optional[DateInfo], Optiona
     try:
         mtime = filepath.stat().st_mtime
         cache_key = f"{filepath}:{mtime}"
-        with METADATA_CACHE_LOCK:
-            if cache_key in METADATA_CACHE:
-                return METADATA_CACHE[cache_key]
+        cached = METADATA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
     except:
         pass
     
     try:
         cmd = [
-            str(STATE.exiftool_path),
             "-json",
             "-n",
             "-DateTimeOriginal",
@@ -3983,8 +5344,7 @@ def read_metadata_from_file(filepath: Path) -> Tuple[Optional[DateInfo], Optiona
             str(filepath)
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)[0]
+        data = orjson.loads(run_exiftool(cmd))[0]
         
         # Extract date
         date_info = None
@@ -4083,15 +5443,7 @@ def read_metadata_from_file(filepath: Path) -> Tuple[Optional[DateInfo], Optiona
         try:
             mtime = filepath.stat().st_mtime
             cache_key = f"{filepath}:{mtime}"
-            with METADATA_CACHE_LOCK:
-                METADATA_CACHE[cache_key] = result
-            
-            # Limit cache size
-            with METADATA_CACHE_LOCK:
-                if len(METADATA_CACHE) > METADATA_CACHE_SIZE:
-                    # Remove oldest entries
-                    for key in list(METADATA_CACHE.keys())[:20]:
-                        del METADATA_CACHE[key]
+            METADATA_CACHE.put(cache_key, result)
         except:
             pass
         
@@ -4142,7 +5494,7 @@ def write_metadata_to_file(filepath: Path, date_info: Optional[DateInfo],
         existing_user_keywords = [tag for tag in existing_tags 
                                  if tag not in [DATE_KEYWORD, LOCATION_KEYWORD]]
     
-    args = [str(STATE.exiftool_path), "-m", "-overwrite_original", "-use", "MWG"]
+    args = ["-m", "-overwrite_original", "-use", "MWG"]
     
     if preserve_camera:
         # CRITICAL: Copy all existing tags first
@@ -4289,7 +5641,7 @@ def write_metadata_to_file(filepath: Path, date_info: Optional[DateInfo],
     args.append(str(filepath))
     
     try:
-        result = subprocess.run(args, check=True, capture_output=True, text=True)
+        run_exiftool(args)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error writing metadata: {e}")
@@ -4317,7 +5669,7 @@ def write_metadata_to_files(filepaths: List[Path], date_info: Optional[DateInfo]
     
     # ExifTool supports batch operations with -@ to read file list from stdin
     # This is more efficient than multiple individual calls
-    args = [str(STATE.exiftool_path), "-m", "-overwrite_original", "-use", "MWG"]
+    args = ["-m", "-overwrite_original", "-use", "MWG"]
     
     # For batch operations, we'll apply the same metadata to all files
     # but need to handle preserve_camera on a per-file basis
@@ -4486,7 +5838,7 @@ def write_metadata_to_files(filepaths: List[Path], date_info: Optional[DateInfo]
                 single_args.append(str(fp))
                 
                 try:
-                    result = subprocess.run(single_args, check=True, capture_output=True, text=True)
+                    run_exiftool(single_args)
                     results[str(fp)] = True
                 except subprocess.CalledProcessError as e:
                     logger.error(f"Error writing metadata to {fp}: {e}")
@@ -4539,7 +5891,7 @@ def write_metadata_to_files(filepaths: List[Path], date_info: Optional[DateInfo]
                 single_args.append(str(fp))
                 
                 try:
-                    result = subprocess.run(single_args, check=True, capture_output=True, text=True)
+                    run_exiftool(single_args)
                     results[str(fp)] = True
                 except subprocess.CalledProcessError as e:
                     logger.error(f"Error writing metadata to {fp}: {e}")
@@ -4654,49 +6006,48 @@ def extract_location_from_filename(filename: str) -> Optional[LocationSuggestion
     # Fallback to regex parser
     return _extract_location_from_filename_regex(filename)
 
+# Compiled once for the regex location parser
+_TRAILING_SEQ_RE = re.compile(r"_[0-9]{3,4}$")
+
+# Common date patterns stripped before location matching (applied in order)
+# Patterns: Month_YYYY, DD_Month_YYYY, YYYY_MM_DD, etc.
+_LOCATION_DATE_STRIP_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"_(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*_\d{4}",
+    r"_\d{1,2}_(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*_\d{4}",
+    r"_\d{4}_\d{2}_\d{2}",
+    r"_\d{2}_\d{2}_\d{4}"
+))
+
+# Special cases with known proper capitalization: (pattern, city, state)
+_KNOWN_CITY_ABBREVIATIONS = (
+    (re.compile(r"(?:^|_)PBG_FL(?:_|$)", re.IGNORECASE), 'Palm Beach Gardens', 'FL'),
+    (re.compile(r"(?:^|_)ABQ_NM(?:_|$)", re.IGNORECASE), 'Albuquerque', 'NM'),
+)
+
 def _extract_location_from_filename_regex(filename: str) -> Optional[LocationSuggestion]:
     """Original regex-based location parser (backup)"""
     # Remove sequence numbers from end
-    s = re.sub(r"_[0-9]{3,4}$", "", Path(filename).stem)
+    s = _TRAILING_SEQ_RE.sub("", Path(filename).stem)
     
     # Remove common date patterns to avoid interference
-    # Patterns: Month_YYYY, DD_Month_YYYY, YYYY_MM_DD, etc.
-    date_patterns = [
-        r"_(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*_\d{4}",
-        r"_\d{1,2}_(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*_\d{4}",
-        r"_\d{4}_\d{2}_\d{2}",
-        r"_\d{2}_\d{2}_\d{4}"
-    ]
-    for pattern in date_patterns:
-        s = re.sub(pattern, "", s, flags=re.IGNORECASE)
+    for pattern in _LOCATION_DATE_STRIP_RES:
+        s = pattern.sub("", s)
     
     # Special cases with known proper capitalization
-    if re.search(r"(?:^|_)PBG_FL(?:_|$)", s, re.IGNORECASE):
-        return {
-            'city': 'Palm Beach Gardens',
-            'state': 'FL',
-            'country': '',
-            'is_complete': True,
-            'confidence': 85,
-            'primary_search': 'Palm Beach Gardens, FL',
-            'alternate_search': 'FL',
-            'location_type': 'city',
-            'reasoning': 'Recognized city abbreviation',
-            'landmark_name': ''
-        }
-    if re.search(r"(?:^|_)ABQ_NM(?:_|$)", s, re.IGNORECASE):
-        return {
-            'city': 'Albuquerque',
-            'state': 'NM',
-            'country': '',
-            'is_complete': True,
-            'confidence': 85,
-            'primary_search': 'Albuquerque, NM',
-            'alternate_search': 'NM',
-            'location_type': 'city',
-            'reasoning': 'Recognized city abbreviation',
-            'landmark_name': ''
-        }
+    for pattern, city, state in _KNOWN_CITY_ABBREVIATIONS:
+        if pattern.search(s):
+            return {
+                'city': city,
+                'state': state,
+                'country': '',
+                'is_complete': True,
+                'confidence': 85,
+                'primary_search': f'{city}, {state}',
+                'alternate_search': state,
+                'location_type': 'city',
+                'reasoning': 'Recognized city abbreviation',
+                'landmark_name': ''
+            }
     
     # Split into words and search from right to left (locations usually at end)
     words = s.split('_')
@@ -4714,7 +6065,7 @@ def _extract_location_from_filename_regex(filename: str) -> Optional[LocationSug
             potential_city = words[i-2]
             
             if (len(potential_state) == 2 and potential_state.upper() in US_STATES and
-                potential_country.lower() in COUNTRIES_LIST):
+                potential_country.lower() in COUNTRIES):
                 return {
                     'city': potential_city.title(),
                     'state': potential_state.upper(),
@@ -4733,9 +6084,9 @@ def _extract_location_from_filename_regex(filename: str) -> Optional[LocationSug
             potential_country = words[i]
             potential_city = words[i-1]
             
-            if potential_country.lower() in COUNTRIES_LIST:
+            if potential_country.lower() in COUNTRIES:
                 # Make sure the city isn't also a country (avoid France_France)
-                if potential_city.lower() not in COUNTRIES_LIST:
+                if potential_city.lower() not in COUNTRIES:
                     return {
                         'city': potential_city.title(),
                         'state': '',
@@ -4773,7 +6124,7 @@ def _extract_location_from_filename_regex(filename: str) -> Optional[LocationSug
         word = words[i]
         
         # Just a country
-        if word.lower() in COUNTRIES_LIST:
+        if word.lower() in COUNTRIES:
             return {
                 'city': '',
                 'state': '',
@@ -4823,68 +6174,140 @@ def _extract_location_from_filename_regex(filename: str) -> Optional[LocationSug
 # IMAGE PROCESSING - THUMBNAILS
 # ============================================================================
 
+def _generate_thumbnail_worker(path: str, max_size: Tuple[int, int]) -> bytes:
+    """Decode, resize and encode one thumbnail - runs in a worker process"""
+    # Worker processes import this module fresh, which registers the HEIF
+    # opener; registering again is a no-op but keeps the worker self-contained
+    pillow_heif.register_heif_opener()
+    
+    with Image.open(path) as img:
+        # BICUBIC with a reducing gap lets Pillow shrink by an integer
+        # factor first; visually identical to LANCZOS at thumbnail sizes.
+        img.thumbnail(max_size, Image.Resampling.BICUBIC, reducing_gap=2.0)
+        
+        if img.mode in ('RGBA', 'P'):
+            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+            rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = rgb_img
+        
+        buffer = BytesIO()
+        img.save(buffer, format='WEBP', quality=80, method=4)
+    return buffer.getvalue()
+
+# Process pool for the CPU-bound decode/resize/encode step. forkserver avoids
+# fork() after the Objective-C runtime (CoreLocation/MapKit) is initialised.
+_THUMB_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_THUMB_PROCESS_POOL_LOCK = threading.Lock()
+
+def _get_thumb_process_pool() -> ProcessPoolExecutor:
+    global _THUMB_PROCESS_POOL
+    with _THUMB_PROCESS_POOL_LOCK:
+        if _THUMB_PROCESS_POOL is None:
+            _THUMB_PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=max(1, min(THUMBNAIL_WORKERS, os.cpu_count() or 4)),
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _THUMB_PROCESS_POOL
+
+def shutdown_thumb_process_pool():
+    global _THUMB_PROCESS_POOL
+    with _THUMB_PROCESS_POOL_LOCK:
+        if _THUMB_PROCESS_POOL is not None:
+            _THUMB_PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+            _THUMB_PROCESS_POOL = None
+
+atexit.register(shutdown_thumb_process_pool)
+
+def _render_thumbnail(image_path: Path, max_size) -> bytes:
+    """Render a thumbnail in the process pool, in-thread if the pool is broken"""
+    try:
+        future = _get_thumb_process_pool().submit(
+            _generate_thumbnail_worker, str(image_path), tuple(max_size)
+        )
+        return future.result()
+    except BrokenProcessPool:
+        logger.warning("Thumbnail process pool broken, rendering in-thread")
+        shutdown_thumb_process_pool()
+        return _generate_thumbnail_worker(str(image_path), tuple(max_size))
+
+def _thumb_cache_path(image_path: Path, mtime_ns: int, max_size) -> Path:
+    """On-disk WebP thumbnail location for (path, mtime, size)"""
+    hashed = hashlib.blake2b(str(image_path).encode(), digest_size=8).hexdigest()
+    key = f"{mtime_ns}_{max_size[0]}x{max_size[1]}"
+    return THUMB_CACHE_DIR / hashed[:2] / f"{hashed}_{key}.webp"
+
+def trim_thumbnail_disk_cache(budget_mb: int = THUMBNAIL_DISK_CACHE_MB):
+    """Delete least recently used WebP thumbnails until the cache fits the budget"""
+    if not THUMB_CACHE_DIR.exists():
+        return
+    
+    entries = []
+    total = 0
+    for path in THUMB_CACHE_DIR.glob("*/*.webp"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    
+    budget = budget_mb * 1024 * 1024
+    if total <= budget:
+        return
+    
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            path.unlink()
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    logger.info(f"Trimmed {removed} thumbnails from disk cache")
+
 def create_thumbnail(image_path: Path, max_size=(800, 800)) -> Optional[str]:
     """Create base64 encoded thumbnail with persistent storage"""
     # Get file modification time
     try:
-        mtime = image_path.stat().st_mtime
+        st = image_path.stat()
     except:
         return None
+    mtime = st.st_mtime
     
     # Check memory cache first
     cache_key = f"{image_path}:{mtime}:{max_size[0]}x{max_size[1]}"
-    with THUMBNAIL_CACHE_LOCK:
-        if cache_key in THUMBNAIL_CACHE:
-            return THUMBNAIL_CACHE[cache_key]
-    
-    # Check database cache
-    if STATE.database:
-        size_str = f"{max_size[0]}x{max_size[1]}"
-        with STATE.database.get_db() as conn:
-            result = conn.execute('''
-                SELECT base64_data FROM thumbnails 
-                WHERE filepath = ? AND file_mtime = ? AND size = ?
-            ''', (str(image_path), mtime, size_str)).fetchone()
-            
-            if result:
-                # Found in DB, add to memory cache and return
-                THUMBNAIL_CACHE[cache_key] = result[0]
-                return result[0]
+    cached = THUMBNAIL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Check disk cache - avoids HEIF decode entirely on warm runs
+    cache_path = _thumb_cache_path(image_path, st.st_mtime_ns, max_size)
+    try:
+        result = base64.b64encode(cache_path.read_bytes()).decode()
+        os.utime(cache_path)  # Refresh mtime so the LRU trim keeps it
+        THUMBNAIL_CACHE.put(cache_key, result)
+        return result
+    except FileNotFoundError:
+        pass
     
     # Not in cache, generate it
     try:
-        with Image.open(image_path) as img:
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            
-            if img.mode in ('RGBA', 'P'):
-                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = rgb_img
-                        
-            buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=85)
-        
-        result = base64.b64encode(buffer.getvalue()).decode()
+        data = _render_thumbnail(image_path, max_size)
+        result = base64.b64encode(data).decode()
         
-        # Save to memory cache
-        with THUMBNAIL_CACHE_LOCK:
-            THUMBNAIL_CACHE[cache_key] = result
-        
-        # Save to database
-        if STATE.database:
-            size_str = f"{max_size[0]}x{max_size[1]}"
-            with STATE.database.get_db() as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO thumbnails (filepath, file_mtime, size, base64_data)
-                    VALUES (?, ?, ?, ?)
-                ''', (str(image_path), mtime, size_str, result))
+        # Save to memory cache (bounded, oldest entries evicted per stripe)
+        THUMBNAIL_CACHE.put(cache_key, result)
         
-        # Limit memory cache size
-        with THUMBNAIL_CACHE_LOCK:
-            if len(THUMBNAIL_CACHE) > THUMBNAIL_CACHE_SIZE:
-                # Remove oldest entries from memory only (keep in DB)
-                for key in list(THUMBNAIL_CACHE.keys())[:100]:
-                    del THUMBNAIL_CACHE[key]
+        # Save to disk cache (write-then-rename so readers never see a partial file)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write thumbnail cache {cache_path}: {e}")
         
         return result
         
@@ -4960,52 +6383,26 @@ def _build_photo_payload(
     llm_status = 'ready'
     
     # Check if we have cached results in memory
-    if filepath in LLM_PARSE_RESULTS and LLM_PARSE_RESULTS[filepath]['status'] == 'ready':
-        result = LLM_PARSE_RESULTS[filepath]['result']
+    cached_entry = _get_llm_result(filepath)
+    if cached_entry is not None and cached_entry['status'] == 'ready':
+        result = cached_entry['result']
         date_suggestion = result.get('date')
         location_suggestion = result.get('location')
     else:
         # Check database cache before queuing
         db_cached = False
         if USE_LLM_PARSER and STATE.filename_parser and _LLM_AVAILABLE:
-            with database.get_db() as conn:
-                row = conn.execute('''
-                    SELECT suggestion_filename, suggested_date_year, suggested_date_month,
-                           suggested_date_day, suggested_date_complete, suggested_location_primary,
-                           suggested_location_alternate, suggested_location_city, suggested_location_state,
-                           suggested_location_confidence, suggested_location_type, suggested_location_reasoning,
-                           suggested_location_landmark
-                    FROM photos WHERE filepath = ?
-                ''', (filepath,)).fetchone()
+            with database.get_db_read() as conn:
+                row = conn.execute(_SUGGESTION_SELECT_SQL, (filepath, photo_path.name)).fetchone()
                 
-                if row and row['suggestion_filename'] == photo_path.name:
+                if row:
                     # Found in database cache
-                    if row['suggested_date_year']:
-                        date_suggestion = {
-                            'year': row['suggested_date_year'],
-                            'month': row['suggested_date_month'],
-                            'day': row['suggested_date_day'],
-                            'is_complete': bool(row['suggested_date_complete'])
-                        }
-                    
-                    if row['suggested_location_primary']:
-                        location_suggestion = {
-                            'primary_search': row['suggested_location_primary'],
-                            'alternate_search': row['suggested_location_alternate'],
-                            'city': row['suggested_location_city'],
-                            'state': row['suggested_location_state'],
-                            'confidence': row['suggested_location_confidence'],
-                            'location_type': row['suggested_location_type'],
-                            'reasoning': row['suggested_location_reasoning'],
-                            'landmark_name': row['suggested_location_landmark'],
-                            'is_complete': row['suggested_location_confidence'] > 70 if row['suggested_location_confidence'] else False
-                        }
+                    cached_result = _suggestion_from_row(row)
+                    date_suggestion = cached_result['date']
+                    location_suggestion = cached_result['location']
                     
                     # Cache in memory for next time
-                    LLM_PARSE_RESULTS[filepath] = {
-                        'status': 'ready',
-                        'result': {'date': date_suggestion, 'location': location_suggestion}
-                    }
+                    _set_llm_result(filepath, {'status': 'ready', 'result': cached_result})
                     db_cached = True
         
         if not db_cached:
@@ -5016,7 +6413,7 @@ def _build_photo_payload(
                 location_suggestion = None  # Will trigger "Analyzing" in UI
                 
                 # Queue LLM parse with high priority
-                LLM_PARSE_QUEUE.put((1 if not MODEL_WARMED.is_set() else 0, filepath, 'all'))
+                request_parse(filepath, 1 if not MODEL_WARMED.is_set() else 0)
                 llm_status = 'pending'
             else:
                 # Only use regex if LLM is completely unavailable
@@ -5031,11 +6428,8 @@ def _build_photo_payload(
             for i in range(1, 3):  # Only next 2 photos, not 5
                 next_index = photo_index + i
                 if next_index < len(filtered):
-                    next_filepath = filtered[next_index]
-                    # Only queue if not already processed or queued
-                    if next_filepath not in LLM_PARSE_RESULTS:
-                        # Lower priority for pre-parsing
-                        LLM_PARSE_QUEUE.put((i, next_filepath, 'all'))
+                    # Lower priority for pre-parsing; skipped if already processed or queued
+                    request_parse(filtered[next_index], i)
         else:
             # Mark initial load complete for next time
             STATE._initial_load_complete = True
@@ -5094,7 +6488,7 @@ def _build_photo_payload(
         }
     
     # Add camera metadata info
-    with database.get_db() as conn:
+    with database.get_db_read() as conn:
         camera_row = conn.execute(
             'SELECT has_camera_metadata, original_make, original_model FROM photos WHERE filepath = ?',
             (filepath,)
@@ -5110,7 +6504,7 @@ def _build_photo_payload(
             response['has_camera_data'] = False
 
     # Add smart location if available
-    with database.get_db() as conn:
+    with database.get_db_read() as conn:
         photo_row = conn.execute(
             'SELECT location_id FROM photos WHERE filepath = ?', 
             (filepath,)
@@ -5118,7 +6512,7 @@ def _build_photo_payload(
         
         if photo_row and photo_row['location_id']:
             loc_row = conn.execute(
-                'SELECT * FROM locations WHERE id = ?',
+                f'SELECT {_LOCATION_COLUMN_LIST} FROM locations WHERE id = ?',
                 (photo_row['location_id'],)
             ).fetchone()
             
@@ -5142,7 +6536,7 @@ def _build_photo_payload(
     
     # Check import status separately
     try:
-        with database.get_db() as conn:
+        with database.get_db_read() as conn:
             import_check = conn.execute(
                 'SELECT imported_at FROM photos WHERE filepath = ?',
                 (filepath,)
@@ -5156,7 +6550,7 @@ def _build_photo_payload(
     
     # Check if photo has been saved
     try:
-        with database.get_db() as conn:
+        with database.get_db_read() as conn:
             saved_check = conn.execute(
                 'SELECT last_saved_at FROM photos WHERE filepath = ? OR filepath = ?',
                 (filepath, str(Path(filepath).resolve()))
@@ -5232,7 +6626,7 @@ def get_frequent_locations():
     location_manager = require_location_manager()
     limit = request.args.get('limit', 10, type=int)
     locations = location_manager.get_frequent_locations(limit)
-    return jsonify([loc.to_dict() for loc in locations])
+    return orjson_response([loc.to_dict() for loc in locations])
 
 @app.route('/api/locations/search', methods=['POST'])
 def search_locations():
@@ -5250,7 +6644,7 @@ def search_locations():
         category = Category.STATE
     elif query.lower() in STATE_NAME_TO_ABBR:
         category = Category.STATE
-    elif query.lower() in COUNTRIES_LIST:
+    elif query.lower() in COUNTRIES:
         category = Category.COUNTRY
     elif re.match(r"\d{1,5}\s+\w+", query):
         category = Category.ADDRESS
@@ -5258,7 +6652,7 @@ def search_locations():
         # Multi-part query - could be city,state or city,country
         if len(query_parts) == 2 and query_parts[1].upper() in US_STATES:
             category = Category.CITY  # US city
-        elif len(query_parts) >= 2 and query_parts[-1].lower() in COUNTRIES_LIST:
+        elif len(query_parts) >= 2 and query_parts[-1].lower() in COUNTRIES:
             category = Category.CITY  # International city
         else:
             category = Category.CITY  # Generic multi-part
@@ -5346,7 +6740,7 @@ def search_locations():
             seen.add(key)
             unique_results.append(r)
     
-    return jsonify([r.to_dict() for r in unique_results[:5]])
+    return orjson_response([r.to_dict() for r in unique_results[:5]])
 
 @app.route('/api/suggestions/<path:filepath>')
 def get_suggestions(filepath):
@@ -5357,33 +6751,11 @@ def get_suggestions(filepath):
         # Looks like an absolute path missing its leading slash (e.g., "Users/...")
         filepath = '/' + filepath
     
-    # Check if we have results
-    if filepath in LLM_PARSE_RESULTS:
-        status = LLM_PARSE_RESULTS[filepath]['status']
-        
-        if status == 'ready':
-            result = LLM_PARSE_RESULTS[filepath]['result']
-            
-            # Apply gazetteer correction to location if available
-            if result.get('location') and STATE.gazetteer:
-                loc = result['location']
-                if loc.get('city') and loc.get('state') and not loc.get('country'):
-                    proper_names = STATE.gazetteer.get_proper_name(loc['city'], loc['state'])
-                    if proper_names:
-                        loc['city'] = proper_names[0]
-            
-            return jsonify({
-                'status': 'ready',
-                'date_suggestion': result.get('date'),
-                'location_suggestion': result.get('location')
-            })
-        else:
-            return jsonify({'status': status})
-    else:
+    entry = _get_llm_result(filepath)
+    if entry is None:
         # Not in queue yet = enqueue a parse job and mark pending
-        LLM_PARSE_RESULTS[filepath] = {'status': 'pending', 'result': None}
-        # priority 0, parse_type "all" to match what /api/current uses
-        LLM_PARSE_QUEUE.put((0, filepath, 'all'))
+        entry = _PENDING
+        request_parse(filepath, 0)
 
         # --- Look-ahead pre-fetch: queue the next 3 photos ---------------------
         try:
@@ -5393,23 +6765,52 @@ def get_suggestions(filepath):
 
             # Queue photos idx+1 .. idx+3 (if any) at lower priority (1)
             for fp_n in filtered_list[idx + 1 : idx + 4]:
-                if fp_n not in LLM_PARSE_RESULTS:
-                    LLM_PARSE_RESULTS[fp_n] = {'status': 'pending', 'result': None}
-                    LLM_PARSE_QUEUE.put((1, fp_n, 'all'))     # lower priority
+                request_parse(fp_n, 1)     # lower priority
 
             # --- rolling window: keep exactly three photos ahead in the queue ---
             tail_idx = idx + 4
             if tail_idx < len(filtered_list):
                 tail_fp = filtered_list[tail_idx]
-                if tail_fp not in LLM_PARSE_RESULTS:
-                    LLM_PARSE_RESULTS[tail_fp] = {'status': 'pending', 'result': None}
-                    LLM_PARSE_QUEUE.put((1, tail_fp, 'all'))  # lower priority
+                request_parse(tail_fp, 1)  # lower priority
             # ---------------------------------------------------------------------
         except ValueError:
             # filepath not found in list (edge-case) - just ignore
             pass
         # -----------------------------------------------------------------------
-        return jsonify({'status': 'pending'})
+    
+    if entry['status'] in ('pending', 'processing'):
+        # Wait briefly on the parse future so a result that lands within one
+        # UI poll interval is returned now instead of on the next poll
+        future = _parse_future(filepath)
+        # Re-check after registering - the worker may have finished in between
+        latest = LLM_PARSE_RESULTS.get(filepath, entry)
+        if latest['status'] in ('pending', 'processing'):
+            try:
+                latest = future.result(timeout=LLM_SUGGESTION_WAIT)
+            except TimeoutError:
+                return jsonify({'status': latest['status']})
+        else:
+            _resolve_parse_future(filepath, latest)
+        entry = latest
+    
+    if entry['status'] == 'ready':
+        result = entry['result']
+        
+        # Apply gazetteer correction to location if available
+        if result.get('location') and STATE.gazetteer:
+            loc = result['location']
+            if loc.get('city') and loc.get('state') and not loc.get('country'):
+                proper_names = STATE.gazetteer.get_proper_name(loc['city'], loc['state'])
+                if proper_names:
+                    loc['city'] = proper_names[0]
+        
+        return jsonify({
+            'status': 'ready',
+            'date_suggestion': result.get('date'),
+            'location_suggestion': result.get('location')
+        })
+    
+    return jsonify({'status': entry['status']})
 
 # ============================================================================
 # METADATA SAVE/UPDATE ROUTES
@@ -5480,7 +6881,7 @@ def save_metadata():
     location_id = None
     
     # Get current location_id from database to preserve it
-    with database.get_db() as conn:
+    with database.get_db_read() as conn:
         current_photo = conn.execute(
             'SELECT location_id FROM photos WHERE filepath = ?',
             (filepath,)
@@ -5545,10 +6946,10 @@ def save_metadata():
         new_file_mtime = datetime.fromtimestamp(photo_path.stat().st_mtime).isoformat()
         
         # Update hash in database
-        with database.get_db() as conn:
+        with database.get_db_write() as conn:
             conn.execute('''
                 UPDATE photos 
-                SET file_hash = ?, file_last_modified = ?
+                SET file_hash = ?, file_last_modified = ?, updated_at = unix_ms()
                 WHERE filepath = ?
             ''', (new_file_hash, new_file_mtime, filepath))
         
@@ -5705,33 +7106,13 @@ def batch_save_metadata():
     success_count = 0
     error_count = 0
     
+    written = []
     for filepath in filepaths:
         photo_path_str = str(Path(filepath))
         
         if photo_path_str in write_results and write_results[photo_path_str]:
-            # Successfully wrote metadata to file, now update database
-            try:
-                database.save_photo_state(
-                    filepath,
-                    date_info,
-                    location_info,
-                    user_action='saved',
-                    location_id=location_id
-                )
-                
-                results.append({
-                    'filepath': filepath,
-                    'success': True
-                })
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Database update failed for {filepath}: {e}")
-                results.append({
-                    'filepath': filepath,
-                    'success': False,
-                    'error': f'Database update failed: {str(e)}'
-                })
-                error_count += 1
+            # Successfully wrote metadata to file; database updated below in one batch
+            written.append(filepath)
         else:
             # Failed to write metadata
             results.append({
@@ -5741,6 +7122,21 @@ def batch_save_metadata():
             })
             error_count += 1
     
+    try:
+        database.save_photo_states_bulk(
+            [(filepath, date_info, location_info, 'saved', location_id) for filepath in written]
+        )
+        results.extend({'filepath': filepath, 'success': True} for filepath in written)
+        success_count += len(written)
+    except Exception as e:
+        logger.error(f"Database update failed for {len(written)} photos: {e}")
+        results.extend({
+            'filepath': filepath,
+            'success': False,
+            'error': f'Database update failed: {str(e)}'
+        } for filepath in written)
+        error_count += len(written)
+    
     # Increment location usage if used
     if location_id and success_count > 0:
         # Increment by the number of successful saves
@@ -5774,11 +7170,12 @@ def skip_photo():
     
     if STATE.current_filepath and STATE.current_filepath in filtered_photos:
         # Track skip action
-        with database.get_db() as conn:
+        with database.get_db_write() as conn:
             conn.execute('''
                 UPDATE photos 
                 SET user_action = 'skipped',
-                    user_last_action_time = CURRENT_TIMESTAMP
+                    user_last_action_time = unix_ms(),
+                    updated_at = unix_ms()
                 WHERE filepath = ?
             ''', (STATE.current_filepath,))
         
@@ -5864,7 +7261,7 @@ def navigate():
     # Determine the photo's native filter (where it actually belongs)
     native_filter = None
     if effective_search:  # Only needed during search
-        with database.get_db() as conn:
+        with database.get_db_read() as conn:
             native_filter = determine_photo_filter(conn, STATE.current_filepath)
     
     return jsonify({
@@ -5893,7 +7290,7 @@ def select_photo():
         filtered = database.get_filtered_photos(STATE.current_filter, effective_search)
         if filepath not in filtered:
             # Determine photo's native filter
-            with database.get_db() as conn:
+            with database.get_db_read() as conn:
                 native_filter = determine_photo_filter(conn, filepath)
             
             if native_filter:
@@ -5933,21 +7330,21 @@ def get_grid_photos(filter_type):
         if filter_type not in valid_filters:
             return jsonify({'error': 'Invalid filter'}), 400
         
-        # Use the request-local search term when provided.
-        filtered_photos = database.get_filtered_photos(filter_type, effective_search)
-        
-        # Calculate pagination
-        total = len(filtered_photos)
-        start = (page - 1) * per_page
+        # Use the request-local search term when provided. Only this page's
+        # filepaths are read; the total comes from a COUNT(*)
+        total = database.count_filtered_photos(filter_type, effective_search)
+        start = max(page - 1, 0) * per_page
         end = min(start + per_page, total)
+        page_photos = database.get_filtered_photos(
+            filter_type, effective_search, limit=per_page, offset=start
+        )
         
         # Get photos for this page
         grid_data = []
         
         # Prepare photo data for parallel processing
         photo_batch = []
-        for index in range(start, end):
-            filepath = filtered_photos[index]
+        for index, filepath in enumerate(page_photos, start):
             photo_path = Path(filepath)
             photo_batch.append((index, filepath, photo_path))
         
@@ -5956,7 +7353,7 @@ def get_grid_photos(filter_type):
         def process_photo(photo_info):
             index, filepath, photo_path = photo_info
             # Each thread gets its own connection
-            with database.get_db() as conn:
+            with database.get_db_read() as conn:
                 row = conn.execute(
                     'SELECT imported_at, last_saved_at, user_action, needs_date, needs_location, deleted_at FROM photos WHERE filepath = ?',
                     (filepath,)
@@ -6164,7 +7561,7 @@ def check_import_status():
     filepaths = data.get('filepaths', [])
     
     results = []
-    with database.get_db() as conn:
+    with database.get_db_read() as conn:
         for filepath in filepaths:
             row = conn.execute(
                 'SELECT filepath, imported_at FROM photos WHERE filepath = ?',
@@ -6194,7 +7591,7 @@ def import_photos():
     batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Add to queue
-    with database.get_db() as conn:
+    with database.get_db_write() as conn:
         # Create batch record
         conn.execute('''
             INSERT INTO pipeline_status (batch_id, status, photo_count, started_at)
@@ -6258,7 +7655,7 @@ def get_pipeline_status():
     final_status = None
     exit_code = None
     if not is_running and STATE.pipeline_batch_id:
-        with database.get_db() as conn:
+        with database.get_db_read() as conn:
             batch = conn.execute(
                 'SELECT status FROM pipeline_status WHERE batch_id = ?',
                 (STATE.pipeline_batch_id,)
@@ -6343,7 +7740,7 @@ def get_pipeline_batch_status(batch_id):
     '''Get detailed status for a specific batch'''
     try:
         database = require_database()
-        with database.get_db() as conn:
+        with database.get_db_read() as conn:
             # Get batch info
             batch = conn.execute('''
                 SELECT ps.*,
@@ -6441,6 +7838,15 @@ def initialize_session(folder_path: str):
     # Initialize location manager
     STATE.location_manager = LocationManager(database)
     
+    # Fetch the LLM model while the library is scanned and thumbnailed
+    filename_parser = None
+    if USE_LLM_PARSER and _LLM_AVAILABLE:
+        try:
+            filename_parser = FilenameParser(cache_dir=DATA_DIR / ".llm_cache")
+            filename_parser.prefetch_model()
+        except Exception as e:
+            logger.error(f"Failed to initialize LLM parser: {e}")
+    
     # Find photos
     STATE.photos_list = sorted([
         f for f in STATE.working_dir.iterdir()
@@ -6454,10 +7860,10 @@ def initialize_session(folder_path: str):
     
     # ===== DETECT RENAMES AND HANDLE DELETIONS =====
     print("Checking for renamed or deleted files...")
-    with database.get_db() as conn:
-        # Get all current file paths
-        current_paths = {str(p): p for p in STATE.photos_list}
-        
+    # Get all current file paths
+    current_paths = {str(p): p for p in STATE.photos_list}
+    
+    with database.get_db_read() as conn:
         # Find database entries for files that no longer exist at their recorded path
         # Exclude already soft-deleted files
         all_db_photos = conn.execute('''
@@ -6467,96 +7873,107 @@ def initialize_session(folder_path: str):
             AND deleted_at IS NULL
         ''').fetchall()
         
-        missing_photos = []
-        existing_hashes = set()
-        
-        for row in all_db_photos:
-            if row['filepath'] in current_paths:
-                # File still exists at same path
-                existing_hashes.add(row['file_hash'])
-            else:
-                # File missing from original path
-                missing_photos.append(row)
-        
-        if missing_photos:
-            print(f"  Found {len(missing_photos)} missing files...")
-            rename_count = 0
-            
-            # Build a set of hashes we need to find
-            missing_hashes = {m['file_hash']: m for m in missing_photos}
-            
-            # Check each current file to see if it matches a missing hash
-            for current_path, photo_path in current_paths.items():
-                # Skip if we already know this file is in the database
-                if any(row['filepath'] == current_path for row in all_db_photos):
-                    continue
-                
-                try:
-                    # Calculate hash for potential rename
-                    file_hash = calculate_file_hash(photo_path)
-                    
-                    # Is this one of our missing files?
-                    if file_hash in missing_hashes and file_hash not in existing_hashes:
-                        missing = missing_hashes[file_hash]
-                        print(f"  Renamed: {missing['filename']} → {photo_path.name}")
-                        
-                        # Update the database with new path
-                        conn.execute('''
-                            UPDATE photos 
-                            SET filepath = ?, filename = ?
-                            WHERE file_hash = ? AND filepath = ?
-                        ''', (str(photo_path), photo_path.name, file_hash, missing['filepath']))
-                        
-                        # Remove from missing_hashes since we found it
-                        del missing_hashes[file_hash]
-                        existing_hashes.add(file_hash)
-                        rename_count += 1
-                        
-                except Exception as e:
-                    # File might not be readable
-                    print(f"  Error checking {photo_path.name}: {e}")
-                    continue
-            
-            # Any remaining items in missing_hashes are truly deleted
-            deleted_count = len(missing_hashes)
-            
-            if rename_count > 0:
-                print(f"  Updated {rename_count} renamed files")
-            
-            if deleted_count > 0:
-                print(f"  Found {deleted_count} deleted files")
-                
-                # Soft delete: mark with timestamp instead of removing
-                for file_hash, missing in missing_hashes.items():
-                    print(f"  Marking as deleted: {missing['filename']}")
-                    conn.execute('''
-                        UPDATE photos 
-                        SET deleted_at = CURRENT_TIMESTAMP
-                        WHERE file_hash = ? AND filepath = ?
-                    ''', (file_hash, missing['filepath']))
-                
-                print(f"  Marked {deleted_count} files as deleted")
-        
-        # Also check if any previously deleted files have been restored
+        # Previously deleted files, to check whether they have been restored
         deleted_photos = conn.execute('''
             SELECT filepath, file_hash, filename 
             FROM photos 
             WHERE deleted_at IS NOT NULL
         ''').fetchall()
+    
+    # Work out the changes first so hashing files doesn't hold the write lock
+    renames = []  # (new filepath, new filename, file_hash, old filepath)
+    missing_hashes = {}
+    missing_photos = []
+    existing_hashes = set()
+    
+    for row in all_db_photos:
+        if row['filepath'] in current_paths:
+            # File still exists at same path
+            existing_hashes.add(row['file_hash'])
+        else:
+            # File missing from original path
+            missing_photos.append(row)
+    
+    if missing_photos:
+        print(f"  Found {len(missing_photos)} missing files...")
+        known_db_paths = {row['filepath'] for row in all_db_photos}
         
-        restored_count = 0
-        for row in deleted_photos:
-            if row['filepath'] in current_paths:
-                print(f"  Restored: {row['filename']}")
+        # Build a set of hashes we need to find
+        missing_hashes = {m['file_hash']: m for m in missing_photos}
+        
+        # Check each current file to see if it matches a missing hash
+        for current_path, photo_path in current_paths.items():
+            # Skip if we already know this file is in the database
+            if current_path in known_db_paths:
+                continue
+            
+            try:
+                # Calculate hash for potential rename
+                file_hash = calculate_file_hash(photo_path)
+                
+                # Is this one of our missing files?
+                if file_hash in missing_hashes and file_hash not in existing_hashes:
+                    missing = missing_hashes.pop(file_hash)
+                    print(f"  Renamed: {missing['filename']} → {photo_path.name}")
+                    renames.append((str(photo_path), photo_path.name, file_hash, missing['filepath']))
+                    existing_hashes.add(file_hash)
+                    
+            except Exception as e:
+                # File might not be readable
+                print(f"  Error checking {photo_path.name}: {e}")
+                continue
+    
+    restored = [row for row in deleted_photos if row['filepath'] in current_paths]
+    
+    with database.get_db_write() as conn:
+        if renames:
+            # Update the database with new path
+            conn.executemany('''
+                UPDATE photos 
+                SET filepath = ?, filename = ?, updated_at = unix_ms()
+                WHERE file_hash = ? AND filepath = ?
+            ''', renames)
+            # Suggestions are keyed by filepath too; move them with the photo
+            conn.executemany(
+                "UPDATE OR REPLACE photo_suggestions SET filepath = ? WHERE filepath = ?",
+                [(new_path, old_path) for new_path, _, _, old_path in renames]
+            )
+            print(f"  Updated {len(renames)} renamed files")
+        
+        # Any remaining items in missing_hashes are truly deleted
+        if missing_hashes:
+            print(f"  Found {len(missing_hashes)} deleted files")
+            
+            # Soft delete: mark with timestamp instead of removing
+            for file_hash, missing in missing_hashes.items():
+                print(f"  Marking as deleted: {missing['filename']}")
                 conn.execute('''
                     UPDATE photos 
-                    SET deleted_at = NULL
-                    WHERE filepath = ?
-                ''', (row['filepath'],))
-                restored_count += 1
+                    SET deleted_at = CURRENT_TIMESTAMP, updated_at = unix_ms()
+                    WHERE file_hash = ? AND filepath = ?
+                ''', (file_hash, missing['filepath']))
+            
+            print(f"  Marked {len(missing_hashes)} files as deleted")
         
-        if restored_count > 0:
-            print(f"  Restored {restored_count} previously deleted files")
+        for row in restored:
+            print(f"  Restored: {row['filename']}")
+            conn.execute('''
+                UPDATE photos 
+                SET deleted_at = NULL, updated_at = unix_ms()
+                WHERE filepath = ?
+            ''', (row['filepath'],))
+        
+        if restored:
+            print(f"  Restored {len(restored)} previously deleted files")
+        
+        # Drop suggestions whose photo row is gone (e.g. renames from before
+        # suggestions moved with the photo); soft-deleted photos keep theirs
+        orphaned = conn.execute('''
+            DELETE FROM photo_suggestions
+            WHERE filepath NOT IN (SELECT filepath FROM photos)
+        ''').rowcount
+        if orphaned > 0:
+            print(f"  Removed {orphaned} orphaned suggestions")
     # ===== END RENAME/DELETE DETECTION =====
     
     # Helper function to process a single photo
@@ -6571,173 +7988,175 @@ def initialize_session(folder_path: str):
                 file_stats = photo.stat()
                 
                 # Check if already in database
-                with database.get_db() as conn:
+                with database.get_db_read() as conn:
                     existing = conn.execute(
                         'SELECT * FROM photos WHERE filepath = ?', 
                         (str(photo),)
                     ).fetchone()
+                
+                # Always read current metadata from file
+                date_info, location_info, tags, camera_info = read_metadata_from_file(photo)
+                
+                # Determine original sources
+                original_date_source = 'none'
+                if date_info and date_info.year != '1901':
+                    original_date_source = 'exif'
+                elif extract_date_from_filename(photo.name):
+                    original_date_source = 'filename'
+                
+                original_location_source = 'none'
+                if location_info and location_info.gps_lat is not None:
+                    original_location_source = 'gps'
+                elif location_info and location_info.state:
+                    original_location_source = 'iptc'
+                elif extract_location_from_filename(photo.name):
+                    original_location_source = 'filename'
+                
+                # Determine current sources - preserve user sources if values match
+                current_date_source = original_date_source
+                current_location_source = original_location_source
+                
+                if existing:
+                    # If user previously saved date and current file has same date, keep user source
+                    if (existing['current_date_source'] == 'user' and 
+                        date_info and
+                        str(existing['current_date_year']) == str(date_info.year) and
+                        str(existing['current_date_month']) == str(date_info.month) and
+                        str(existing['current_date_day']) == str(date_info.day)):
+                        current_date_source = 'user'
                     
-                    # Always read current metadata from file
-                    date_info, location_info, tags, camera_info = read_metadata_from_file(photo)
-                    
-                    # Determine original sources
-                    original_date_source = 'none'
-                    if date_info and date_info.year != '1901':
-                        original_date_source = 'exif'
-                    elif extract_date_from_filename(photo.name):
-                        original_date_source = 'filename'
-                    
-                    original_location_source = 'none'
-                    if location_info and location_info.gps_lat is not None:
-                        original_location_source = 'gps'
-                    elif location_info and location_info.state:
-                        original_location_source = 'iptc'
-                    elif extract_location_from_filename(photo.name):
-                        original_location_source = 'filename'
-                    
-                    # Determine current sources - preserve user sources if values match
-                    current_date_source = original_date_source
-                    current_location_source = original_location_source
-                    
-                    if existing:
-                        # If user previously saved date and current file has same date, keep user source
-                        if (existing['current_date_source'] == 'user' and 
-                            date_info and
-                            str(existing['current_date_year']) == str(date_info.year) and
-                            str(existing['current_date_month']) == str(date_info.month) and
-                            str(existing['current_date_day']) == str(date_info.day)):
-                            current_date_source = 'user'
-                        
-                        # If user previously saved location and current file has same location, keep user source
-                        if (existing['current_location_source'] == 'user' and 
-                            location_info and
-                            str(existing['current_state']) == str(location_info.state)):
-                            current_location_source = 'user'
+                    # If user previously saved location and current file has same location, keep user source
+                    if (existing['current_location_source'] == 'user' and 
+                        location_info and
+                        str(existing['current_state']) == str(location_info.state)):
+                        current_location_source = 'user'
 
+                
+                # Determine what needs work - must match tag logic
+                needs_date = True
+                if date_info:
+                    needs_date = date_info.needs_tag()
+                
+                needs_location = True  
+                if location_info:
+                    needs_location = location_info.needs_tag()
+                
+                # For consistency checks
+                has_good_date = not needs_date
+                has_good_gps = (location_info and location_info.gps_lat is not None)
+                has_good_location = not needs_location
+                
+                # Build the complete record
+                data = {
+                    'filepath': normalized_photo_path,
+                    'filename': photo.name,
+                    'sequence_number': extract_sequence_number(photo.name),
+                    'file_hash': file_hash,
+                    'file_last_modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
                     
-                    # Determine what needs work - must match tag logic
-                    needs_date = True
-                    if date_info:
-                        needs_date = date_info.needs_tag()
-                    
-                    needs_location = True  
-                    if location_info:
-                        needs_location = location_info.needs_tag()
-                    
-                    # For consistency checks
-                    has_good_date = not needs_date
-                    has_good_gps = (location_info and location_info.gps_lat is not None)
-                    has_good_location = not needs_location
-                    
-                    # Build the complete record
-                    data = {
-                        'filepath': normalized_photo_path,
-                        'filename': photo.name,
-                        'sequence_number': extract_sequence_number(photo.name),
-                        'file_hash': file_hash,
-                        'file_last_modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                        
-                        # Original state (from first scan)
-                        'original_date_year': date_info.year if date_info else None,
-                        'original_date_month': date_info.month if date_info else None,
-                        'original_date_day': date_info.day if date_info else None,
-                        'original_date_source': original_date_source,
-                        'original_gps_lat': location_info.gps_lat if location_info else None,
-                        'original_gps_lon': location_info.gps_lon if location_info else None,
-                        'original_city': location_info.city if location_info else None,
-                        'original_state': location_info.state if location_info else None,
-                        'original_location_source': original_location_source,
-                        'original_make': camera_info.get('original_make', ''),
-                        'original_model': camera_info.get('original_model', ''),
-                        'has_camera_metadata': camera_info.get('has_camera_metadata', False),
-                        
-                        # Current state (same as original on first scan)
-                        'current_date_year': date_info.year if date_info else None,
-                        'current_date_month': date_info.month if date_info else None,
-                        'current_date_day': date_info.day if date_info else None,
-                        'current_date_source': current_date_source,
-                        'current_gps_lat': location_info.gps_lat if location_info else None,
-                        'current_gps_lon': location_info.gps_lon if location_info else None,
-                        'current_city': location_info.city if location_info else None,
-                        'current_state': location_info.state if location_info else None,
-                        'current_location_source': current_location_source,
-                        
-                        # Status flags
-                        'needs_date': needs_date,
-                        'needs_location': needs_location,
-                        'has_good_date': has_good_date,
-                        'has_good_gps': has_good_gps,
-                        'has_good_location': has_good_location,
-                        'ready_for_review': 1,  # ALL photos need review initially
-                        'user_action': 'none'  # Default for new photos
-                    }
+                    # Original state (from first scan)
+                    'original_date_year': date_info.year if date_info else None,
+                    'original_date_month': date_info.month if date_info else None,
+                    'original_date_day': date_info.day if date_info else None,
+                    'original_date_source': original_date_source,
+                    'original_gps_lat': location_info.gps_lat if location_info else None,
+                    'original_gps_lon': location_info.gps_lon if location_info else None,
+                    'original_city': location_info.city if location_info else None,
+                    'original_state': location_info.state if location_info else None,
+                    'original_location_source': original_location_source,
+                    'original_make': camera_info.get('original_make', ''),
+                    'original_model': camera_info.get('original_model', ''),
+                    'has_camera_metadata': camera_info.get('has_camera_metadata', False),
                     
-                    # Check if this is an update to preserve user data
-                    if existing:
-                        # This is an update - preserve user action and source info
-                        existing_data = dict(existing)
-                        
-                        # Preserve user_action if it was set
-                        if existing_data.get('user_action') in ['saved', 'skipped']:
-                            data['user_action'] = existing_data['user_action']
-                            data['user_last_action_time'] = existing_data.get('user_last_action_time')                      
-                        
-                        # Preserve location_id if set
-                        if existing_data.get('location_id'):
-                            data['location_id'] = existing_data['location_id']
-
-                        # Keep the saved location state if the file scan can't reconstruct it.
-                        if existing_data.get('user_action') == 'saved' and not location_info:
-                            data['current_gps_lat'] = existing_data.get('current_gps_lat')
-                            data['current_gps_lon'] = existing_data.get('current_gps_lon')
-                            data['current_city'] = existing_data.get('current_city')
-                            data['current_state'] = existing_data.get('current_state')
-                            data['current_location_source'] = existing_data.get('current_location_source')
-                            data['needs_location'] = existing_data.get('needs_location')
-                            data['has_good_gps'] = existing_data.get('has_good_gps')
-                            data['has_good_location'] = existing_data.get('has_good_location')
+                    # Current state (same as original on first scan)
+                    'current_date_year': date_info.year if date_info else None,
+                    'current_date_month': date_info.month if date_info else None,
+                    'current_date_day': date_info.day if date_info else None,
+                    'current_date_source': current_date_source,
+                    'current_gps_lat': location_info.gps_lat if location_info else None,
+                    'current_gps_lon': location_info.gps_lon if location_info else None,
+                    'current_city': location_info.city if location_info else None,
+                    'current_state': location_info.state if location_info else None,
+                    'current_location_source': current_location_source,
                     
-                    # Insert or update
-                    columns = list(data.keys())
-                    placeholders = [f':{col}' for col in columns]
+                    # Status flags
+                    'needs_date': needs_date,
+                    'needs_location': needs_location,
+                    'has_good_date': has_good_date,
+                    'has_good_gps': has_good_gps,
+                    'has_good_location': has_good_location,
+                    'ready_for_review': 1,  # ALL photos need review initially
+                    'user_action': 'none'  # Default for new photos
+                }
+                
+                # Check if this is an update to preserve user data
+                if existing:
+                    # This is an update - preserve user action and source info
+                    existing_data = dict(existing)
                     
-                    sql = f'''
-                        INSERT INTO photos ({', '.join(columns)})
-                        VALUES ({', '.join(placeholders)})
-                        ON CONFLICT(filepath) DO UPDATE SET
-                            filename = excluded.filename,
-                            sequence_number = excluded.sequence_number,
-                            file_hash = excluded.file_hash,
-                            file_last_modified = excluded.file_last_modified,
-                            original_date_year = excluded.original_date_year,
-                            original_date_month = excluded.original_date_month,
-                            original_date_day = excluded.original_date_day,
-                            original_date_source = excluded.original_date_source,
-                            original_gps_lat = excluded.original_gps_lat,
-                            original_gps_lon = excluded.original_gps_lon,
-                            original_city = excluded.original_city,
-                            original_state = excluded.original_state,
-                            original_location_source = excluded.original_location_source,
-                            original_make = excluded.original_make,
-                            original_model = excluded.original_model,
-                            has_camera_metadata = excluded.has_camera_metadata,
-                            current_date_year = excluded.current_date_year,
-                            current_date_month = excluded.current_date_month,
-                            current_date_day = excluded.current_date_day,
-                            current_date_source = excluded.current_date_source,
-                            current_gps_lat = excluded.current_gps_lat,
-                            current_gps_lon = excluded.current_gps_lon,
-                            current_city = excluded.current_city,
-                            current_state = excluded.current_state,
-                            current_location_source = excluded.current_location_source,
-                            needs_date = excluded.needs_date,
-                            needs_location = excluded.needs_location,
-                            has_good_date = excluded.has_good_date,
-                            has_good_gps = excluded.has_good_gps,
-                            has_good_location = excluded.has_good_location,
-                            ready_for_review = excluded.ready_for_review
-                    '''
+                    # Preserve user_action if it was set
+                    if existing_data.get('user_action') in ['saved', 'skipped']:
+                        data['user_action'] = existing_data['user_action']
+                        data['user_last_action_time'] = existing_data.get('user_last_action_time')                      
                     
+                    # Preserve location_id if set
+                    if existing_data.get('location_id'):
+                        data['location_id'] = existing_data['location_id']
+
+                    # Keep the saved location state if the file scan can't reconstruct it.
+                    if existing_data.get('user_action') == 'saved' and not location_info:
+                        data['current_gps_lat'] = existing_data.get('current_gps_lat')
+                        data['current_gps_lon'] = existing_data.get('current_gps_lon')
+                        data['current_city'] = existing_data.get('current_city')
+                        data['current_state'] = existing_data.get('current_state')
+                        data['current_location_source'] = existing_data.get('current_location_source')
+                        data['needs_location'] = existing_data.get('needs_location')
+                        data['has_good_gps'] = existing_data.get('has_good_gps')
+                        data['has_good_location'] = existing_data.get('has_good_location')
+                
+                # Insert or update
+                columns = list(data.keys())
+                placeholders = [f':{col}' for col in columns]
+                
+                sql = f'''
+                    INSERT INTO photos ({', '.join(columns)}, updated_at)
+                    VALUES ({', '.join(placeholders)}, unix_ms())
+                    ON CONFLICT(filepath) DO UPDATE SET
+                        updated_at = unix_ms(),
+                        filename = excluded.filename,
+                        sequence_number = excluded.sequence_number,
+                        file_hash = excluded.file_hash,
+                        file_last_modified = excluded.file_last_modified,
+                        original_date_year = excluded.original_date_year,
+                        original_date_month = excluded.original_date_month,
+                        original_date_day = excluded.original_date_day,
+                        original_date_source = excluded.original_date_source,
+                        original_gps_lat = excluded.original_gps_lat,
+                        original_gps_lon = excluded.original_gps_lon,
+                        original_city = excluded.original_city,
+                        original_state = excluded.original_state,
+                        original_location_source = excluded.original_location_source,
+                        original_make = excluded.original_make,
+                        original_model = excluded.original_model,
+                        has_camera_metadata = excluded.has_camera_metadata,
+                        current_date_year = excluded.current_date_year,
+                        current_date_month = excluded.current_date_month,
+                        current_date_day = excluded.current_date_day,
+                        current_date_source = excluded.current_date_source,
+                        current_gps_lat = excluded.current_gps_lat,
+                        current_gps_lon = excluded.current_gps_lon,
+                        current_city = excluded.current_city,
+                        current_state = excluded.current_state,
+                        current_location_source = excluded.current_location_source,
+                        needs_date = excluded.needs_date,
+                        needs_location = excluded.needs_location,
+                        has_good_date = excluded.has_good_date,
+                        has_good_gps = excluded.has_good_gps,
+                        has_good_location = excluded.has_good_location,
+                        ready_for_review = excluded.ready_for_review
+                '''
+                
+                with database.get_db_write() as conn:
                     conn.execute(sql, data)
                     
                     # Log the scan
@@ -6745,8 +8164,8 @@ def initialize_session(folder_path: str):
                         INSERT INTO file_scans (filepath, file_exists, file_hash)
                         VALUES (?, 1, ?)
                     ''', (str(photo), file_hash))
-                    
-                    return photo.name  # Return name for progress tracking
+                
+                return photo.name  # Return name for progress tracking
                     
             except Exception as e:
                 print(f"Error processing {photo.name}: {e}")
@@ -6761,7 +8180,12 @@ def initialize_session(folder_path: str):
     
     print(f"Processing photos using {num_workers} threads...")
     
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+    # A large first scan inserts faster with the secondary indexes built once afterwards
+    known_paths = {row['filepath'] for row in all_db_photos}
+    new_count = sum(1 for path in current_paths if path not in known_paths)
+    bulk = database.bulk_load() if new_count >= BULK_LOAD_THRESHOLD else nullcontext()
+    
+    with bulk, ThreadPoolExecutor(max_workers=num_workers) as executor:
         # Submit all photos for processing
         future_to_photo = {
             executor.submit(process_single_photo, photo): photo 
@@ -6791,16 +8215,7 @@ def initialize_session(folder_path: str):
     
     # Pre-generate grid thumbnails for better performance
     print("\nGenerating thumbnails for grid view...")
-    
-    # Check which thumbnails already exist in database
-    existing_thumbnails = set()
-    if STATE.database:
-        with STATE.database.get_db() as conn:
-            rows = conn.execute('''
-                SELECT filepath, file_mtime, size FROM thumbnails
-            ''').fetchall()
-            for row in rows:
-                existing_thumbnails.add((row[0], row[1], row[2]))
+    trim_thumbnail_disk_cache()
     
     # Use configured number of workers for thumbnail generation
     num_workers = THUMBNAIL_WORKERS
@@ -6811,12 +8226,12 @@ def initialize_session(folder_path: str):
     thumbnail_tasks = []
     for photo in STATE.photos_list:
         try:
-            mtime = photo.stat().st_mtime
+            st = photo.stat()
             # Only add tasks for thumbnails that don't exist
-            if (str(photo), mtime, "120x120") not in existing_thumbnails:
-                thumbnail_tasks.append((photo, (120, 120)))   # Grid size
-            if (str(photo), mtime, "800x800") not in existing_thumbnails:
-                thumbnail_tasks.append((photo, (800, 800)))   # Full size
+            for size in ((120, 120), (800, 800)):   # Grid size, full size
+                if _thumb_cache_path(photo, st.st_mtime_ns, size).exists():
+                    continue
+                thumbnail_tasks.append((photo, size))
         except:
             # If we can't stat the file, skip it
             pass
@@ -6853,10 +8268,9 @@ def initialize_session(folder_path: str):
     print(f"\nGenerated {completed - failed} thumbnails successfully ({failed} failed)")
     
     # Initialize LLM parser (model only, no pre-parsing)
-    if USE_LLM_PARSER and _LLM_AVAILABLE:
+    if filename_parser is not None:
         try:
             print("\nInitializing LLM filename parser...")
-            filename_parser = FilenameParser(cache_dir=DATA_DIR / ".llm_cache")
             filename_parser.load_model()
             STATE.filename_parser = filename_parser
             print("LLM parser ready (parse-on-demand mode)")
@@ -6883,8 +8297,8 @@ def initialize_session(folder_path: str):
     
     STATE.gazetteer = Gazetteer(gazetteer_path)
     
-    # Check MKLocalSearch availability
-    if _mk_local_search_available:
+    # Check MKLocalSearch availability (loads it on the main thread)
+    if _load_mapkit():
         print("\nApple geocoding available via MKLocalSearch")
         print("  - Address geocoding")
         print("  - POI search")
@@ -6900,14 +8314,36 @@ def initialize_session(folder_path: str):
 # MAIN FUNCTION
 # ============================================================================
 
+def _check_clock_cache_scan_resistance() -> bool:
+    """A burst of written-but-never-read keys must not flush the warm set"""
+    cache = ClockCache(100)
+    warm = [f"warm{i}" for i in range(50)]
+    for key in warm:
+        cache[key] = 'ready'
+        cache.get(key)
+    # Age the warm keys out of hot so they are promoted on their next pass
+    for i in range(20):
+        cache[f"filler{i}"] = 'ready'
+    for key in warm:
+        cache.get(key)
+    # Scroll burst: each entry is written pending -> processing -> ready
+    for i in range(1000):
+        for status in ('pending', 'processing', 'ready'):
+            cache[f"scroll{i}"] = status
+    return all(key in cache for key in warm)
+
 def main():
     # Optional quick test mode
     if '--test' in sys.argv:
+        if _check_clock_cache_scan_resistance():
+            print("Parse cache scan resistance: OK")
+        else:
+            print("Parse cache scan resistance: FAILED")
         print("Testing Apple geocoding...")
         try:
             # Test with a simple query first
             print("Testing MKLocalSearch availability...")
-            if _mk_local_search_available:
+            if _load_mapkit():
                 print("MKLocalSearch is available")
             else:
                 print("MKLocalSearch is NOT available")
@@ -6942,6 +8378,10 @@ def main():
         print(f"Error: {folder_path} is not a directory")
         sys.exit(1)
 
+    # The default SIGTERM action kills the process without running atexit
+    # handlers; exit normally instead so _shutdown and the worker finalizers run
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
     # Ensure ExifTool is present
     if not setup_exiftool():
         print("Error: Failed to set up ExifTool")
@@ -6970,7 +8410,16 @@ def main():
         """
         from waitress import serve
         try:
-            serve(app, host='127.0.0.1', port=WEB_PORT, threads=8)
+            # Handlers block on PIL/ExifTool/SQLite rather than burn CPU in
+            # Python, so run more threads than cores.
+            serve(
+                app,
+                host='127.0.0.1',
+                port=WEB_PORT,
+                threads=max(8, (os.cpu_count() or 4) * 2),
+                connection_limit=200,
+                channel_timeout=120,
+            )
         except Exception as e:
             logger.error(f"Waitress failed to start: {e}")
             os._exit(1)           # Propagate the failure to the parent process
@@ -7001,7 +8450,6 @@ def main():
         print("\nShutting down...")
         # Gracefully stop background workers
         stop_llm_worker()
-        STATE.shutdown_db_worker()
 
         # Wait briefly for the HTTP server thread to finish
         if flask_thread.is_alive():